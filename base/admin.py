@@ -1,3 +1,66 @@
 from django.contrib import admin
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import path, reverse
+from django.utils.html import format_html
+
+from base import profilage
+from base.models import FichierMedia, ProfilRequete
 
 # Register your models here.
+
+
+class FichierMediaAdmin(admin.ModelAdmin):
+    list_display = ('nom', 'taille', 'references', 'date_add')
+    search_fields = ('nom', 'empreinte')
+    readonly_fields = ('nom', 'empreinte', 'taille', 'references', 'date_add')
+
+
+admin.site.register(FichierMedia, FichierMediaAdmin)
+
+
+class ProfilRequeteAdmin(admin.ModelAdmin):
+    list_display = ('vue', 'methode', 'statut', 'duree_ms', 'echantillons', 'declencheur', 'date_add', 'liens')
+    list_filter = ('declencheur', 'vue')
+    search_fields = ('vue', 'chemin')
+    readonly_fields = [f.name for f in ProfilRequete._meta.fields] + ['liens']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    @admin.display(description='Piles')
+    def liens(self, obj):
+        return format_html(
+            '<a href="{}">flamegraph</a> · <a href="{}">collapsed</a>',
+            reverse('admin:base_profilrequete_flamegraph', args=[obj.pk]),
+            reverse('admin:base_profilrequete_piles', args=[obj.pk]),
+        )
+
+    def get_urls(self):
+        return [
+            path('<int:pk>/flamegraph.svg', self.admin_site.admin_view(self.flamegraph),
+                 name='base_profilrequete_flamegraph'),
+            path('<int:pk>/piles.txt', self.admin_site.admin_view(self.piles), name='base_profilrequete_piles'),
+        ] + super().get_urls()
+
+    def flamegraph(self, request, pk):
+        profil = get_object_or_404(ProfilRequete, pk=pk)
+        return HttpResponse(profilage.flamegraph(profilage.piles(profil)), content_type='image/svg+xml')
+
+    def piles(self, request, pk):
+        profil = get_object_or_404(ProfilRequete, pk=pk)
+        texte = ''.join('%s %d\n' % ligne for ligne in profilage.piles(profil).items())
+        response = HttpResponse(texte, content_type='text/plain; charset=utf-8')
+        response['Content-Disposition'] = 'attachment; filename="profil-%d.txt"' % profil.pk
+        return response
+
+    def changelist_view(self, request, extra_context=None):
+        extra_context = dict(extra_context or {}, entete=profilage.ENTETE, jeton=profilage.jeton(request.user),
+                             validite=profilage.VALIDITE // 3600)
+        return super().changelist_view(request, extra_context)
+
+
+admin.site.register(ProfilRequete, ProfilRequeteAdmin)
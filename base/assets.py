@@ -0,0 +1,204 @@
+import hashlib
+import os
+import posixpath
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.finders import BaseFinder
+from django.core.files.storage import FileSystemStorage
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+try:
+    import rcssmin
+    import rjsmin
+except ImportError:  # les lots sont alors seulement concaténés
+    rcssmin = rjsmin = None
+
+
+# Lots de fichiers statiques du site public. Chaque lot est construit à partir
+# des fichiers de static/ (concaténés puis minifiés), trouvé par collectstatic
+# comme n'importe quel fichier, puis nommé par empreinte et précompressé
+# (gzip, et Brotli si le module brotli est installé) par StockageStatique.
+LOTS = {
+    'lots/site.css': [
+        'css/bootstrap.min.css',
+        'css/core.css',
+        'style.css',
+        'css/responsive.css',
+        'css/style-customizer.css',
+    ],
+    'lots/site.js': [
+        'js/bootstrap.min.js',
+        'js/jquery.nivo.slider.pack.js',
+        'js/owl.carousel.min.js',
+        'js/ajax-mail.js',
+        'js/jquery.magnific-popup.js',
+        'js/jquery.counterup.min.js',
+        'js/waypoints.min.js',
+        'js/style-customizer.js',
+        'js/plugins.js',
+        'js/main.js',
+    ],
+    'lots/vue.js': [
+        'js/axios.js',
+        'js/vue.js',
+    ],
+}
+
+DOSSIER = getattr(settings, 'LOTS_STATIQUES_DIR', settings.BASE_DIR / 'cache' / 'lots')
+
+_IMPORT = re.compile(r'@import\s+(?:url\()?\s*["\']?([^"\')\s]+)["\']?\s*\)?\s*;')
+_URL = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)')
+_CHARSET = re.compile(r'@charset\s*["\'][^"\']*["\']\s*;')
+_SOURCEMAP = re.compile(r'^\s*//[#@] sourceMappingURL=.*$', re.M)
+
+
+def _externe(url):
+    return url.startswith(('data:', '#', '/')) or '//' in url
+
+
+def _source(nom):
+    chemin = finders.find(nom)
+    if not chemin:
+        raise FileNotFoundError(nom)
+    return chemin
+
+
+def _css(nom, lot, externes, vus):
+    """Contenu CSS de `nom`, @import intégrés et url() réécrites par rapport au dossier du lot."""
+    if nom in vus:
+        return ''
+    vus.add(nom)
+    with open(_source(nom), encoding='utf-8', errors='replace') as f:
+        contenu = _CHARSET.sub('', f.read())
+    dossier = posixpath.dirname(nom)
+
+    def reecrire(match):
+        url = match.group(2).strip()
+        if _externe(url):
+            return match.group(0)
+        cible = posixpath.normpath(posixpath.join(dossier, url))
+        return 'url("%s")' % posixpath.relpath(cible, posixpath.dirname(lot))
+
+    morceaux, debut = [], 0
+    for match in _IMPORT.finditer(contenu):
+        morceaux.append(_URL.sub(reecrire, contenu[debut:match.start()]))
+        cible = match.group(1)
+        if _externe(cible):
+            # Un @import ne vaut qu'en tête de feuille : les externes sont remontés en tête du lot
+            externes.append(match.group(0))
+        else:
+            morceaux.append(_css(posixpath.normpath(posixpath.join(dossier, cible)), lot, externes, vus))
+        debut = match.end()
+    morceaux.append(_URL.sub(reecrire, contenu[debut:]))
+    return ''.join(morceaux)
+
+
+def construire(lot):
+    """Contenu du lot `lot` (bytes)."""
+    if lot.endswith('.css'):
+        externes, vus = [], set()
+        corps = '\n'.join(_css(nom, lot, externes, vus) for nom in LOTS[lot])
+        contenu = '\n'.join(externes + [corps])
+        if rcssmin:
+            contenu = rcssmin.cssmin(contenu)
+    else:
+        morceaux = []
+        for nom in LOTS[lot]:
+            source = _source(nom)
+            with open(source, encoding='utf-8', errors='replace') as f:
+                code = f.read()
+            if rjsmin and not source.endswith('.min.js'):
+                code = rjsmin.jsmin(code, keep_bang_comments=True)
+            # Les source maps ne correspondent plus une fois les fichiers concaténés
+            code = _SOURCEMAP.sub('', code)
+            # Le point-virgule protège des fichiers qui ne terminent pas leur dernière instruction
+            morceaux.append(code.rstrip() + '\n;')
+        contenu = '\n'.join(morceaux)
+    return contenu.encode('utf-8')
+
+
+_CONSTRUCTEUR = None
+
+
+def _constructeur():
+    # Le code de ce module et les minifieurs disponibles font partie de la signature
+    # des lots : modifier le constructeur reconstruit les lots déjà en cache.
+    global _CONSTRUCTEUR
+    if _CONSTRUCTEUR is None:
+        with open(__file__, 'rb') as f:
+            _CONSTRUCTEUR = hashlib.sha256(f.read()).hexdigest() + ('|min' if rcssmin else '')
+    return _CONSTRUCTEUR
+
+
+def signature(lot):
+    """Empreinte de ce qui produit le lot : constructeur, liste des fichiers, chemin, taille et date de chacun."""
+    morceaux = [_constructeur()]
+    for nom in LOTS[lot]:
+        source = _source(nom)
+        etat = os.stat(source)
+        morceaux.append('%s|%s|%d|%d' % (nom, source, etat.st_size, etat.st_mtime_ns))
+    return hashlib.sha256('\n'.join(morceaux).encode('utf-8')).hexdigest()
+
+
+def chemin_lot(lot):
+    """Chemin du lot sur disque, reconstruit si sa signature a changé depuis."""
+    chemin = os.path.join(DOSSIER, lot)
+    attendue = signature(lot)
+    try:
+        with open(chemin + '.signature', encoding='ascii') as f:
+            a_jour = f.read() == attendue and os.path.exists(chemin)
+    except OSError:
+        a_jour = False
+    if not a_jour:
+        os.makedirs(os.path.dirname(chemin), exist_ok=True)
+        temporaire = chemin + '.tmp%d' % os.getpid()
+        with open(temporaire, 'wb') as f:
+            f.write(construire(lot))
+        os.replace(temporaire, chemin)
+        with open(temporaire, 'w', encoding='ascii') as f:
+            f.write(attendue)
+        os.replace(temporaire, chemin + '.signature')
+    return chemin
+
+
+class LotsFinder(BaseFinder):
+    """Expose les lots à collectstatic et, en développement, au serveur de fichiers statiques."""
+
+    def check(self, **kwargs):
+        return []
+
+    def find(self, path, all=False):
+        if path not in LOTS:
+            return []
+        chemin = chemin_lot(path)
+        return [chemin] if all else chemin
+
+    def list(self, ignore_patterns):
+        storage = FileSystemStorage(location=DOSSIER)
+        for lot in LOTS:
+            chemin_lot(lot)
+            yield lot, storage
+
+
+class StockageStatique(CompressedManifestStaticFilesStorage):
+    """Noms par empreinte, manifeste, variantes gzip/Brotli ; WhiteNoise sert alors
+    les fichiers nommés par empreinte avec « Cache-Control: immutable ».
+
+    Hors DEBUG, un fichier absent du manifeste (staticfiles/ pas régénéré par
+    collectstatic) lève une erreur plutôt que de produire une URL introuvable.
+    Seules les url() et source maps introuvables des CSS/JS tiers gardent leur
+    nom d'origine au post-traitement.
+    """
+
+    def url_converter(self, name, hashed_files, template=None):
+        convertir = super().url_converter(name, hashed_files, template)
+
+        def converter(matchobj):
+            try:
+                return convertir(matchobj)
+            except ValueError:
+                return matchobj.group(0)
+
+        return converter
@@ -0,0 +1,50 @@
+from django.contrib.auth import BACKEND_SESSION_KEY, get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.middleware import AuthenticationMiddleware, get_user
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import Http404
+from django.utils.functional import SimpleLazyObject
+
+
+# Identité de la requête : l'utilisateur est chargé avec son profil client et
+# son établissement en une seule requête jointe. `request.user.customer` et
+# `request.user.etablissement` sont ensuite lus sans requête dans les vues, les
+# context processors et les templates (y compris quand le profil n'existe pas).
+IDENTITE = ('customer', 'etablissement')
+
+BACKEND = 'base.auth.IdentiteBackend'
+ANCIEN_BACKEND = 'django.contrib.auth.backends.ModelBackend'
+
+
+class IdentiteBackend(ModelBackend):
+
+    def get_user(self, user_id):
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.select_related(*IDENTITE).get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
+
+
+class IdentiteMiddleware(AuthenticationMiddleware):
+    """AuthenticationMiddleware qui reprend les sessions ouvertes avant IdentiteBackend."""
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_user(_reprendre_session(request)))
+
+
+def _reprendre_session(request):
+    # La session n'est lue qu'au premier accès à request.user, comme avant
+    if request.session.get(BACKEND_SESSION_KEY) == ANCIEN_BACKEND:
+        request.session[BACKEND_SESSION_KEY] = BACKEND
+    return request
+
+
+def etablissement_ou_404(request):
+    """Établissement de l'utilisateur connecté, lu dans l'identité déjà chargée."""
+    try:
+        return request.user.etablissement
+    except (AttributeError, ObjectDoesNotExist):
+        raise Http404("Aucun établissement pour cet utilisateur")
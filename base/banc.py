@@ -0,0 +1,478 @@
+import datetime
+import http.client
+import io
+import json
+import os
+import platform
+import resource
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import django
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.sessions.backends.db import SessionStore
+from django.db import DatabaseError, close_old_connections, connection
+from django.middleware.csrf import CSRF_ALLOWED_CHARS, CSRF_SECRET_LENGTH
+from django.urls import reverse
+from django.utils.crypto import get_random_string
+
+from customer.models import CodePromotionnel, Commande, Customer, Panier, ProduitPanier
+from shop.models import Etablissement, Produit
+from . import auth, requetes
+
+
+# Banc d'essai HTTP : des utilisateurs virtuels (un thread chacun, avec sa
+# session de client connecté) enchaînent les parcours de la boutique pendant
+# une durée fixe, contre l'application WSGI appelée dans le processus ou
+# contre un serveur HTTP (gunicorn lancé ici, ou une URL existante). Chaque
+# requête est chronométrée par point d'accès (nom d'URL) ; le rapport JSON
+# donne requêtes/s, percentiles de latence, requêtes SQL par requête et RSS
+# maximal, pour comparer deux commits.
+#
+# Les parcours panier et paiement écrivent dans la base (paniers, commandes,
+# réservations) : à lancer sur un jeu de données jetable (generer_donnees).
+PERCENTILES = (50, 90, 95, 99)
+PRODUITS = 200
+COUPON = 'BANC'
+
+PARCOURS = ('index', 'catalogue', 'produit', 'panier', 'paiement', 'dashboard', 'recu')
+
+
+class DonneesManquantes(Exception):
+    """La base ne contient pas de quoi jouer les parcours demandés."""
+
+
+class Utilisateur:
+    """Utilisateur virtuel : un client connecté, ses cookies et ses données de parcours."""
+
+    def __init__(self, numero, customer, produits, commande, marchand_cookies):
+        self.numero = numero
+        self.customer = customer
+        self.produits = produits
+        self.commande = commande
+        self.cookies = _cookies(customer.user)
+        self.marchand_cookies = marchand_cookies
+        self.tour = 0
+
+    def produit(self):
+        self.tour += 1
+        return self.produits[(self.numero * 7 + self.tour) % len(self.produits)]
+
+
+def _cookies(user):
+    session = SessionStore()
+    session[SESSION_KEY] = str(user.pk)
+    session[BACKEND_SESSION_KEY] = auth.BACKEND
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.create()
+    jeton = get_random_string(CSRF_SECRET_LENGTH, allowed_chars=CSRF_ALLOWED_CHARS)
+    return {
+        'Cookie': '%s=%s; %s=%s' % (settings.SESSION_COOKIE_NAME, session.session_key,
+                                    settings.CSRF_COOKIE_NAME, jeton),
+        'X-CSRFToken': jeton,
+    }
+
+
+def preparer(concurrence):
+    """Un utilisateur virtuel par thread, choisi parmi les clients qui ont déjà commandé."""
+    customers = list(Customer.objects.select_related('user').filter(
+        user__is_active=True, user_commande__isnull=False).distinct().order_by('id')[:concurrence])
+    produits = list(Produit.objects.filter(status=True, quantite__gte=100).order_by('id').values_list(
+        'id', 'slug')[:PRODUITS])
+    etablissement = Etablissement.objects.select_related('user').order_by('id').first()
+    if len(customers) < concurrence or not produits or etablissement is None:
+        raise DonneesManquantes(
+            "Il faut %d clients ayant commandé, des produits en stock et un établissement "
+            "(voir la commande generer_donnees)" % concurrence)
+
+    CodePromotionnel.objects.get_or_create(code_promo=COUPON, defaults={
+        'libelle': "Banc d'essai", 'etat': True, 'reduction': 0.05,
+        'date_fin': datetime.date.today() + datetime.timedelta(days=365),
+    })
+    marchand = _cookies(etablissement.user)
+    return [
+        Utilisateur(n, customer, produits, Commande.objects.filter(customer=customer).order_by('id').first(), marchand)
+        for n, customer in enumerate(customers)
+    ]
+
+
+# Parcours : générateurs de requêtes (point d'accès, méthode, chemin, corps,
+# en-têtes). La préparation entre deux requêtes (paniers) n'est pas chronométrée.
+def _json(**donnees):
+    return json.dumps(donnees).encode('utf-8')
+
+
+def _index(vu):
+    yield 'index', 'GET', reverse('index'), None, vu.cookies
+
+
+def _catalogue(vu):
+    yield 'shop', 'GET', reverse('shop'), None, vu.cookies
+
+
+def _produit(vu):
+    yield 'product_detail', 'GET', reverse('product_detail', args=[vu.produit()[1]]), None, vu.cookies
+
+
+def _panier(vu):
+    panier = Panier.objects.create(customer=vu.customer)
+    produit = vu.produit()[0]
+    yield 'add_to_cart', 'POST', reverse('add_to_cart'), _json(
+        panier=panier.id, produit=produit, quantite=1), vu.cookies
+    yield 'update_cart', 'POST', reverse('update_cart'), _json(
+        panier=panier.id, produit=produit, quantite=2), vu.cookies
+    yield 'add_coupon', 'POST', reverse('add_coupon'), _json(panier=panier.id, coupon=COUPON), vu.cookies
+    ligne = ProduitPanier.objects.filter(panier=panier).values_list('id', flat=True).first()
+    yield 'delete_from_cart', 'POST', reverse('delete_from_cart'), _json(
+        panier=panier.id, produit_panier=ligne), vu.cookies
+    panier.delete()
+
+
+def _paiement(vu):
+    panier = Panier.objects.create(customer=vu.customer)
+    ProduitPanier.objects.create(panier=panier, produit_id=vu.produit()[0], quantite=1)
+    yield 'paiement_detail', 'POST', reverse('paiement_detail'), _json(
+        panier=panier.id, transaction_id='banc-%d-%d' % (vu.numero, vu.tour),
+        notify_url='http://localhost/notify', return_url='http://localhost/retour'), vu.cookies
+
+
+def _dashboard(vu):
+    yield 'dashboard', 'GET', reverse('dashboard'), None, vu.marchand_cookies
+
+
+def _recu(vu):
+    if vu.commande is not None:
+        yield 'invoice_pdf', 'GET', reverse('invoice_pdf', args=[vu.commande.id]), None, vu.cookies
+
+
+_PARCOURS = {
+    'index': _index, 'catalogue': _catalogue, 'produit': _produit, 'panier': _panier,
+    'paiement': _paiement, 'dashboard': _dashboard, 'recu': _recu,
+}
+
+
+class _Compteur:
+    """execute_wrapper qui compte les instructions SQL de la requête."""
+
+    def __init__(self):
+        self.nombre = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.nombre += 1
+        return execute(sql, params, many, context)
+
+
+class CibleWSGI:
+    """L'application WSGI de Django, appelée dans le processus (un thread par utilisateur virtuel)."""
+
+    nom = 'wsgi'
+
+    def __init__(self):
+        from django.core.wsgi import get_wsgi_application
+        self.application = get_wsgi_application()
+        self.local = threading.local()
+
+    def demarrer(self):
+        pass
+
+    def arreter(self):
+        pass
+
+    def envoyer(self, methode, chemin, corps, entetes):
+        chemin, _, query = chemin.partition('?')
+        environ = {
+            'REQUEST_METHOD': methode, 'PATH_INFO': chemin, 'QUERY_STRING': query, 'SCRIPT_NAME': '',
+            'SERVER_NAME': '127.0.0.1', 'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1',
+            'REMOTE_ADDR': '127.0.0.1', 'HTTP_HOST': '127.0.0.1',
+            'wsgi.input': io.BytesIO(corps or b''), 'wsgi.errors': sys.stderr, 'wsgi.url_scheme': 'http',
+            'wsgi.version': (1, 0), 'wsgi.multithread': True, 'wsgi.multiprocess': False, 'wsgi.run_once': False,
+        }
+        if corps is not None:
+            environ['CONTENT_TYPE'] = 'application/json'
+            environ['CONTENT_LENGTH'] = str(len(corps))
+        for nom, valeur in entetes.items():
+            environ['HTTP_' + nom.upper().replace('-', '_')] = valeur
+
+        statut = []
+        mesure = _Compteur()
+        with connection.execute_wrapper(mesure):
+            reponse = self.application(environ, lambda s, h, exc_info=None: statut.append(s))
+            try:
+                for _ in reponse:
+                    pass
+            finally:
+                if hasattr(reponse, 'close'):
+                    reponse.close()
+        return int(statut[0].split()[0]), mesure.nombre
+
+    def rss_max(self):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class CibleHTTP:
+    """Un serveur HTTP déjà démarré. Les requêtes SQL sont lues dans le journal de base.requetes."""
+
+    nom = 'url'
+
+    def __init__(self, url):
+        hote, _, port = url.split('://', 1)[-1].rstrip('/').partition(':')
+        self.hote, self.port = hote, int(port or 80)
+        self.local = threading.local()
+
+    def demarrer(self):
+        pass
+
+    def arreter(self):
+        pass
+
+    def envoyer(self, methode, chemin, corps, entetes):
+        connexion = getattr(self.local, 'connexion', None)
+        if connexion is None:
+            connexion = self.local.connexion = http.client.HTTPConnection(self.hote, self.port, timeout=60)
+        entetes = dict(entetes, Host='127.0.0.1')
+        if corps is not None:
+            entetes['Content-Type'] = 'application/json'
+        try:
+            connexion.request(methode, chemin, body=corps, headers=entetes)
+            reponse = connexion.getresponse()
+            reponse.read()
+        except (http.client.HTTPException, OSError):
+            connexion.close()
+            raise
+        if reponse.will_close:
+            connexion.close()
+        return reponse.status, None
+
+    def rss_max(self):
+        return None
+
+
+class CibleGunicorn(CibleHTTP):
+    """gunicorn lancé sur un port libre pour la durée du banc ; RSS relevé sur le maître et les workers."""
+
+    nom = 'gunicorn'
+
+    def __init__(self, workers=2, threads=1):
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            port = s.getsockname()[1]
+        super().__init__('http://127.0.0.1:%d' % port)
+        self.commande = [sys.executable, '-m', 'gunicorn', 'cooldeal.wsgi', '--bind', '127.0.0.1:%d' % port,
+                         '--workers', str(workers), '--threads', str(threads)]
+        self.processus = None
+        self.rss = 0
+        self._arret = threading.Event()
+
+    def demarrer(self):
+        self.processus = subprocess.Popen(self.commande, cwd=settings.BASE_DIR, stdout=subprocess.DEVNULL)
+        limite = time.monotonic() + 30
+        while time.monotonic() < limite:
+            if self.processus.poll() is not None:
+                raise RuntimeError("gunicorn s'est arrêté au démarrage (code %s)" % self.processus.returncode)
+            try:
+                socket.create_connection((self.hote, self.port), timeout=1).close()
+                break
+            except OSError:
+                time.sleep(0.2)
+        else:
+            self.arreter()
+            raise RuntimeError("gunicorn ne répond pas sur le port %d" % self.port)
+        threading.Thread(target=self._relever_rss, daemon=True).start()
+
+    def arreter(self):
+        self._arret.set()
+        if self.processus is not None and self.processus.poll() is None:
+            self.processus.terminate()
+            self.processus.wait(30)
+
+    def _relever_rss(self):
+        # Somme des RSS du maître et de ses workers, relevée toutes les 200 ms
+        while not self._arret.wait(0.2):
+            pids = [self.processus.pid] + _enfants(self.processus.pid)
+            self.rss = max(self.rss, sum(_rss(pid) for pid in pids))
+
+    def rss_max(self):
+        return self.rss
+
+
+def _enfants(pid):
+    try:
+        with open('/proc/%d/task/%d/children' % (pid, pid)) as f:
+            return [int(p) for p in f.read().split()]
+    except OSError:
+        return []
+
+
+def _rss(pid):
+    try:
+        with open('/proc/%d/status' % pid) as f:
+            for ligne in f:
+                if ligne.startswith('VmRSS:'):
+                    return int(ligne.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def _requetes_journal(position):
+    """Requêtes SQL par point d'accès écrites dans le journal depuis `position` (octets)."""
+    par_vue = {}
+    try:
+        with open(requetes.fichier_journal(), encoding='utf-8') as f:
+            f.seek(position)
+            for ligne in f:
+                try:
+                    mesure = json.loads(ligne)
+                except ValueError:
+                    continue
+                par_vue.setdefault(mesure['vue'], []).append(mesure['requetes'])
+    except OSError:
+        pass
+    return par_vue
+
+
+def _taille_journal():
+    try:
+        return os.path.getsize(requetes.fichier_journal())
+    except OSError:
+        return 0
+
+
+def percentile(valeurs_triees, p):
+    if not valeurs_triees:
+        return None
+    return valeurs_triees[min(len(valeurs_triees) - 1, int(len(valeurs_triees) * p / 100))]
+
+
+def _requetes_du_parcours(parcours, vu, echecs):
+    # La préparation d'un tour (paniers) peut échouer sous charge (base verrouillée...) :
+    # le tour s'arrête et l'échec est compté à part
+    tour = _PARCOURS[parcours](vu)
+    while True:
+        try:
+            requete = next(tour, None)
+        except DatabaseError:
+            echecs[0] += 1
+            return
+        if requete is None:
+            return
+        yield requete
+
+
+def _jouer(cible, parcours, utilisateurs, duree):
+    mesures, echecs, verrou = {}, [0], threading.Lock()
+
+    def boucle(vu):
+        locales, echecs_locaux = {}, [0]
+        fin = time.monotonic() + duree
+        try:
+            while time.monotonic() < fin:
+                for point, methode, chemin, corps, entetes in _requetes_du_parcours(parcours, vu, echecs_locaux):
+                    debut = time.perf_counter()
+                    try:
+                        statut, sql = cible.envoyer(methode, chemin, corps, entetes)
+                    except (http.client.HTTPException, OSError):
+                        statut, sql = 0, None
+                    ms = (time.perf_counter() - debut) * 1000
+                    mesure = locales.setdefault(point, {'durees': [], 'statuts': {}, 'sql': []})
+                    mesure['durees'].append(ms)
+                    mesure['statuts'][statut] = mesure['statuts'].get(statut, 0) + 1
+                    if sql is not None:
+                        mesure['sql'].append(sql)
+        finally:
+            close_old_connections()
+            with verrou:
+                echecs[0] += echecs_locaux[0]
+                for point, mesure in locales.items():
+                    total = mesures.setdefault(point, {'durees': [], 'statuts': {}, 'sql': []})
+                    total['durees'] += mesure['durees']
+                    total['sql'] += mesure['sql']
+                    for statut, n in mesure['statuts'].items():
+                        total['statuts'][statut] = total['statuts'].get(statut, 0) + n
+
+    threads = [threading.Thread(target=boucle, args=(vu,)) for vu in utilisateurs]
+    debut = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return mesures, echecs[0], time.monotonic() - debut
+
+
+def _resume(mesure, ecoule):
+    durees = sorted(mesure['durees'])
+    erreurs = sum(n for statut, n in mesure['statuts'].items() if statut == 0 or statut >= 500)
+    resume = {
+        'requetes': len(durees),
+        'erreurs': erreurs,
+        'statuts': {str(statut): n for statut, n in sorted(mesure['statuts'].items())},
+        'rps': round(len(durees) / ecoule, 2) if ecoule else None,
+        'latence_ms': dict(
+            {'p%d' % p: round(percentile(durees, p), 2) for p in PERCENTILES},
+            moyenne=round(sum(durees) / len(durees), 2), max=round(durees[-1], 2),
+        ),
+        'requetes_sql': round(sum(mesure['sql']) / len(mesure['sql']), 2) if mesure['sql'] else None,
+    }
+    return resume
+
+
+def _commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def lancer(cible, parcours=PARCOURS, concurrence=4, duree=10.0, progression=None):
+    """Joue chaque parcours pendant `duree` secondes avec `concurrence` utilisateurs. Retourne le rapport."""
+    progression = progression or (lambda message: None)
+    utilisateurs = preparer(concurrence)
+    rapport = {
+        'commit': _commit(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'cible': cible.nom,
+        'concurrence': concurrence,
+        'duree_s': duree,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'points': {},
+        'echecs_preparation': {},
+    }
+    cible.demarrer()
+    try:
+        for nom in parcours:
+            position = _taille_journal()
+            mesures, echecs, ecoule = _jouer(cible, nom, utilisateurs, duree)
+            if echecs:
+                rapport['echecs_preparation'][nom] = echecs
+            journal = _requetes_journal(position) if cible.nom != 'wsgi' else {}
+            for point, mesure in mesures.items():
+                if not mesure['sql'] and journal.get(point):
+                    mesure['sql'] = journal[point]
+                resume = rapport['points'][point] = _resume(mesure, ecoule)
+                progression('%-18s %8.1f req/s  p50 %7.1f ms  p99 %7.1f ms  %s SQL/req' % (
+                    point, resume['rps'], resume['latence_ms']['p50'], resume['latence_ms']['p99'],
+                    resume['requetes_sql']))
+    finally:
+        cible.arreter()
+    rapport['rss_max_mo'] = round(cible.rss_max() / 2 ** 20, 1) if cible.rss_max() else None
+    return rapport
+
+
+def comparer(avant, apres):
+    """Lignes de comparaison de deux rapports : req/s, p95 et requêtes SQL par point d'accès."""
+    lignes = []
+    for point in sorted(set(avant['points']) | set(apres['points'])):
+        a, b = avant['points'].get(point), apres['points'].get(point)
+        if a is None or b is None:
+            lignes.append('%-18s %s' % (point, 'absent avant' if a is None else 'absent après'))
+            continue
+        lignes.append('%-18s req/s %8.1f -> %8.1f (%+.0f %%)   p95 %7.1f -> %7.1f ms   SQL %s -> %s' % (
+            point, a['rps'], b['rps'], 100 * (b['rps'] - a['rps']) / a['rps'] if a['rps'] else 0,
+            a['latence_ms']['p95'], b['latence_ms']['p95'], a['requetes_sql'], b['requetes_sql']))
+    return lignes
@@ -0,0 +1,48 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from base import banc
+
+
+class Command(BaseCommand):
+    help = ("Banc d'essai HTTP des parcours boutique, panier et paiement : requêtes/s, latences, "
+            "requêtes SQL par requête et RSS maximal, en JSON")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cible', choices=['wsgi', 'gunicorn', 'url'], default='wsgi')
+        parser.add_argument('--url', help="Serveur à mesurer avec --cible url (ex. http://127.0.0.1:8000)")
+        parser.add_argument('--workers', type=int, default=2, help="Workers gunicorn")
+        parser.add_argument('--threads', type=int, default=1, help="Threads par worker gunicorn")
+        parser.add_argument('--concurrence', type=int, default=4, help="Utilisateurs virtuels simultanés")
+        parser.add_argument('--duree', type=float, default=10.0, help="Secondes par parcours")
+        parser.add_argument('--parcours', nargs='+', choices=banc.PARCOURS, default=list(banc.PARCOURS))
+        parser.add_argument('--sortie', help="Fichier JSON du rapport")
+        parser.add_argument('--comparer', help="Rapport JSON d'un autre commit à comparer")
+
+    def handle(self, *args, **options):
+        if options['cible'] == 'url' and not options['url']:
+            raise CommandError("--cible url demande --url")
+        if options['cible'] == 'wsgi':
+            cible = banc.CibleWSGI()
+        elif options['cible'] == 'gunicorn':
+            cible = banc.CibleGunicorn(options['workers'], options['threads'])
+        else:
+            cible = banc.CibleHTTP(options['url'])
+
+        try:
+            rapport = banc.lancer(cible, options['parcours'], options['concurrence'], options['duree'],
+                                  progression=self.stdout.write)
+        except (banc.DonneesManquantes, RuntimeError) as e:
+            raise CommandError(str(e))
+
+        if rapport['rss_max_mo'] is not None:
+            self.stdout.write("RSS maximal : %s Mo" % rapport['rss_max_mo'])
+        if options['sortie']:
+            with open(options['sortie'], 'w', encoding='utf-8') as f:
+                json.dump(rapport, f, indent=2, ensure_ascii=False)
+            self.stdout.write(self.style.SUCCESS("Rapport écrit dans %s" % options['sortie']))
+        if options['comparer']:
+            with open(options['comparer'], encoding='utf-8') as f:
+                for ligne in banc.comparer(json.load(f), rapport):
+                    self.stdout.write(ligne)
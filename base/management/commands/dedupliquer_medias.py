@@ -0,0 +1,75 @@
+import datetime
+import hashlib
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from base.models import FichierMedia
+from base.storage import PREFIXE, champs_dedupliques, recompter
+
+
+class Command(BaseCommand):
+    help = ("Migre les médias existants vers le stockage par empreinte : les fichiers identiques "
+            "sont fusionnés, les lignes réécrites par UPDATE groupés et les compteurs recalculés")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--essai', action='store_true', help="Afficher le bilan sans rien modifier")
+
+    def handle(self, *args, **options):
+        essai = options['essai']
+        champs = champs_dedupliques()
+        # Les valeurs par défaut des champs (b-1.jpg, logo.png...) restent des fichiers partagés
+        defauts = {field.default for _, field in champs if isinstance(field.default, str)}
+
+        nouveaux = {}  # ancien nom -> nom par empreinte
+        tailles = {}
+        manquants = set()
+        for model, field in champs:
+            noms = list(model._base_manager.exclude(**{field.name: ''}).exclude(**{field.name + '__isnull': True})
+                        .exclude(**{field.name + '__startswith': PREFIXE + '/'})
+                        .values_list(field.name, flat=True).distinct())
+            for nom in noms:
+                if nom in nouveaux or nom in manquants or nom in defauts:
+                    continue
+                if not default_storage.exists(nom):
+                    manquants.add(nom)
+                    continue
+                tailles[nom] = default_storage.size(nom)
+                with default_storage.open(nom) as fichier:
+                    if essai:
+                        sha = hashlib.sha256()
+                        for bloc in fichier.chunks():
+                            sha.update(bloc)
+                        nouveaux[nom] = default_storage.nom_pour(sha.hexdigest(), nom)
+                    else:
+                        nouveaux[nom] = default_storage.save(nom, File(fichier, nom))
+
+            if not essai:
+                with transaction.atomic():
+                    for ancien in noms:
+                        if ancien in nouveaux:
+                            model._base_manager.filter(**{field.name: ancien}).update(**{field.name: nouveaux[ancien]})
+
+        uniques = {}
+        for ancien, nom in nouveaux.items():
+            uniques[nom] = tailles[ancien]
+        liberes = sum(tailles.values()) - sum(uniques.values())
+
+        if not essai:
+            recompter()
+            # Toutes les lignes pointent désormais vers cas/ : les anciens fichiers partent
+            for ancien in nouveaux:
+                default_storage.delete(ancien)
+            # Fichiers jamais rattachés à une ligne (envoi abandonné) depuis plus d'une heure
+            orphelins = FichierMedia.objects.filter(
+                references=0, date_add__lt=timezone.now() - datetime.timedelta(hours=1))
+            for nom in orphelins.values_list('nom', flat=True):
+                default_storage.liberer(nom)
+
+        self.stdout.write(
+            "%d fichiers migrés vers %d fichiers uniques, %d introuvables, %.1f Mo économisés%s"
+            % (len(nouveaux), len(uniques), len(manquants), liberes / 1024 / 1024, " (essai)" if essai else "")
+        )
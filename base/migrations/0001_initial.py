@@ -0,0 +1,29 @@
+# Generated by Django 4.2.9 on 2026-10-18 18:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FichierMedia',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nom', models.CharField(max_length=255, unique=True)),
+                ('empreinte', models.CharField(db_index=True, max_length=64)),
+                ('taille', models.PositiveBigIntegerField(default=0)),
+                ('references', models.PositiveIntegerField(default=0)),
+                ('date_add', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Fichier média',
+                'verbose_name_plural': 'Fichiers médias',
+            },
+        ),
+    ]
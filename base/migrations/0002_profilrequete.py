@@ -0,0 +1,33 @@
+# Generated by Django 4.2.9 on 2026-10-18 19:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfilRequete',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vue', models.CharField(db_index=True, max_length=200)),
+                ('methode', models.CharField(max_length=10)),
+                ('chemin', models.CharField(max_length=500)),
+                ('statut', models.PositiveSmallIntegerField()),
+                ('duree_ms', models.FloatField()),
+                ('echantillons', models.PositiveIntegerField()),
+                ('declencheur', models.CharField(choices=[('taux', 'Échantillon 1/N'), ('entete', 'En-tête signé')], max_length=10)),
+                ('fichier', models.CharField(max_length=255)),
+                ('date_add', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Profil de requête',
+                'verbose_name_plural': 'Profils de requêtes',
+                'ordering': ('-date_add',),
+            },
+        ),
+    ]
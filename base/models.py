@@ -1,3 +1,46 @@
 from django.db import models
 
 # Create your models here.
+
+
+class FichierMedia(models.Model):
+    """Fichier stocké par empreinte de contenu (base.storage), partagé par tous les champs qui le référencent."""
+
+    nom = models.CharField(max_length=255, unique=True)
+    empreinte = models.CharField(max_length=64, db_index=True)
+    taille = models.PositiveBigIntegerField(default=0)
+    references = models.PositiveIntegerField(default=0)
+    date_add = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Fichier média'
+        verbose_name_plural = 'Fichiers médias'
+
+    def __str__(self):
+        return self.nom
+
+
+class ProfilRequete(models.Model):
+    """Profil échantillonné d'une requête (base.profilage) ; les piles sont dans `fichier`."""
+
+    TAUX = 'taux'
+    ENTETE = 'entete'
+    DECLENCHEURS = ((TAUX, 'Échantillon 1/N'), (ENTETE, 'En-tête signé'))
+
+    vue = models.CharField(max_length=200, db_index=True)
+    methode = models.CharField(max_length=10)
+    chemin = models.CharField(max_length=500)
+    statut = models.PositiveSmallIntegerField()
+    duree_ms = models.FloatField()
+    echantillons = models.PositiveIntegerField()
+    declencheur = models.CharField(max_length=10, choices=DECLENCHEURS)
+    fichier = models.CharField(max_length=255)
+    date_add = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = 'Profil de requête'
+        verbose_name_plural = 'Profils de requêtes'
+        ordering = ('-date_add',)
+
+    def __str__(self):
+        return '%s %s (%.0f ms)' % (self.methode, self.vue, self.duree_ms)
@@ -0,0 +1,204 @@
+import collections
+import datetime
+import os
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.utils import timezone
+
+from .models import ProfilRequete
+
+
+# Profilage par échantillonnage des requêtes en production : une requête sur
+# TAUX, ou toute requête portant l'en-tête X-Profilage signé pour un membre de
+# l'équipe, est suivie par un thread qui relève la pile du thread de la requête
+# toutes les INTERVALLE secondes. Les piles sont enregistrées au format
+# « collapsed » (flamegraph.pl, speedscope) et listées dans l'administration.
+TAUX = getattr(settings, 'PROFILAGE_TAUX', 0)              # 0 : seulement avec l'en-tête
+INTERVALLE = getattr(settings, 'PROFILAGE_INTERVALLE', 0.005)
+DOSSIER = getattr(settings, 'PROFILAGE_DIR', settings.BASE_DIR / 'cache' / 'profils')
+RETENTION = getattr(settings, 'PROFILAGE_RETENTION', 20)   # profils gardés par vue
+JOURS = getattr(settings, 'PROFILAGE_JOURS', 7)
+VALIDITE = getattr(settings, 'PROFILAGE_VALIDITE', 24 * 3600)
+
+ENTETE = 'X-Profilage'
+_SEL = 'base.profilage'
+
+
+def jeton(user):
+    """Valeur de l'en-tête X-Profilage pour un membre de l'équipe, valable VALIDITE secondes."""
+    return signing.TimestampSigner(salt=_SEL).sign(str(user.pk))
+
+
+def _jeton_valide(valeur):
+    try:
+        pk = signing.TimestampSigner(salt=_SEL).unsign(valeur, max_age=VALIDITE)
+    except signing.BadSignature:
+        return False
+    return get_user_model().objects.filter(pk=pk, is_staff=True, is_active=True).exists()
+
+
+_etiquettes = {}
+
+
+def _pile(frame):
+    noms = []
+    while frame is not None:
+        code = frame.f_code
+        nom = _etiquettes.get(code)
+        if nom is None:
+            nom = _etiquettes[code] = '%s:%s' % (
+                frame.f_globals.get('__name__', '?'), getattr(code, 'co_qualname', code.co_name))
+        noms.append(nom)
+        frame = frame.f_back
+    return ';'.join(reversed(noms))
+
+
+class Echantillonneur(threading.Thread):
+    """Relève périodiquement la pile d'un autre thread et compte les piles identiques."""
+
+    def __init__(self, cible, intervalle=INTERVALLE):
+        super().__init__(name='profilage', daemon=True)
+        self.cible = cible
+        self.intervalle = intervalle
+        self.piles = collections.Counter()
+        self._arret = threading.Event()
+
+    def run(self):
+        while not self._arret.wait(self.intervalle):
+            frame = sys._current_frames().get(self.cible)
+            if frame is not None:
+                self.piles[_pile(frame)] += 1
+
+    def arreter(self):
+        self._arret.set()
+        self.join()
+
+
+class ProfilageMiddleware:
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        declencheur = self._declencheur(request)
+        if declencheur is None:
+            return self.get_response(request)
+
+        echantillonneur = Echantillonneur(threading.get_ident(), INTERVALLE)
+        debut = time.perf_counter()
+        echantillonneur.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            echantillonneur.arreter()
+        duree = (time.perf_counter() - debut) * 1000
+
+        match = request.resolver_match
+        if match is not None and echantillonneur.piles:
+            enregistrer(match.view_name, request, response.status_code, duree, echantillonneur.piles, declencheur)
+        return response
+
+    def _declencheur(self, request):
+        valeur = request.headers.get(ENTETE)
+        if valeur and _jeton_valide(valeur):
+            return ProfilRequete.ENTETE
+        if TAUX and random.random() * TAUX < 1:
+            return ProfilRequete.TAUX
+        return None
+
+
+def _dossier_vue(vue):
+    return re.sub(r'[^\w.-]', '_', vue)
+
+
+def chemin(profil):
+    return os.path.join(str(DOSSIER), profil.fichier)
+
+
+def enregistrer(vue, request, statut, duree, piles, declencheur):
+    profil = ProfilRequete.objects.create(
+        vue=vue, methode=request.method, chemin=request.get_full_path()[:500], statut=statut,
+        duree_ms=duree, echantillons=sum(piles.values()), declencheur=declencheur,
+    )
+    profil.fichier = os.path.join(_dossier_vue(vue), '%d.txt' % profil.pk)
+    os.makedirs(os.path.dirname(chemin(profil)), exist_ok=True)
+    with open(chemin(profil), 'w', encoding='utf-8') as f:
+        for pile, nombre in piles.most_common():
+            f.write('%s %d\n' % (pile, nombre))
+    profil.save(update_fields=['fichier'])
+    purger(vue)
+    return profil
+
+
+def purger(vue=None):
+    """Supprime les profils au-delà de RETENTION pour `vue` et ceux de plus de JOURS jours."""
+    anciens = ProfilRequete.objects.filter(date_add__lt=timezone.now() - datetime.timedelta(days=JOURS))
+    if vue is not None:
+        garder = ProfilRequete.objects.filter(vue=vue).order_by('-date_add', '-pk').values_list(
+            'pk', flat=True)[:RETENTION]
+        anciens = anciens | ProfilRequete.objects.filter(vue=vue).exclude(pk__in=list(garder))
+    # delete() instance par instance : le signal post_delete efface les fichiers
+    for profil in anciens:
+        profil.delete()
+
+
+def piles(profil):
+    """{pile: nombre d'échantillons} lu depuis le fichier du profil."""
+    resultat = {}
+    try:
+        with open(chemin(profil), encoding='utf-8') as f:
+            for ligne in f:
+                pile, _, nombre = ligne.rstrip('\n').rpartition(' ')
+                if pile:
+                    resultat[pile] = resultat.get(pile, 0) + int(nombre)
+    except OSError:
+        pass
+    return resultat
+
+
+def flamegraph(piles, largeur=1200, hauteur_ligne=16):
+    """Flamegraph SVG (racine en bas) des piles « collapsed »."""
+    racine = {'nom': 'tout', 'total': 0, 'enfants': {}}
+    for pile, nombre in piles.items():
+        noeud = racine
+        noeud['total'] += nombre
+        for nom in pile.split(';'):
+            noeud = noeud['enfants'].setdefault(nom, {'nom': nom, 'total': 0, 'enfants': {}})
+            noeud['total'] += nombre
+
+    rectangles, profondeur_max = [], 0
+    a_placer = [(racine, 0.0, 0)]
+    while a_placer:
+        noeud, x, profondeur = a_placer.pop()
+        w = noeud['total'] / racine['total'] * largeur if racine['total'] else largeur
+        if w < 0.5:
+            continue
+        rectangles.append((noeud, x, w, profondeur))
+        profondeur_max = max(profondeur_max, profondeur)
+        for enfant in sorted(noeud['enfants'].values(), key=lambda n: n['nom']):
+            a_placer.append((enfant, x, profondeur + 1))
+            x += enfant['total'] / racine['total'] * largeur
+
+    hauteur = (profondeur_max + 1) * hauteur_ligne
+    svg = ['<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d" font-family="monospace" '
+           'font-size="11">' % (largeur, hauteur)]
+    for noeud, x, w, profondeur in rectangles:
+        y = hauteur - (profondeur + 1) * hauteur_ligne
+        teinte = 10 + zlib.crc32(noeud['nom'].encode('utf-8')) % 40
+        titre = '%s (%d échantillons, %.1f %%)' % (noeud['nom'], noeud['total'], 100 * noeud['total'] / racine['total'])
+        texte = noeud['nom'][:int(w / 7)] if w > 21 else ''
+        svg.append(
+            '<g><title>%s</title><rect x="%.1f" y="%d" width="%.1f" height="%d" fill="hsl(%d,90%%,60%%)" '
+            'stroke="white"/><text x="%.1f" y="%d">%s</text></g>' % (
+                escape(titre), x, y, w, hauteur_ligne - 1, teinte, x + 3, y + hauteur_ligne - 4, escape(texte)))
+    svg.append('</svg>')
+    return '\n'.join(svg)
@@ -0,0 +1,188 @@
+import glob
+import heapq
+import json
+import logging
+import os
+import time
+from contextlib import ExitStack, contextmanager
+from logging.handlers import RotatingFileHandler
+
+from django.conf import settings
+from django.db import connections
+
+
+# Mesure des requêtes SQL par vue : nombre, temps SQL cumulé et instructions les
+# plus lentes de chaque requête HTTP, écrits en JSON (une ligne par requête)
+# dans le journal `cooldeal.requetes`. La page d'administration /admin/requetes/
+# agrège ce journal par nom d'URL.
+#
+# L'activation et le chemin du journal sont relus à chaque requête, pour qu'un
+# changement de réglage (tests) soit suivi sans redémarrer.
+LENTES = getattr(settings, 'REQUETES_LENTES', 3)
+
+logger = logging.getLogger('cooldeal.requetes')
+
+
+def actif():
+    return getattr(settings, 'REQUETES_INSTRUMENTATION', True)
+
+
+def fichier_journal():
+    return getattr(settings, 'REQUETES_JOURNAL', settings.BASE_DIR / 'logs' / 'requetes.log')
+
+
+class JournalRotatif(RotatingFileHandler):
+    """RotatingFileHandler qui crée son dossier à la première écriture.
+
+    Sans `filename`, il écrit dans fichier_journal() et change de fichier si le
+    réglage REQUETES_JOURNAL change.
+    """
+
+    def __init__(self, filename=None, *args, **kwargs):
+        self.reglage = None if filename else fichier_journal()
+        super().__init__(filename or self.reglage, *args, **kwargs)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+    def emit(self, record):
+        # Appelé sous le verrou du handler
+        reglage = fichier_journal()
+        if self.reglage is not None and reglage != self.reglage:
+            self.reglage = reglage
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+            self.baseFilename = os.path.abspath(self.reglage)
+        super().emit(record)
+
+
+class Mesure:
+    """execute_wrapper qui compte et chronomètre les instructions SQL."""
+
+    def __init__(self, lentes=LENTES):
+        self.nombre = 0
+        self.duree = 0.0
+        self.lentes = []  # tas des (ms, sql) les plus lents
+        self.taille = lentes
+
+    def __call__(self, execute, sql, params, many, context):
+        debut = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            ms = (time.perf_counter() - debut) * 1000
+            self.nombre += 1
+            self.duree += ms
+            if len(self.lentes) < self.taille:
+                heapq.heappush(self.lentes, (ms, sql))
+            elif ms > self.lentes[0][0]:
+                heapq.heapreplace(self.lentes, (ms, sql))
+
+
+@contextmanager
+def _mesurer(mesure):
+    with ExitStack() as pile:
+        for alias in connections:
+            pile.enter_context(connections[alias].execute_wrapper(mesure))
+        yield
+
+
+def _flux(contenu, mesure):
+    with _mesurer(mesure):
+        yield from contenu
+
+
+class RequetesMiddleware:
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not actif():
+            return self.get_response(request)
+
+        mesure = Mesure()
+        debut = time.perf_counter()
+        with _mesurer(mesure):
+            response = self.get_response(request)
+
+        if not response.streaming:
+            self.journaliser(request, response, mesure, debut)
+            return response
+
+        # Le corps d'une réponse en flux (exports) est produit pendant l'envoi, après
+        # la vue : ses requêtes sont comptées aussi et la ligne écrite à la fermeture.
+        # Un fichier servi tel quel (FileResponse) ne fait pas de SQL et garde son
+        # envoi direct par wsgi.file_wrapper.
+        if not response.is_async and getattr(response, 'file_to_stream', None) is None:
+            response.streaming_content = _flux(response.streaming_content, mesure)
+        fermer = response.close
+
+        def close():
+            try:
+                fermer()
+            finally:
+                self.journaliser(request, response, mesure, debut)
+
+        response.close = close
+        return response
+
+    def journaliser(self, request, response, mesure, debut):
+        match = request.resolver_match
+        if match is None:
+            return
+        logger.info(json.dumps({
+            'vue': match.view_name,
+            'methode': request.method,
+            'statut': response.status_code,
+            'requetes': mesure.nombre,
+            'sql_ms': round(mesure.duree, 2),
+            'duree_ms': round((time.perf_counter() - debut) * 1000, 2),
+            'lentes': [[round(ms, 2), sql[:1000]] for ms, sql in sorted(mesure.lentes, reverse=True)],
+        }, ensure_ascii=False))
+
+
+def _lignes(journal):
+    # Journal courant et fichiers tournés (requetes.log.1, .2...)
+    for chemin in sorted(glob.glob(str(journal) + '*')):
+        try:
+            with open(chemin, encoding='utf-8') as f:
+                for ligne in f:
+                    try:
+                        yield json.loads(ligne)
+                    except ValueError:
+                        continue
+        except OSError:
+            continue
+
+
+def resume(journal=None):
+    """Statistiques par vue, de la plus coûteuse en requêtes à la moins coûteuse."""
+    vues = {}
+    for mesure in _lignes(journal or fichier_journal()):
+        vue = vues.setdefault(mesure['vue'], {
+            'vue': mesure['vue'], 'appels': 0, 'requetes': 0, 'requetes_max': 0,
+            'sql_ms': 0.0, 'durees': [], 'lentes': [],
+        })
+        vue['appels'] += 1
+        vue['requetes'] += mesure['requetes']
+        vue['requetes_max'] = max(vue['requetes_max'], mesure['requetes'])
+        vue['sql_ms'] += mesure['sql_ms']
+        vue['durees'].append(mesure['duree_ms'])
+        for ms, sql in mesure['lentes']:
+            if len(vue['lentes']) < LENTES:
+                heapq.heappush(vue['lentes'], (ms, sql))
+            elif ms > vue['lentes'][0][0]:
+                heapq.heapreplace(vue['lentes'], (ms, sql))
+
+    resultat = []
+    for vue in vues.values():
+        durees = sorted(vue.pop('durees'))
+        vue['requetes_moy'] = vue['requetes'] / vue['appels']
+        vue['sql_ms_moy'] = vue['sql_ms'] / vue['appels']
+        vue['duree_p95'] = durees[min(len(durees) - 1, int(len(durees) * 0.95))]
+        vue['lentes'] = sorted(vue['lentes'], reverse=True)
+        resultat.append(vue)
+    return sorted(resultat, key=lambda v: (v['requetes_max'], v['sql_ms_moy']), reverse=True)
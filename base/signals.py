@@ -0,0 +1,64 @@
+import os
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+
+from .models import ProfilRequete
+from .storage import champs_dedupliques
+
+
+# Compteurs de références des fichiers dédupliqués : on mémorise les noms de
+# fichiers au chargement d'une instance, puis on compare à l'enregistrement.
+def _noms(instance, champs):
+    noms = {}
+    for field in champs:
+        if field.attname in instance.__dict__:
+            valeur = instance.__dict__[field.attname]
+            noms[field.attname] = getattr(valeur, 'name', valeur) or ''
+    return noms
+
+
+def _effacer_profil(sender, instance, **kwargs):
+    from . import profilage
+
+    def effacer():
+        try:
+            os.remove(profilage.chemin(instance))
+        except OSError:
+            pass
+
+    if instance.fichier:
+        transaction.on_commit(effacer)
+
+
+def connecter():
+    post_delete.connect(_effacer_profil, sender=ProfilRequete)
+
+    par_modele = {}
+    for model, field in champs_dedupliques():
+        par_modele.setdefault(model, []).append(field)
+
+    for model, champs in par_modele.items():
+        def memoriser(sender, instance, champs=champs, **kwargs):
+            instance._fichiers_dedupliques = _noms(instance, champs)
+
+        def enregistrer(sender, instance, raw=False, champs=champs, **kwargs):
+            if raw:
+                return
+            avant = getattr(instance, '_fichiers_dedupliques', {})
+            apres = _noms(instance, champs)
+            for field in champs:
+                ancien, nouveau = avant.get(field.attname, ''), apres.get(field.attname, '')
+                if ancien == nouveau or field.attname not in apres:
+                    continue
+                field.storage.retenir(nouveau)
+                transaction.on_commit(lambda storage=field.storage, nom=ancien: storage.liberer(nom))
+            instance._fichiers_dedupliques = apres
+
+        def supprimer(sender, instance, champs=champs, **kwargs):
+            for field, nom in zip(champs, _noms(instance, champs).values()):
+                transaction.on_commit(lambda storage=field.storage, nom=nom: storage.liberer(nom))
+
+        post_init.connect(memoriser, sender=model, weak=False)
+        post_save.connect(enregistrer, sender=model, weak=False)
+        post_delete.connect(supprimer, sender=model, weak=False)
@@ -0,0 +1,159 @@
+import hashlib
+import os
+import tempfile
+
+from django.apps import apps
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.db import models, transaction
+from django.db.models import Count, F
+
+
+# Stockage des médias par contenu : un fichier téléversé est rangé sous
+# cas/ab/cd/<sha256><ext>. Deux téléversements identiques (même image dans
+# image, image_2 et image_3, même logo pour plusieurs produits) partagent donc
+# le même fichier. Chaque fichier a un compteur de références tenu par les
+# signaux de base.signals ; il est supprimé quand plus aucun champ ne le cite.
+# Les anciens noms (hors cas/) restent lisibles tels quels.
+PREFIXE = 'cas'
+
+# NamedTemporaryFile crée ses fichiers en 0600 ; les fichiers renommés à partir
+# d'un temporaire reprennent le mode d'un open() ordinaire (0666 moins le umask,
+# lu une fois au chargement), comme FileSystemStorage.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def mode_fichier(mode=None):
+    """Mode à donner à un fichier écrit par temporaire puis renommage."""
+    return mode if mode is not None else 0o666 & ~_UMASK
+
+
+def est_adresse(nom):
+    return bool(nom) and nom.startswith(PREFIXE + '/')
+
+
+class StockageDeduplique(FileSystemStorage):
+
+    def nom_pour(self, empreinte, nom_origine):
+        extension = os.path.splitext(nom_origine or '')[1].lower()[:10]
+        return '%s/%s/%s/%s%s' % (PREFIXE, empreinte[:2], empreinte[2:4], empreinte, extension)
+
+    def save(self, name, content, max_length=None):
+        from .models import FichierMedia
+
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+
+        sha = hashlib.sha256()
+        taille = 0
+        for bloc in content.chunks():
+            sha.update(bloc)
+            taille += len(bloc)
+        empreinte = sha.hexdigest()
+        nom = self.nom_pour(empreinte, name)
+
+        FichierMedia.objects.get_or_create(nom=nom, defaults={'empreinte': empreinte, 'taille': taille})
+        if not self.exists(nom):
+            content.seek(0)
+            self._ecrire(nom, content)
+        return nom
+
+    def _ecrire(self, nom, content):
+        # Écriture dans un temporaire puis renommage : deux envois simultanés du
+        # même contenu aboutissent au même fichier, sans nom de repli.
+        chemin = self.path(nom)
+        os.makedirs(os.path.dirname(chemin), exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(chemin), suffix='.tmp', delete=False) as f:
+            for bloc in content.chunks():
+                f.write(bloc)
+        os.chmod(f.name, mode_fichier(self.file_permissions_mode))
+        os.replace(f.name, chemin)
+
+    def retenir(self, nom):
+        from .models import FichierMedia
+
+        if not est_adresse(nom):
+            return
+        if not FichierMedia.objects.filter(nom=nom).update(references=F('references') + 1):
+            # Ligne retirée entre l'envoi et l'enregistrement du modèle (dernier
+            # détenteur supprimé au même moment) : on la recrée.
+            FichierMedia.objects.create(
+                nom=nom, empreinte=os.path.splitext(os.path.basename(nom))[0], references=1,
+                taille=self.size(nom) if self.exists(nom) else 0,
+            )
+
+    def liberer(self, nom):
+        """Retire une référence ; le fichier disparaît avec la dernière."""
+        from .models import FichierMedia
+
+        if not est_adresse(nom):
+            return
+        with transaction.atomic():
+            FichierMedia.objects.filter(nom=nom, references__gt=0).update(references=F('references') - 1)
+            supprimes, _ = FichierMedia.objects.filter(nom=nom, references=0).delete()
+        if supprimes and not FichierMedia.objects.filter(nom=nom).exists():
+            super().delete(nom)
+
+    def delete(self, name):
+        if est_adresse(name):
+            self.liberer(name)
+        else:
+            super().delete(name)
+
+    def effacer(self, nom):
+        """Efface le fichier sans toucher aux compteurs."""
+        super().delete(nom)
+
+
+def champs_dedupliques():
+    """(modèle, champ) de tous les FileField servis par ce stockage."""
+    return [
+        (model, field)
+        for model in apps.get_models()
+        for field in model._meta.concrete_fields
+        if isinstance(field, models.FileField) and isinstance(field.storage, StockageDeduplique)
+    ]
+
+
+def recompter():
+    """Recalcule tous les compteurs de références à partir des champs des modèles."""
+    from .models import FichierMedia
+
+    comptes = {}
+    for model, field in champs_dedupliques():
+        lignes = (model._base_manager.filter(**{field.name + '__startswith': PREFIXE + '/'})
+                  .values_list(field.name).annotate(n=Count('pk')).order_by())
+        for nom, n in lignes:
+            comptes[nom] = comptes.get(nom, 0) + n
+
+    with transaction.atomic():
+        FichierMedia.objects.exclude(nom__in=comptes).update(references=0)
+        for fichier in FichierMedia.objects.filter(nom__in=comptes):
+            if fichier.references != comptes[fichier.nom]:
+                fichier.references = comptes[fichier.nom]
+                fichier.save(update_fields=['references'])
+    return comptes
+
+
+def remplacer(ancien, nouveau, taille):
+    """Fait pointer vers `nouveau` (déjà écrit) tous les champs qui citent `ancien`, puis efface `ancien`.
+
+    Pour un fichier réécrit hors téléversement (recompression) : les compteurs de
+    références passent de l'ancienne ligne FichierMedia à la nouvelle.
+    """
+    from .models import FichierMedia
+
+    with transaction.atomic():
+        for model, field in champs_dedupliques():
+            model._base_manager.filter(**{field.name: ancien}).update(**{field.name: nouveau})
+        references = sum(FichierMedia.objects.filter(nom=ancien).values_list('references', flat=True))
+        fichier, cree = FichierMedia.objects.get_or_create(nom=nouveau, defaults={
+            'empreinte': os.path.splitext(os.path.basename(nouveau))[0], 'taille': taille, 'references': references,
+        })
+        if not cree:
+            FichierMedia.objects.filter(pk=fichier.pk).update(references=F('references') + references)
+        FichierMedia.objects.filter(nom=ancien).delete()
+        transaction.on_commit(lambda: StockageDeduplique().effacer(ancien))
@@ -1,4 +1,8 @@
+import os
+import re
+
 from django.apps import apps
+from django.contrib.auth import get_user_model
 
 import pytest
 
@@ -24,3 +28,308 @@ def test_graphql_hello_endpoint(client):
     data = response.json()
     assert response.status_code == 200
     assert data['data']['hello'] == 'Salut depuis GraphQL'
+
+
+@pytest.mark.django_db
+def test_identical_uploads_share_one_counted_file(settings, tmp_path, django_capture_on_commit_callbacks):
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from django.core.management import call_command
+
+    from base.models import FichierMedia
+    from shop.tests import _catalogue
+
+    settings.MEDIA_ROOT = tmp_path
+    _, (produit, autre) = _catalogue("medias", 2)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        produit.image = SimpleUploadedFile("deal.jpg", b"meme contenu")
+        produit.image_2 = SimpleUploadedFile("deal (1).jpg", b"meme contenu")
+        produit.save()
+        autre.image = SimpleUploadedFile("autre.jpg", b"meme contenu")
+        autre.save()
+
+    assert produit.image.name == produit.image_2.name == autre.image.name
+    assert produit.image.name.startswith("cas/")
+    assert len(list((tmp_path / "cas").rglob("*.jpg"))) == 1
+    # Même mode qu'un fichier écrit par FileSystemStorage, pas le 0600 du temporaire
+    umask = os.umask(0)
+    os.umask(umask)
+    assert (tmp_path / produit.image.name).stat().st_mode & 0o777 == 0o666 & ~umask
+    fichier = FichierMedia.objects.get()
+    assert fichier.references == 3
+
+    # Remplacer puis supprimer : le fichier ne disparaît qu'avec sa dernière référence
+    with django_capture_on_commit_callbacks(execute=True):
+        produit.image_2 = SimpleUploadedFile("nouveau.jpg", b"autre contenu")
+        produit.save()
+        produit.delete()
+    fichier.refresh_from_db()
+    assert fichier.references == 1
+    assert (tmp_path / autre.image.name).exists()
+    with django_capture_on_commit_callbacks(execute=True):
+        autre.delete()
+    assert not FichierMedia.objects.exists()
+    assert not list((tmp_path / "cas").rglob("*.jpg"))
+
+    # Migration des anciens fichiers : les doublons sont fusionnés sur place
+    cat_prod, (un, deux) = _catalogue("anciens", 2)
+    (tmp_path / "produis").mkdir()
+    (tmp_path / "produis" / "a.jpg").write_bytes(b"doublon")
+    (tmp_path / "produis" / "b.jpg").write_bytes(b"doublon")
+    type(un).objects.filter(id=un.id).update(image="produis/a.jpg")
+    type(deux).objects.filter(id=deux.id).update(image="produis/b.jpg", image_2="produis/a.jpg")
+    call_command("dedupliquer_medias")
+
+    un.refresh_from_db()
+    deux.refresh_from_db()
+    assert un.image.name == deux.image.name == deux.image_2.name
+    assert deux.image_3.name == "b-1.jpg"
+    assert FichierMedia.objects.get(nom=un.image.name).references == 3
+    assert not (tmp_path / "produis" / "a.jpg").exists() and not (tmp_path / "produis" / "b.jpg").exists()
+
+
+def test_static_lots_are_bundled_minified_and_rebuilt_when_their_recipe_changes(settings, tmp_path, monkeypatch):
+    from django.contrib.staticfiles import finders
+
+    from base import assets
+
+    monkeypatch.setattr(assets, "DOSSIER", str(tmp_path / "lots"))
+    css = open(finders.find("lots/site.css"), encoding="utf-8").read()
+    assert "@import url(\"font-awesome" not in css and ".fa-" in css and "@charset" not in css
+    # Les url() des feuilles intégrées sont réécrites par rapport à lots/
+    polices = {url.split("?")[0].split("#")[0] for _, url in assets._URL.findall(css) if url.startswith("../fonts/")}
+    assert polices
+    for url in polices:
+        assert finders.find(os.path.normpath(os.path.join("lots", url))), url
+
+    vue = os.path.getsize(finders.find("lots/vue.js"))
+    assert vue < os.path.getsize(finders.find("js/vue.js")) + os.path.getsize(finders.find("js/axios.js"))
+
+    # Un lot en cache est gardé tant que sa signature ne change pas...
+    chemin = finders.find("lots/vue.js")
+    with open(chemin, "w") as f:
+        f.write("en cache")
+    assert open(finders.find("lots/vue.js")).read() == "en cache"
+    # ... et reconstruit si le constructeur ou la liste de ses fichiers change
+    monkeypatch.setattr(assets, "_CONSTRUCTEUR", "autre version")
+    assert "axios" in open(finders.find("lots/vue.js"), encoding="utf-8").read()
+    monkeypatch.setitem(assets.LOTS, "lots/vue.js", ["js/axios.js"])
+    assert "Vue.js v2" not in open(finders.find("lots/vue.js"), encoding="utf-8").read()
+    monkeypatch.undo()
+
+    # staticfiles/ (versionné) contient les lots tels que construits aujourd'hui
+    if assets.rcssmin:
+        for lot in assets.LOTS:
+            assert (settings.BASE_DIR / "staticfiles" / lot).read_bytes() == assets.construire(lot), lot
+
+    # Les lots sont dans le manifeste de staticfiles/ ; un nom inconnu fait échouer le rendu
+    assert re.fullmatch(r"/static/lots/vue\.[0-9a-f]{12}\.js", assets.StockageStatique().url("lots/vue.js"))
+    with pytest.raises(ValueError):
+        assets.StockageStatique().url("lots/inconnu.js")
+
+
+@pytest.mark.django_db
+def test_identity_rows_are_loaded_once_per_request(client):
+    from django.contrib.auth import BACKEND_SESSION_KEY
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from customer.models import Customer
+    from shop.tests import _catalogue
+
+    _, (produit,) = _catalogue("identite", 1)
+    marchand = produit.etablissement.user
+    acheteur = type(marchand).objects.create_user(username="identite-client", password="pwd")
+    Customer.objects.create(user=acheteur, adresse="Addr", contact_1="000000", photo="clients/photo/p.jpg")
+
+    def requetes_identite(url):
+        with CaptureQueriesContext(connection) as requetes:
+            assert client.get(url).status_code == 200
+        sql = [q["sql"] for q in requetes.captured_queries]
+        return ([s for s in sql if 'FROM "auth_user"' in s],
+                [s for s in sql if 'FROM "customer_customer"' in s or 'FROM "shop_etablissement"' in s])
+
+    client.force_login(acheteur)
+    utilisateurs, profils = requetes_identite(reverse("profil"))
+    assert len(utilisateurs) == 1 and "customer_customer" in utilisateurs[0]
+    assert profils == []
+
+    client.force_login(marchand)
+    utilisateurs, profils = requetes_identite(reverse("commande-reçu"))
+    assert len(utilisateurs) == 1 and profils == []
+
+    # Une session ouverte avec l'ancien backend reste connectée
+    session = client.session
+    session[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+    session.save()
+    assert client.get(reverse("commande-reçu")).status_code == 200
+    assert client.session[BACKEND_SESSION_KEY] == "base.auth.IdentiteBackend"
+
+
+@pytest.mark.django_db
+def test_requetes_middleware_logs_per_view_and_admin_summarises(client, settings, tmp_path):
+    import json
+
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from base import requetes
+
+    # Le journal configuré dans LOGGING suit le réglage
+    journal = tmp_path / "requetes.log"
+    settings.REQUETES_JOURNAL = journal
+
+    client.get(reverse("shop"))
+    client.get(reverse("shop"))
+    client.get(reverse("villes_autocomplete"), {"q": "ab"})
+
+    lignes = [json.loads(ligne) for ligne in journal.read_text().splitlines()]
+    assert [ligne["vue"] for ligne in lignes] == ["shop", "shop", "villes_autocomplete"]
+    assert lignes[0]["requetes"] > 0 and lignes[0]["lentes"][0][1].startswith("SELECT")
+
+    resume = {vue["vue"]: vue for vue in requetes.resume()}
+    assert resume["shop"]["appels"] == 2
+    assert resume["shop"]["requetes_max"] == max(ligne["requetes"] for ligne in lignes[:2])
+
+    staff = get_user_model().objects.create_user(username="ops", password="pwd", is_staff=True)
+    client.force_login(staff)
+    page = client.get(reverse("resume_requetes"))
+    assert page.status_code == 200 and b"villes_autocomplete" in page.content
+
+    # Réponse en flux : les requêtes faites en produisant le corps sont comptées,
+    # et la ligne n'est écrite qu'à la fermeture de la réponse
+    with CaptureQueriesContext(connection) as sql:
+        export = client.get(reverse("commandes-export", args=["csv"]))
+        assert "commandes-export" not in journal.read_text()
+        b"".join(export.streaming_content)
+    ligne = json.loads(journal.read_text().splitlines()[-1])
+    assert ligne["vue"] == "commandes-export" and ligne["requetes"] == len(sql.captured_queries)
+    assert any(q.startswith("SELECT \"customer_produitpanier\"") for _, q in ligne["lentes"])
+
+
+@pytest.mark.django_db
+def test_metriques_are_summed_across_workers_and_exposed(client, settings, tmp_path, monkeypatch):
+    import time
+
+    from base import metriques
+
+    # Deux workers : chacun son fichier
+    premier = metriques.Registre(tmp_path, series=4)
+    emplacement = premier.debut("shop", "GET")
+    premier.fin(emplacement, 0.003, False)
+    premier.fin(premier.debut("shop", "GET"), 0.2, True)
+    premier.debut("shop", "GET")  # toujours en cours
+    monkeypatch.setattr(os, "getpid", lambda: 999999999)
+    second = metriques.Registre(tmp_path, series=4)
+    second.fin(second.debut("shop", "GET"), 0.004, False)
+    for vue in ("a", "b", "c", "d"):
+        second.fin(second.debut(vue, "GET"), 0.001, False)
+    monkeypatch.undo()
+
+    series = metriques.lire(tmp_path)
+    shop = series[("shop", "GET")]
+    assert (shop["requetes"], shop["erreurs"]) == (3, 1)
+    # Le second worker n'existe pas : ses requêtes en cours ne comptent pas
+    assert shop["en_cours"] == 1
+    assert abs(shop["somme"] - 0.207) < 1e-9
+    assert metriques.quantile(shop["classes"], 0.5) >= 0.004 > metriques.quantile(shop["classes"], 0.5) / 1.2
+    assert metriques.quantile(shop["classes"], 0.99) >= 0.2
+    # Au-delà de `series` séries, les vues sont regroupées
+    assert series[metriques.AUTRE]["requetes"] == 2
+
+    texte = metriques.exposition(series)
+    assert 'cooldeal_requetes_total{vue="shop",methode="GET"} 3' in texte
+    assert 'cooldeal_requete_duree_secondes_bucket{vue="shop",methode="GET",le="+Inf"} 3' in texte
+    assert 'cooldeal_requete_duree_secondes_count{vue="shop",methode="GET"} 3' in texte
+
+    debut = time.perf_counter()
+    for _ in range(10000):
+        premier.fin(premier.debut("shop", "GET"), 0.01, False)
+    assert (time.perf_counter() - debut) / 10000 < 50e-6
+
+    settings.METRIQUES_DIR = tmp_path
+    monkeypatch.setattr(metriques, "_registre", premier)
+    client.get(reverse("villes_autocomplete"), {"q": "ab"})
+    assert ("villes_autocomplete", "GET") in premier.index
+    # Derrière le proxy local, l'adresse du client ne donne aucun accès : il faut le jeton ou un compte de l'équipe
+    settings.METRIQUES_JETON = "s3cret"
+    assert client.get(reverse("metrics"), REMOTE_ADDR="127.0.0.1").status_code == 403
+    assert client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer autre").status_code == 403
+    reponse = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer s3cret")
+    assert reponse.status_code == 200 and reponse["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert b'vue="villes_autocomplete"' in reponse.content
+    settings.METRIQUES_JETON = None
+    assert client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer ").status_code == 403
+    client.force_login(get_user_model().objects.create_user(username="ops", password="pwd", is_staff=True))
+    assert client.get(reverse("metrics")).status_code == 200
+
+
+@pytest.mark.django_db(transaction=True)
+def test_profilage_samples_signed_requests_and_keeps_retention(client, settings, tmp_path, monkeypatch):
+    import time
+
+    from base import profilage
+    from base.models import ProfilRequete
+
+    monkeypatch.setattr(profilage, "DOSSIER", tmp_path)
+    monkeypatch.setattr(profilage, "RETENTION", 2)
+    monkeypatch.setattr(profilage, "INTERVALLE", 0.001)
+
+    def lente(*args, **kwargs):
+        debut = time.perf_counter()
+        while time.perf_counter() - debut < 0.05:
+            pass
+        return []
+
+    monkeypatch.setattr("website.villes.chercher", lente)
+    staff = get_user_model().objects.create_user(username="ops", password="pwd", is_staff=True, is_superuser=True)
+    client_lambda = get_user_model().objects.create_user(username="lambda", password="pwd")
+    url = reverse("villes_autocomplete")
+
+    # Sans en-tête (TAUX = 0) ou avec un jeton d'un non-membre de l'équipe : rien
+    client.get(url, {"q": "ab"})
+    client.get(url, {"q": "ab"}, HTTP_X_PROFILAGE=profilage.jeton(client_lambda))
+    client.get(url, {"q": "ab"}, HTTP_X_PROFILAGE="falsifie")
+    assert not ProfilRequete.objects.exists()
+
+    for _ in range(3):
+        assert client.get(url, {"q": "ab"}, HTTP_X_PROFILAGE=profilage.jeton(staff)).status_code == 200
+    profils = list(ProfilRequete.objects.all())
+    assert len(profils) == 2 and {p.vue for p in profils} == {"villes_autocomplete"}
+    assert len(list(tmp_path.glob("villes_autocomplete/*.txt"))) == 2
+    piles = profilage.piles(profils[0])
+    assert sum(piles.values()) == profils[0].echantillons > 0
+    assert any("villes_autocomplete" in pile for pile in piles)
+
+    client.force_login(staff)
+    liste = client.get(reverse("admin:base_profilrequete_changelist"))
+    assert liste.status_code == 200 and profilage.ENTETE.encode() in liste.content
+    svg = client.get(reverse("admin:base_profilrequete_flamegraph", args=[profils[0].pk]))
+    assert svg["Content-Type"] == "image/svg+xml" and svg.content.startswith(b"<svg")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_banc_essai_reports_throughput_latency_and_queries(settings, tmp_path):
+    from shop import synthetique
+
+    from base import banc
+
+    settings.MEDIA_ROOT = tmp_path
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    synthetique.generer(graine=3, categories=2, sous_categories=2, etablissements=2, produits=50, clients=5,
+                        paniers=0, commandes=30, favoris=0)
+
+    rapport = banc.lancer(banc.CibleWSGI(), ["index", "produit", "panier", "paiement"], concurrence=2, duree=0.3)
+    assert rapport["cible"] == "wsgi" and rapport["concurrence"] == 2
+    assert set(rapport["points"]) == {"index", "product_detail", "add_to_cart", "update_cart", "add_coupon",
+                                      "delete_from_cart", "paiement_detail"}
+    index = rapport["points"]["index"]
+    assert index["requetes"] > 0 and index["rps"] > 0 and index["statuts"] == {"200": index["requetes"]}
+    assert index["requetes_sql"] > 0
+    assert index["latence_ms"]["p50"] <= index["latence_ms"]["p99"] <= index["latence_ms"]["max"]
+    assert rapport["points"]["paiement_detail"]["statuts"].get("200")
+    assert rapport["rss_max_mo"] > 0
+
+    lignes = banc.comparer(rapport, dict(rapport, points={"index": index}))
+    assert any(ligne.startswith("index") and "(+0 %)" in ligne for ligne in lignes)
+    assert any(ligne.startswith("add_coupon") and "absent après" in ligne for ligne in lignes)
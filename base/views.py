@@ -1,6 +1,39 @@
+import hmac
+
+from django.conf import settings
+from django.contrib import admin
+from django.http import HttpResponse, HttpResponseForbidden
 from django.shortcuts import render
 
+from . import metriques, requetes
+
 # Create your views here.
 
 
+def resume_requetes(request):
+    """Page d'administration : requêtes SQL par vue, d'après le journal de base.requetes."""
+    return render(request, 'admin/requetes.html', {
+        **admin.site.each_context(request),
+        'title': 'Requêtes SQL par vue',
+        'vues': requetes.resume(),
+        'journal': requetes.fichier_journal(),
+    })
+
+
+def _jeton_metriques(request):
+    # Jeton relu à chaque appel (réglage METRIQUES_JETON) ; sans jeton configuré, aucun n'est accepté
+    jeton = getattr(settings, 'METRIQUES_JETON', None)
+    schema, _, valeur = request.META.get('HTTP_AUTHORIZATION', '').partition(' ')
+    return bool(jeton) and schema.lower() == 'bearer' and hmac.compare_digest(
+        valeur.strip().encode('utf-8'), jeton.encode('utf-8'))
+
+
+def metrics(request):
+    """Métriques de tous les workers au format texte Prometheus (jeton du scrapeur ou équipe).
 
+    L'adresse du client n'est pas un critère : derrière le proxy local, toutes
+    les requêtes arrivent de 127.0.0.1.
+    """
+    if not _jeton_metriques(request) and not request.user.is_staff:
+        return HttpResponseForbidden()
+    return HttpResponse(metriques.exposition(metriques.lire()), content_type='text/plain; version=0.0.4; charset=utf-8')
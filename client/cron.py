@@ -0,0 +1,13 @@
+from django_cron import CronJobBase, Schedule
+from client import recus
+
+
+class PurgeRecusCronJob(CronJobBase):
+    RUN_AT_TIMES = ['03:00']  # Chaque nuit
+
+    schedule = Schedule(run_at_times=RUN_AT_TIMES)
+    code = 'client.purge_recus'
+
+    def do(self):
+        count, taille = recus.purger()
+        print(f"{count} reçus PDF supprimés du cache ({taille} octets libérés).")
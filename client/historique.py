@@ -0,0 +1,70 @@
+import datetime
+import re
+
+from django.db.models import Exists, OuterRef, Prefetch, Q
+from django.utils import timezone
+
+from customer.models import Commande, ProduitPanier
+from shop import search
+
+
+# Historique des commandes d'un client : une requête pour les commandes, une
+# pour toutes leurs lignes (produit et établissement compris), quel que soit
+# le nombre de commandes affichées.
+FORMATS_DATE = (
+    (re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$'), lambda j, m, a: (a, m, j)),
+    (re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$'), lambda a, m, j: (a, m, j)),
+    (re.compile(r'^(\d{1,2})/(\d{4})$'), lambda m, a: (a, m, None)),
+    (re.compile(r'^(\d{4})-(\d{1,2})$'), lambda a, m: (a, m, None)),
+    (re.compile(r'^(\d{4})$'), lambda a: (a, None, None)),
+)
+
+
+def commandes_client(customer):
+    lignes = ProduitPanier.objects.select_related('produit__etablissement').order_by('id')
+    return Commande.objects.filter(customer=customer).prefetch_related(
+        Prefetch('produit_commande', queryset=lignes, to_attr='lignes'),
+    ).order_by('-date_add', '-id')
+
+
+def periode(texte):
+    """(début, fin) de la journée, du mois ou de l'année saisi(e), ou None si ce n'est pas une date."""
+    texte = (texte or '').strip()
+    for motif, ordre in FORMATS_DATE:
+        trouve = motif.match(texte)
+        if not trouve:
+            continue
+        annee, mois, jour = (int(v) if v else None for v in ordre(*trouve.groups()))
+        try:
+            if jour:
+                debut = datetime.date(annee, mois, jour)
+                fin = debut + datetime.timedelta(days=1)
+            elif mois:
+                debut = datetime.date(annee, mois, 1)
+                fin = datetime.date(annee + mois // 12, mois % 12 + 1, 1)
+            else:
+                debut, fin = datetime.date(annee, 1, 1), datetime.date(annee + 1, 1, 1)
+        except ValueError:
+            return None
+        return tuple(timezone.make_aware(datetime.datetime.combine(d, datetime.time.min)) for d in (debut, fin))
+    return None
+
+
+def rechercher(commandes, texte):
+    """Filtre les commandes par période (si `texte` est une date), sinon par identifiant ou produit."""
+    texte = (texte or '').strip()
+    if not texte:
+        return commandes
+
+    bornes = periode(texte)
+    if bornes:
+        return commandes.filter(date_add__gte=bornes[0], date_add__lt=bornes[1])
+
+    # Recherche sur le nom des seuls produits que le client a commandés : un
+    # plafond global sur tout le catalogue laisserait ses produits hors fenêtre
+    filtre = Q(transaction_id=texte) | Q(id_paiment=texte)
+    achetes = ProduitPanier.objects.filter(commande__in=commandes.order_by().values('pk')).values('produit_id')
+    produits = search.ids_produits(texte, limite=None, nom_seulement=True, parmi=achetes)
+    if produits:
+        filtre |= Exists(ProduitPanier.objects.filter(commande=OuterRef('pk'), produit_id__in=produits))
+    return commandes.filter(filtre)
@@ -0,0 +1,139 @@
+import logging
+import queue
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from playwright.sync_api import sync_playwright
+
+
+logger = logging.getLogger(__name__)
+
+# Service de rendu PDF des reçus : quelques threads possèdent chacun un
+# Chromium lancé une seule fois et une page réutilisée d'un rendu à l'autre.
+# Les vues déposent le HTML dans une file bornée et attendent le résultat.
+WORKERS = getattr(settings, 'RECU_PDF_WORKERS', 2)
+FILE_MAX = getattr(settings, 'RECU_PDF_FILE_MAX', 20)
+TIMEOUT = getattr(settings, 'RECU_PDF_TIMEOUT', 30)
+RENDUS_AVANT_RECYCLAGE = getattr(settings, 'RECU_PDF_RENDUS_AVANT_RECYCLAGE', 500)
+
+OPTIONS_PDF = {
+    'format': 'A4',
+    'print_background': True,
+    'margin': {'top': '10mm', 'right': '10mm', 'bottom': '10mm', 'left': '10mm'},
+}
+
+
+class RenduIndisponible(Exception):
+    """Le service est saturé ou n'a pas répondu à temps."""
+
+
+class _Navigateur:
+    """Un Chromium et sa page, propres à un thread de rendu."""
+
+    def __init__(self):
+        self.playwright = None
+        self.browser = None
+        self.page = None
+        self.rendus = 0
+
+    def en_bonne_sante(self):
+        return (
+            self.browser is not None and self.browser.is_connected()
+            and self.page is not None and not self.page.is_closed()
+            and self.rendus < RENDUS_AVANT_RECYCLAGE
+        )
+
+    def demarrer(self):
+        self.arreter()
+        self.playwright = sync_playwright().start()
+        self.browser = self.playwright.chromium.launch()
+        self.page = self.browser.new_page()
+        self.page.set_default_timeout(TIMEOUT * 1000)
+        self.rendus = 0
+
+    def arreter(self):
+        try:
+            if self.browser is not None:
+                self.browser.close()
+            if self.playwright is not None:
+                self.playwright.stop()
+        except Exception:
+            logger.exception("Fermeture du navigateur de rendu PDF impossible")
+        self.playwright = self.browser = self.page = None
+
+    def rendre(self, html):
+        if not self.en_bonne_sante():
+            self.demarrer()
+        self.page.set_content(html, wait_until="load")
+        pdf = self.page.pdf(**OPTIONS_PDF)
+        self.rendus += 1
+        return pdf
+
+
+class ServiceRendu:
+
+    def __init__(self, workers=WORKERS, file_max=FILE_MAX):
+        self.workers = workers
+        self.file = queue.Queue(maxsize=file_max)
+        self.threads = []
+        self.verrou = threading.Lock()
+
+    def _boucle(self):
+        navigateur = _Navigateur()
+        while True:
+            html, future = self.file.get()
+            if html is None:
+                navigateur.arreter()
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(navigateur.rendre(html))
+            except Exception as e:
+                # Navigateur planté ou page bloquée : on repart d'un Chromium neuf
+                logger.exception("Échec du rendu PDF, redémarrage du navigateur")
+                navigateur.arreter()
+                future.set_exception(e)
+
+    def demarrer(self):
+        with self.verrou:
+            self.threads = [t for t in self.threads if t.is_alive()]
+            while len(self.threads) < self.workers:
+                thread = threading.Thread(target=self._boucle, name='rendu-pdf', daemon=True)
+                thread.start()
+                self.threads.append(thread)
+
+    def arreter(self):
+        with self.verrou:
+            for _ in self.threads:
+                self.file.put((None, None))
+            self.threads = []
+
+    def sante(self):
+        return {
+            'workers': sum(1 for t in self.threads if t.is_alive()),
+            'en_attente': self.file.qsize(),
+        }
+
+    def generer(self, html, timeout=TIMEOUT):
+        self.demarrer()
+        future = Future()
+        try:
+            self.file.put_nowait((html, future))
+        except queue.Full:
+            raise RenduIndisponible("Trop de reçus en cours de génération")
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise RenduIndisponible("Le rendu du reçu a expiré")
+        except Exception as e:
+            raise RenduIndisponible("Le rendu du reçu a échoué") from e
+
+
+service = ServiceRendu()
+
+
+def html_en_pdf(html, timeout=TIMEOUT):
+    return service.generer(html, timeout)
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.template.loader import get_template
+from django.utils.module_loading import import_string
+
+
+# Cache des reçus PDF adressé par contenu : la clé est l'empreinte de tout ce
+# qui apparaît sur le reçu (commande, lignes, infos du site, gabarit, URL du
+# QR code). Une commande modifiée change de clé et son reçu est régénéré ;
+# les anciens fichiers sont purgés par âge et par taille totale.
+TEMPLATE = 'receipt.html'
+DOSSIER = getattr(settings, 'RECU_PDF_CACHE_DIR', settings.MEDIA_ROOT / 'recus')
+TAILLE_MAX = getattr(settings, 'RECU_PDF_CACHE_TAILLE_MAX', 500 * 1024 * 1024)
+AGE_MAX = getattr(settings, 'RECU_PDF_CACHE_AGE_MAX', 30 * 24 * 3600)
+
+_version_gabarit = None
+
+
+def stockage():
+    classe = getattr(settings, 'RECU_PDF_STORAGE', None)
+    if classe:
+        return import_string(classe)()
+    return FileSystemStorage(location=DOSSIER)
+
+
+def version_gabarit():
+    global _version_gabarit
+    if _version_gabarit is None:
+        origine = get_template(TEMPLATE).origin.name
+        with open(origine, 'rb') as f:
+            _version_gabarit = hashlib.sha256(f.read()).hexdigest()[:16]
+    return _version_gabarit
+
+
+def cle_recu(commande, lignes, infos, url_detail):
+    contenu = {
+        'gabarit': version_gabarit(),
+        'commande': [commande.id, commande.id_paiment, commande.transaction_id,
+                     commande.prix_total, commande.status, commande.date_add.isoformat()],
+        'lignes': [[l.id, l.produit_id, l.produit.nom, l.quantite, l.produit.prix, l.prix_unitaire, l.total] for l in lignes],
+        'site': [infos.id, infos.date_update.isoformat(), infos.logo.name] if infos else None,
+        'qr': url_detail,
+    }
+    return hashlib.sha256(json.dumps(contenu, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def chemin(cle):
+    return '%s/%s.pdf' % (cle[:2], cle)
+
+
+def ouvrir(cle, storage=None):
+    """Fichier du reçu en cache, ouvert en lecture, ou None."""
+    storage = storage or stockage()
+    if not storage.exists(chemin(cle)):
+        return None
+    return storage.open(chemin(cle), 'rb')
+
+
+def enregistrer(cle, pdf, storage=None):
+    storage = storage or stockage()
+    if not storage.exists(chemin(cle)):
+        storage.save(chemin(cle), ContentFile(pdf))
+
+
+def purger(taille_max=TAILLE_MAX, age_max=AGE_MAX, storage=None):
+    """Supprime les reçus trop anciens puis les plus anciens au-delà de `taille_max`.
+
+    Retourne (nombre de fichiers supprimés, octets libérés).
+    """
+    storage = storage or stockage()
+    fichiers = []
+    try:
+        dossiers, _ = storage.listdir('')
+    except FileNotFoundError:
+        return 0, 0
+    for dossier in dossiers:
+        for nom in storage.listdir(dossier)[1]:
+            nom = '%s/%s' % (dossier, nom)
+            fichiers.append((storage.get_modified_time(nom).timestamp(), storage.size(nom), nom))
+
+    fichiers.sort()
+    limite = time.time() - age_max
+    total = sum(taille for _, taille, _ in fichiers)
+    supprimes = liberes = 0
+    for modifie, taille, nom in fichiers:
+        if modifie >= limite and total <= taille_max:
+            break
+        storage.delete(nom)
+        total -= taille
+        supprimes += 1
+        liberes += taille
+    return supprimes, liberes
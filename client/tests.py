@@ -3,6 +3,8 @@
 
 import base64
 
+import pytest
+
 from client.utils import qrcode_base64
 
 
@@ -11,3 +13,181 @@ def test_qrcode_base64_returns_png():
     encoded = qrcode_base64(data)
     decoded = base64.b64decode(encoded)
     assert decoded.startswith(b"\x89PNG")
+
+
+def test_pdf_service_reuses_workers_and_bounds_its_queue(monkeypatch):
+    import threading
+    import time
+
+    import pytest
+
+    from client import pdf
+
+    debloquer = threading.Event()
+    rendus = []
+
+    def rendre(self, html):
+        debloquer.wait(5)
+        if html == "panne":
+            raise RuntimeError("navigateur planté")
+        rendus.append(html)
+        return b"%PDF-" + html.encode()
+
+    monkeypatch.setattr(pdf._Navigateur, "rendre", rendre)
+    service = pdf.ServiceRendu(workers=1, file_max=1)
+    try:
+        debloquer.set()
+        assert service.generer("<p>1</p>") == b"%PDF-<p>1</p>"
+        with pytest.raises(pdf.RenduIndisponible):
+            service.generer("panne")
+        assert service.generer("<p>2</p>") == b"%PDF-<p>2</p>"
+        assert service.sante()["workers"] == 1
+
+        debloquer.clear()
+        occupe = threading.Thread(target=service.generer, args=("<p>3</p>",))
+        occupe.start()
+        while service.file.qsize():
+            time.sleep(0.01)
+        service.file.put_nowait(("<p>4</p>", pdf.Future()))
+        with pytest.raises(pdf.RenduIndisponible):
+            service.generer("<p>5</p>", timeout=1)
+        debloquer.set()
+        occupe.join()
+    finally:
+        debloquer.set()
+        service.arreter()
+
+
+def test_recus_cache_keyed_on_content_and_purged(tmp_path):
+    import datetime
+    import os
+    import time
+    from types import SimpleNamespace
+
+    from django.core.files.storage import FileSystemStorage
+
+    from client import recus
+
+    storage = FileSystemStorage(location=tmp_path)
+    commande = SimpleNamespace(id=1, id_paiment='P1', transaction_id='T1', prix_total=2000.0,
+                               status=True, date_add=datetime.datetime(2024, 1, 1))
+    ligne = SimpleNamespace(id=1, produit_id=3, produit=SimpleNamespace(nom='Pizza', prix=1000.0),
+                            quantite=2, prix_unitaire=1000.0, total=2000.0)
+
+    cle = recus.cle_recu(commande, [ligne], None, 'http://x/recu/1/')
+    assert cle == recus.cle_recu(commande, [ligne], None, 'http://x/recu/1/')
+    assert recus.ouvrir(cle, storage) is None
+
+    recus.enregistrer(cle, b'%PDF-1', storage)
+    with recus.ouvrir(cle, storage) as f:
+        assert f.read() == b'%PDF-1'
+
+    # Toute modification visible sur le reçu change la clé
+    ligne.quantite = 3
+    autre = recus.cle_recu(commande, [ligne], None, 'http://x/recu/1/')
+    assert autre != cle
+    recus.enregistrer(autre, b'%PDF-22', storage)
+
+    ancien = time.time() - 3600
+    os.utime(storage.path(recus.chemin(cle)), (ancien, ancien))
+    assert recus.purger(taille_max=10 ** 6, age_max=60, storage=storage) == (1, 6)
+    assert recus.ouvrir(cle, storage) is None
+    assert recus.purger(taille_max=0, age_max=60, storage=storage) == (1, 7)
+
+
+@pytest.mark.django_db
+def test_commande_history_loads_lines_in_constant_queries(client, django_assert_max_num_queries):
+    from django.contrib.auth.models import User
+    from django.urls import reverse
+    from django.utils import timezone
+
+    from customer.commandes import passer_commande
+    from customer.models import Commande, Customer, Panier, ProduitPanier
+    from shop.models import CategorieEtablissement, CategorieProduit, Etablissement, Produit
+
+    vendeur = User.objects.create_user(username="vendeur", password="pwd")
+    cat_etab = CategorieEtablissement.objects.create(nom="Cat", description="Desc")
+    cat_prod = CategorieProduit.objects.create(nom="ProdCat", description="Desc", categorie=cat_etab)
+    etab = Etablissement.objects.create(
+        user=vendeur, nom="Etab", description="Desc", logo="logo.png", couverture="cov.png",
+        categorie=cat_etab, nom_du_responsable="Resp", prenoms_duresponsable="Pren",
+        adresse="Addr", pays="Pays", contact_1="000000", email="contact@test.com",
+    )
+    produits = [
+        Produit.objects.create(nom=nom, description="Desc", description_deal="Deal", prix=100.0,
+                               categorie=cat_prod, etablissement=etab)
+        for nom in ("Pizza royale", "Burger maison", "Salade")
+    ]
+    user = User.objects.create_user(username="acheteur", password="pwd")
+    customer = Customer.objects.create(user=user, adresse="Addr", contact_1="000000", photo="p.png")
+
+    def commander(nombre, lignes):
+        for i in range(nombre):
+            panier = Panier.objects.create(customer=customer)
+            for produit in produits[:lignes]:
+                ProduitPanier.objects.create(produit=produit, panier=panier, quantite=2)
+            passer_commande(panier.id, customer, transaction_id="TX-%d-%d" % (lignes, i))
+
+    client.force_login(user)
+    commander(2, 1)
+    with django_assert_max_num_queries(20) as petit:
+        client.get(reverse('commande'))
+    commander(15, 3)
+    with django_assert_max_num_queries(len(petit.captured_queries)):
+        response = client.get(reverse('commande'))
+    assert sum(len(d['produits']) for d in response.context['commandes_data']) == 30
+
+    def trouvees(q):
+        return client.get(reverse('commande'), {'q': q}).context['commandes_paginated'].paginator.count
+
+    assert trouvees("TX-3-4") == 1
+    assert trouvees("burger") == 15
+    assert trouvees(timezone.localdate().strftime("%d/%m/%Y")) == 17
+    assert trouvees("01/01/1999") == 0
+
+    commande = Commande.objects.get(transaction_id="TX-3-0")
+    response = client.get(reverse('commande-detail', args=[commande.id]))
+    assert len(response.context['produits_commande']) == 3
+
+
+@pytest.mark.django_db
+def test_commande_history_search_covers_only_the_customers_product_names(client):
+    from django.contrib.auth.models import User
+    from django.urls import reverse
+
+    from customer.commandes import passer_commande
+    from customer.models import Customer, Panier, ProduitPanier
+    from shop import search
+    from shop.models import CategorieEtablissement, CategorieProduit, Etablissement, Produit
+
+    vendeur = User.objects.create_user(username="vendeur", password="pwd")
+    cat_etab = CategorieEtablissement.objects.create(nom="Cat", description="Desc")
+    cat_prod = CategorieProduit.objects.create(nom="ProdCat", description="Desc", categorie=cat_etab)
+    etab = Etablissement.objects.create(
+        user=vendeur, nom="Etab", description="Desc", logo="logo.png", couverture="cov.png",
+        categorie=cat_etab, nom_du_responsable="Resp", prenoms_duresponsable="Pren",
+        adresse="Addr", pays="Pays", contact_1="000000", email="contact@test.com",
+    )
+    # Plus de 480 produits mieux classés que celui du client sur « pizza »
+    Produit.objects.bulk_create([
+        Produit(nom="Pizza %d" % i, slug="pizza-%d" % i, description="pizza " * 20, description_deal="pizza",
+                prix=100.0, categorie=cat_prod, etablissement=etab)
+        for i in range(500)
+    ])
+    search.reindexer()
+    achete = Produit.objects.create(nom="Pizza royale", description="Une longue description " * 30,
+                                    description_deal="Deal", prix=100.0, categorie=cat_prod, etablissement=etab)
+    salade = Produit.objects.create(nom="Salade", description="Idéale avec une pizza", description_deal="Deal",
+                                    prix=100.0, categorie=cat_prod, etablissement=etab)
+    assert achete.id not in search.ids_produits("pizza")
+
+    user = User.objects.create_user(username="acheteur", password="pwd")
+    customer = Customer.objects.create(user=user, adresse="Addr", contact_1="000000", photo="p.png")
+    for i, produit in enumerate((achete, salade)):
+        panier = Panier.objects.create(customer=customer)
+        ProduitPanier.objects.create(produit=produit, panier=panier, quantite=1)
+        passer_commande(panier.id, customer, transaction_id="TX-%d" % i)
+
+    client.force_login(user)
+    commandes = client.get(reverse('commande'), {'q': 'pizza'}).context['commandes_paginated']
+    assert [d.transaction_id for d in commandes] == ["TX-0"]
@@ -1,18 +1,19 @@
 from django.shortcuts import render, reverse, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
-from customer.models import Customer, Commande, ProduitPanier
+from customer.models import Customer, Commande
 from shop.models import  Favorite, Produit
 from django.core.paginator import Paginator
-from django.db.models import Q
 from cities_light.models import City
 from django.template.loader import render_to_string
-from django.http import HttpResponse
+from django.http import HttpResponse, FileResponse
 from .utils import render_to_pdf
 from .utils import qrcode_base64
 from website.models import SiteInfo
 import qrcode
-from playwright.sync_api import sync_playwright
+from .pdf import html_en_pdf, RenduIndisponible
+from . import recus
+from . import historique
 import base64
 from io import BytesIO
 
@@ -30,7 +31,7 @@ def profil(request):
         return redirect('index')
 
     # Récupérer les 5 dernières commandes de l'utilisateur (classées par date décroissante)
-    dernieres_commandes = Commande.objects.filter(customer=customer).order_by('-date_add')[:5]
+    dernieres_commandes = historique.commandes_client(customer)[:5]
 
     datas = {
         'user': user,
@@ -50,31 +51,23 @@ def commande(request):
     except:
         return redirect('index')
 
-    # Récupération de toutes les commandes de l'utilisateur
-    commandes = Commande.objects.filter(customer=customer).order_by('-date_add')
+    # Récupération de toutes les commandes de l'utilisateur, lignes comprises
+    commandes = historique.commandes_client(customer)
 
-    # Recherche par ID transaction, produit ou date
-    query = request.GET.get('q')
-    if query:
-        commandes = commandes.filter(
-            Q(transaction_id__icontains=query) |
-            Q(date_add__icontains=query) |
-            Q(produit_commande__produit__nom__icontains=query)
-        ).distinct()
+    # Recherche par date (jj/mm/aaaa, mm/aaaa, aaaa), ID transaction ou produit
+    query = request.GET.get('q', '').strip()
+    commandes = historique.rechercher(commandes, query)
 
     # Pagination : Limite à 10 articles par page
     paginator = Paginator(commandes, 10)  # 10 commandes par page
     page = request.GET.get('page')
     commandes_paginated = paginator.get_page(page)
 
-    # Récupération des produits associés aux commandes paginées
-    commandes_data = []
-    for commande in commandes_paginated:
-        produits_commande = ProduitPanier.objects.filter(commande=commande).select_related('produit')
-        commandes_data.append({
-            'commande': commande,
-            'produits': produits_commande,
-        })
+    # Les produits de la page sont chargés en une seule requête par le prefetch
+    commandes_data = [
+        {'commande': commande, 'produits': commande.lignes}
+        for commande in commandes_paginated
+    ]
 
     datas = {
         'user': user,
@@ -96,11 +89,9 @@ def commande_detail(request, commande_id):
     except:
         return redirect('index')
 
-    # Récupération de la commande sélectionnée
-    commande = get_object_or_404(Commande, id=commande_id, customer=customer)
-
-    # Récupération des produits associés à cette commande
-    produits_commande = ProduitPanier.objects.filter(commande=commande).select_related('produit')
+    # Récupération de la commande sélectionnée et de ses produits
+    commande = get_object_or_404(historique.commandes_client(customer), id=commande_id)
+    produits_commande = commande.lignes
 
     datas = {
         'user': user,
@@ -215,35 +206,35 @@ def invoice_pdf(request, order_id):
     if not hasattr(request.user, "customer") or order.customer_id != request.user.customer.id:
         return redirect("commande")
 
-    # 1. Générer le QR code en base64
-
+    filename = f"Recu_{order.transaction_id}.pdf"
+    lignes = list(order.produit_commande.select_related('produit').order_by('id'))
+    infos = SiteInfo.objects.order_by('-date_add').first()
     detail_url = request.build_absolute_uri(
         reverse("commande-reçu-detail", args=[order.id])  # ou une URL publique de vérif
     )
-    qr_b64 = qrcode_base64(detail_url)
 
-    # 2. Construire le HTML à partir du template
+    # 1. Reçu déjà généré pour exactement ce contenu : on le sert depuis le cache
+    cle = recus.cle_recu(order, lignes, infos, detail_url)
+    fichier = recus.ouvrir(cle)
+    if fichier is not None:
+        return FileResponse(fichier, as_attachment=True, filename=filename, content_type="application/pdf")
+
+    # 2. Sinon, QR code + HTML à partir du template
     html = render_to_string("receipt.html", {
         "order_id": order,
-        "produits_commande": order.produit_commande.all(),
-        "qr_code": qr_b64,
-        "logo": request.build_absolute_uri(SiteInfo.objects.latest('date_add').logo.url)
+        "produits_commande": lignes,
+        "qr_code": qrcode_base64(detail_url),
+        "logo": request.build_absolute_uri(infos.logo.url) if infos else "",
     }, request=request)
 
-    # 3. Lancer Playwright et générer le PDF
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        page.set_content(html, wait_until="load")  # on imprime directement le HTML rendu
-        pdf_bytes = page.pdf(
-            format="A4",
-            print_background=True,
-            margin={"top": "10mm", "right": "10mm", "bottom": "10mm", "left": "10mm"}
-        )
-        browser.close()
+    # 3. Générer le PDF avec le service de rendu (navigateur persistant)
+    try:
+        pdf_bytes = html_en_pdf(html)
+    except RenduIndisponible:
+        return HttpResponse("Le reçu est momentanément indisponible, merci de réessayer.", status=503)
+    recus.enregistrer(cle, pdf_bytes)
 
     # 4. Forcer le téléchargement du PDF
-    filename = f"Recu_{order.transaction_id}.pdf"
     response = HttpResponse(pdf_bytes, content_type="application/pdf")
     response["Content-Disposition"] = f'attachment; filename="{filename}"'
     return response
@@ -0,0 +1,12 @@
+import pytest
+
+
+# Les fichiers d'exécution (journal des requêtes SQL, métriques des workers,
+# version de la configuration du site) vont dans le dossier temporaire de la
+# session pytest, pas dans logs/ et cache/ où le serveur de développement les lit.
+@pytest.fixture(autouse=True)
+def fichiers_d_execution(settings, tmp_path_factory):
+    dossier = tmp_path_factory.getbasetemp() / 'execution'
+    settings.REQUETES_JOURNAL = dossier / 'requetes.log'
+    settings.METRIQUES_DIR = dossier / 'metriques'
+    settings.SITE_CONFIG_VERSION = dossier / 'site_config.version'
@@ -83,20 +83,31 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'base.metriques.MetriquesMiddleware',
+    'base.profilage.ProfilageMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'base.requetes.RequetesMiddleware',
     "whitenoise.middleware.WhiteNoiseMiddleware",
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'base.auth.IdentiteMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedStaticFilesStorage'
+STATICFILES_STORAGE = 'base.assets.StockageStatique'
+STATICFILES_FINDERS = [
+    'django.contrib.staticfiles.finders.FileSystemFinder',
+    'django.contrib.staticfiles.finders.AppDirectoriesFinder',
+    'base.assets.LotsFinder',
+]
 
 CRON_CLASSES = [
     "customer.cron.CleanExpiredTokensCronJob",
+    "shop.cron.PromotionRolloverCronJob",
+    "shop.cron.LiberationReservationsCronJob",
+    "client.cron.PurgeRecusCronJob",
 ]
 
 
@@ -206,6 +217,9 @@ MEDIA_URL = '/media/'
 
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Médias rangés par empreinte de contenu : un fichier identique n'est stocké qu'une fois
+DEFAULT_FILE_STORAGE = 'base.storage.StockageDeduplique'
+
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
 # Default primary key field type
@@ -218,6 +232,34 @@ SILENCED_SYSTEM_CHECKS = ["security.W019"]
 
 LOGIN_URL = 'login'
 
+# Requêtes SQL par vue (base.requetes), une ligne JSON par requête HTTP
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'brut': {'format': '%(message)s'},
+    },
+    'handlers': {
+        'requetes': {
+            'class': 'base.requetes.JournalRotatif',  # fichier : REQUETES_JOURNAL (logs/requetes.log)
+            'maxBytes': 10 * 1024 * 1024,
+            'backupCount': 5,
+            'delay': True,
+            'formatter': 'brut',
+        },
+    },
+    'loggers': {
+        'cooldeal.requetes': {'handlers': ['requetes'], 'level': 'INFO', 'propagate': False},
+    },
+}
+
+# Utilisateur, profil client et établissement chargés en une requête jointe
+AUTHENTICATION_BACKENDS = ['base.auth.IdentiteBackend']
+
+# Jeton du scrapeur Prometheus pour /metrics (en-tête « Authorization: Bearer <jeton> ») ;
+# sans jeton, /metrics est réservé aux comptes de l'équipe.
+METRIQUES_JETON = os.environ.get('METRIQUES_JETON')
+
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = 'smtp.gmail.com'
 EMAIL_PORT = 587
@@ -20,10 +20,13 @@ from django.conf.urls.static import static
 from graphene_django.views import GraphQLView
 
 from .schema import schema
+from base.views import metrics, resume_requetes
 
 
 urlpatterns = [
+    path('admin/requetes/', admin.site.admin_view(resume_requetes), name='resume_requetes'),
     path('admin/', admin.site.urls),
+    path('metrics', metrics, name='metrics'),
     path('api-auth/', include('rest_framework.urls')),
     path('graphql/', GraphQLView.as_view(graphiql=False, schema=schema), name='graphql'),
     path('', include('website.urls')),
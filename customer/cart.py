@@ -0,0 +1,52 @@
+from django.core.cache import cache
+
+from . import models
+
+
+CART_CACHE_PREFIX = 'cart'
+CART_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def cart_cache_key(session_key):
+    return '%s:%s' % (CART_CACHE_PREFIX, session_key)
+
+
+def resolve_cart(request):
+    """Retourne le panier de la session courante, en le créant au besoin.
+
+    L'id du panier est mis en cache par clé de session : une fois résolu,
+    le panier ne coûte plus qu'une requête par page.
+    """
+    user_id = request.user.pk if request.user.is_authenticated else None
+    session_key = request.session.session_key
+
+    if session_key:
+        cached = cache.get(cart_cache_key(session_key))
+        if cached is not None and cached[0] == user_id:
+            panier = models.Panier.objects.filter(id=cached[1]).first()
+            if panier is not None:
+                return panier
+
+    if session_key is None or not request.session.exists(session_key):
+        request.session.create()
+    session_key = request.session.session_key
+
+    if user_id is not None:
+        customer = request.user.customer
+        try:
+            panier = models.Panier.objects.get(customer=customer, session_id_id=session_key)
+        except models.Panier.DoesNotExist:
+            panier = models.Panier.objects.create(customer=customer, session_id_id=session_key)
+    else:
+        panier = models.Panier.objects.filter(session_id_id=session_key).first()
+        if panier is None:
+            panier = models.Panier.objects.create(session_id_id=session_key)
+
+    cache.set(cart_cache_key(session_key), (user_id, panier.id), CART_CACHE_TIMEOUT)
+    return panier
+
+
+def invalidate_cart(panier):
+    """Oublie le panier mis en cache pour sa session (modification ou suppression)."""
+    if panier is not None and panier.session_id_id:
+        cache.delete(cart_cache_key(panier.session_id_id))
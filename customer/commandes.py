@@ -0,0 +1,43 @@
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from shop import reception, stock, ventes
+from shop.models import Produit
+from . import models
+from .cart import invalidate_cart
+
+
+class PanierIndisponible(Exception):
+    """Le panier n'existe pas, n'appartient pas au client ou est vide."""
+
+
+def passer_commande(panier_id, customer, **champs):
+    """Transforme le panier en commande, en une transaction.
+
+    Le panier est verrouillé, son total calculé par un seul agrégat et ses
+    lignes déplacées vers la commande par un seul UPDATE qui fige aussi leur
+    prix unitaire : le coût ne dépend pas du nombre d'articles, et un échec
+    en cours de route laisse le panier intact.
+    """
+    with transaction.atomic():
+        panier = models.Panier.objects.select_for_update().filter(id=panier_id, customer=customer).first()
+        if panier is None or not panier.check_empty:
+            raise PanierIndisponible()
+        stock.confirmer(panier, models.ProduitPanier.objects.filter(panier=panier).values_list('produit_id', 'quantite'))
+
+        commande = models.Commande.objects.create(
+            customer=customer,
+            prix_total=panier.total_with_coupon,
+            **champs
+        )
+        models.ProduitPanier.objects.filter(panier=panier).update(
+            panier=None,
+            commande=commande,
+            prix_unitaire=Subquery(Produit.objects.filter(id=OuterRef('produit_id')).values('prix_effectif')[:1]),
+        )
+        ventes.enregistrer_commande(commande)
+        reception.indexer_commande(commande)
+        panier.delete()
+
+    invalidate_cart(panier)
+    return commande
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+def figer_prix_unitaire(apps, schema_editor):
+    # Les commandes passées avant ce champ n'ont pas gardé leur prix : on fige
+    # le prix effectif actuel, le plus proche disponible.
+    ProduitPanier = apps.get_model('customer', 'ProduitPanier')
+    Produit = apps.get_model('shop', 'Produit')
+    ProduitPanier.objects.filter(commande__isnull=False, prix_unitaire__isnull=True).update(
+        prix_unitaire=models.Subquery(
+            Produit.objects.filter(id=models.OuterRef('produit_id')).values('prix_effectif')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0018_produit_prix_effectif'),
+        ('customer', '0008_customer_ville'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='produitpanier',
+            name='prix_unitaire',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(figer_prix_unitaire, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.9 on 2026-10-18 18:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customer', '0009_produitpanier_prix_unitaire'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='commande',
+            name='id_paiment',
+            field=models.CharField(db_index=True, max_length=50, null=True),
+        ),
+        migrations.AlterField(
+            model_name='commande',
+            name='transaction_id',
+            field=models.TextField(db_index=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='commande',
+            index=models.Index(fields=['customer', '-date_add', '-id'], name='customer_commande_hist_idx'),
+        ),
+    ]
@@ -1,8 +1,12 @@
 from django.db import models
+from django.db.models import Count, F, Max, Sum
+from django.db.models.functions import Coalesce
+from django.utils.functional import cached_property
 from django.contrib.auth.models import User
 from django.contrib.sessions.models import Session
 from cinetpay_sdk.s_d_k import Cinetpay
 from shop import models as Produit
+from shop.models import prix_en_cours
 from django.utils.timezone import now
 from datetime import timedelta
 from cities_light.models import City
@@ -85,28 +89,37 @@ class Panier(models.Model):
         """Unicode representation of Panier."""
         return "panier"
 
+    @cached_property
+    def totaux(self):
+        """Sous-total, nombre de lignes et réduction du coupon en une seule requête.
+
+        Le résultat est mémorisé sur l'instance pour la durée de la requête.
+        """
+        totaux = Panier.objects.filter(id=self.id).aggregate(
+            sous_total=Sum(F('produit_panier__quantite') * prix_en_cours('produit_panier__produit__')),
+            lignes=Count('produit_panier'),
+            reduction=Max('coupon__reduction'),
+        )
+        totaux['sous_total'] = int(totaux['sous_total'] or 0)
+        totaux['reduction'] = totaux['reduction'] or 0
+        return totaux
+
+    @cached_property
+    def lignes(self):
+        return list(self.produit_panier.avec_totaux().order_by('id'))
+
     @property
     def total(self):
-        panier = Panier.objects.get(id=self.id)
-        sum = 0
-        for i in panier.produit_panier.all():
-            sum = sum + i.total
-        return int(sum)
+        return self.totaux['sous_total']
 
     @property
     def total_with_coupon(self):
-        reduction = 0
-        if self.coupon:
-            reduction = self.coupon.reduction * self.total
-        return int(self.total - reduction)
+        total = self.total
+        return int(total - self.totaux['reduction'] * total)
 
     @property
     def check_empty(self):
-        panier = Panier.objects.get(id=self.id)
-        if panier.produit_panier.count() > 0:
-            return True
-        else:
-            return False
+        return self.totaux['lignes'] > 0
 
 
 class Commande(models.Model):
@@ -114,10 +127,10 @@ class Commande(models.Model):
 
     # TODO: Define fields here
     customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name="user_commande", null=True)
-    id_paiment = models.CharField( max_length=50, null=True)
+    id_paiment = models.CharField( max_length=50, null=True, db_index=True)
     payment_token = models.CharField(max_length=250, null=True)
     payment_url = models.TextField(null=True)
-    transaction_id = models.TextField(null=True)
+    transaction_id = models.TextField(null=True, db_index=True)
     api_response_id = models.CharField(max_length=50, null=True)
     crypto = models.CharField(max_length=50, null=True)
     prix_total = models.FloatField()
@@ -131,6 +144,9 @@ class Commande(models.Model):
 
         verbose_name = 'Commande'
         verbose_name_plural = 'Commandes'
+        indexes = [
+            models.Index(fields=['customer', '-date_add', '-id'], name='customer_commande_hist_idx'),
+        ]
 
     def __str__(self):
         """Unicode representation of UserRessource."""
@@ -145,15 +161,27 @@ class Commande(models.Model):
             return False
 
 
+class ProduitPanierQuerySet(models.QuerySet):
+
+    def avec_totaux(self):
+        return self.select_related('produit').annotate(
+            total_ligne=F('quantite') * Coalesce('prix_unitaire', prix_en_cours('produit__')),
+        )
+
+
 class ProduitPanier(models.Model):
     produit = models.ForeignKey('shop.Produit', related_name="commande", on_delete=models.CASCADE)
     panier = models.ForeignKey(Panier, related_name="produit_panier", on_delete=models.CASCADE, null=True)
     commande = models.ForeignKey(Commande, related_name="produit_commande", on_delete=models.CASCADE, null=True)
     quantite = models.IntegerField(default=1)
+    # Prix unitaire figé au passage de la commande ; vide tant que la ligne est dans un panier
+    prix_unitaire = models.FloatField(null=True, blank=True, editable=False)
     date_add = models.DateTimeField(auto_now_add=True)
     date_update = models.DateTimeField(auto_now=True)
     status = models.BooleanField(default=True)
 
+    objects = ProduitPanierQuerySet.as_manager()
+
     class Meta:
         """Meta definition for UserRessource."""
 
@@ -162,6 +190,10 @@ class ProduitPanier(models.Model):
 
     @property
     def total(self):
+        if 'total_ligne' in self.__dict__:
+            return self.total_ligne
+        if self.prix_unitaire is not None:
+            return self.prix_unitaire * self.quantite
         if self.produit.check_promotion:
             return self.produit.prix_promotionnel * self.quantite
         else:
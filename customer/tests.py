@@ -66,3 +66,97 @@ def test_islogin_endpoint_rejects_invalid_credentials(client):
     assert response.status_code == 200
     data = response.json()
     assert data['success'] is False
+
+
+@pytest.mark.django_db
+def test_panier_totals_use_a_single_query(django_assert_num_queries):
+    from datetime import date, timedelta
+
+    from customer.models import CodePromotionnel, Panier, ProduitPanier
+    from shop.models import CategorieEtablissement, CategorieProduit, Etablissement, Produit
+
+    User = get_user_model()
+    user = User.objects.create_user(username="cartowner", password="pwd")
+    cat_etab = CategorieEtablissement.objects.create(nom="Cat", description="Desc")
+    cat_prod = CategorieProduit.objects.create(nom="ProdCat", description="Desc", categorie=cat_etab)
+    etab = Etablissement.objects.create(
+        user=user, nom="Etab", description="Desc", logo="logo.png", couverture="cov.png",
+        categorie=cat_etab, nom_du_responsable="Resp", prenoms_duresponsable="Pren",
+        adresse="Addr", pays="Pays", contact_1="000000", email="contact@test.com",
+    )
+    coupon = CodePromotionnel.objects.create(
+        libelle="Promo", etat=True, date_fin=date.today(), reduction=0.1, code_promo="PROMO10",
+    )
+    panier = Panier.objects.create(coupon=coupon)
+    for i in range(4):
+        en_promo = i % 2 == 0
+        produit = Produit.objects.create(
+            nom="Produit %d" % i, description="Desc", description_deal="Deal",
+            prix=100.0, prix_promotionnel=80.0, categorie=cat_prod, etablissement=etab,
+            date_debut_promo=date.today() - timedelta(days=1) if en_promo else None,
+            date_fin_promo=date.today() + timedelta(days=1) if en_promo else None,
+        )
+        ProduitPanier.objects.create(produit=produit, panier=panier, quantite=2)
+
+    panier = Panier.objects.get(id=panier.id)
+    with django_assert_num_queries(1):
+        assert panier.check_empty
+        assert panier.total == 2 * (80 + 100 + 80 + 100)
+        assert panier.total_with_coupon == int(720 - 0.1 * 720)
+
+    assert [ligne.total for ligne in panier.lignes] == [160, 200, 160, 200]
+    assert not Panier.objects.create().check_empty
+
+
+@pytest.mark.django_db
+def test_passer_commande_is_atomic_and_independent_of_cart_size(django_assert_max_num_queries, monkeypatch):
+    from customer import commandes
+    from customer.models import Commande, Customer, Panier, ProduitPanier
+    from shop.models import CategorieEtablissement, CategorieProduit, Etablissement, Produit
+
+    User = get_user_model()
+    user = User.objects.create_user(username="acheteur", password="pwd")
+    customer = Customer.objects.create(user=user, adresse="Addr", contact_1="000000")
+    cat_etab = CategorieEtablissement.objects.create(nom="Cat", description="Desc")
+    cat_prod = CategorieProduit.objects.create(nom="ProdCat", description="Desc", categorie=cat_etab)
+    etab = Etablissement.objects.create(
+        user=user, nom="Etab", description="Desc", logo="logo.png", couverture="cov.png",
+        categorie=cat_etab, nom_du_responsable="Resp", prenoms_duresponsable="Pren",
+        adresse="Addr", pays="Pays", contact_1="000000", email="contact@test.com",
+    )
+
+    def panier(lignes):
+        panier = Panier.objects.create(customer=customer)
+        for i in range(lignes):
+            produit = Produit.objects.create(
+                nom="Produit %d" % i, description="Desc", description_deal="Deal",
+                prix=100.0, prix_promotionnel=80.0, categorie=cat_prod, etablissement=etab,
+            )
+            ProduitPanier.objects.create(produit=produit, panier=panier, quantite=2)
+        return panier
+
+    petit, grand = panier(1), panier(30)
+    with django_assert_max_num_queries(18):
+        commandes.passer_commande(petit.id, customer, transaction_id="T1")
+    with django_assert_max_num_queries(18):
+        commande = commandes.passer_commande(grand.id, customer, transaction_id="T2")
+
+    assert commande.prix_total == 30 * 200
+    assert not Panier.objects.filter(id__in=[petit.id, grand.id]).exists()
+    assert commande.produit_commande.count() == 30
+
+    # Le prix est figé : une hausse ultérieure ne change pas le total de la ligne
+    Produit.objects.filter(etablissement=etab).update(prix=500.0, prix_effectif=500.0)
+    ligne = commande.produit_commande.first()
+    assert ligne.prix_unitaire == 100.0 and ligne.total == 200.0
+
+    # Un échec après le déplacement des lignes annule toute la commande
+    troisieme = panier(3)
+    monkeypatch.setattr(Panier, "delete", lambda self: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        commandes.passer_commande(troisieme.id, customer, transaction_id="T3")
+    assert troisieme.produit_panier.count() == 3
+    assert not Commande.objects.filter(transaction_id="T3").exists()
+
+    with pytest.raises(commandes.PanierIndisponible):
+        commandes.passer_commande(Panier.objects.create(customer=customer).id, customer)
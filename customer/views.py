@@ -18,6 +18,8 @@ from django.urls import reverse
 
 from django.contrib.auth.hashers import make_password
 from .models import PasswordResetToken
+from .cart import invalidate_cart
+from shop import stock
 from django.core.exceptions import ValidationError
 from django.utils.timezone import now
 
@@ -196,12 +198,18 @@ def add_to_cart(request):
         except Exception as e:
 
             produit_panier = models.ProduitPanier()
-        produit_panier.panier = panier
-        produit_panier.produit = produit
-        produit_panier.quantite = quantite
-        produit_panier.save()
-        isSuccess = True
-        message = "Produit ajouté au panier avec succès"
+        try:
+            stock.reserver(panier, produit.id, quantite)
+            produit_panier.panier = panier
+            produit_panier.produit = produit
+            produit_panier.quantite = quantite
+            produit_panier.save()
+            invalidate_cart(panier)
+            isSuccess = True
+            message = "Produit ajouté au panier avec succès"
+        except stock.StockInsuffisant:
+            isSuccess = False
+            message = "Stock insuffisant pour ce produit"
     else:
         isSuccess = False
         message = "Une erreur s'est produite"
@@ -222,8 +230,10 @@ def delete_from_cart(request):
 
     isSuccess = False
     if panier is not None and produit_panier is not None :
-        produit_panier = models.ProduitPanier.objects.get(id=produit_panier)
+        produit_panier = models.ProduitPanier.objects.select_related('panier').get(id=produit_panier)
+        stock.liberer(produit_panier.panier, produit_panier.produit_id)
         produit_panier.delete()
+        invalidate_cart(produit_panier.panier)
         isSuccess = True
         message = "Produit supprimé avec succès"
     else:
@@ -251,6 +261,7 @@ def add_coupon(request):
             panier = models.Panier.objects.get(id=panier)
             panier.coupon = coupon
             panier.save()
+            invalidate_cart(panier)
             isSuccess = True
             message = "Félicitations, vous avez ajouté un code coupon"
         except:
@@ -280,10 +291,16 @@ def update_cart(request):
         panier = models.Panier.objects.get(id=panier)
         produit = shop_models.Produit.objects.get(id=produit)
         produit_panier = models.ProduitPanier.objects.get(panier=panier, produit=produit)
-        produit_panier.quantite = quantite
-        produit_panier.save()
-        isSuccess = True
-        message = "Panier modifié avec succès"
+        try:
+            stock.reserver(panier, produit.id, quantite)
+            produit_panier.quantite = quantite
+            produit_panier.save()
+            invalidate_cart(panier)
+            isSuccess = True
+            message = "Panier modifié avec succès"
+        except stock.StockInsuffisant:
+            isSuccess = False
+            message = "Stock insuffisant pour ce produit"
     else:
         isSuccess = False
         message = "Une erreur s'est produite"
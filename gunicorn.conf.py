@@ -0,0 +1,10 @@
+import os
+
+
+def on_starting(server):
+    # Les fichiers de métriques des workers d'un précédent démarrage sont effacés
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cooldeal.settings')
+    import django
+    django.setup()
+    from base import metriques
+    metriques.vider()
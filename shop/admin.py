@@ -108,6 +108,8 @@ class ProduitAdmin(admin.ModelAdmin):
         'description_deal',
         'prix',
         'prix_promotionnel',
+        'prix_effectif',
+        'en_promotion',
         'date_debut_promo',
         'date_fin_promo',
         'categorie_etab',
@@ -125,6 +127,7 @@ class ProduitAdmin(admin.ModelAdmin):
     list_filter = (
         'date_debut_promo',
         'date_fin_promo',
+        'en_promotion',
         'categorie_etab',
         'categorie',
         'etablissement',
@@ -160,3 +163,27 @@ _register(models.CategorieEtablissement, CategorieEtablissementAdmin)
 _register(models.CategorieProduit, CategorieProduitAdmin)
 _register(models.Etablissement, EtablissementAdmin)
 _register(models.Produit, ProduitAdmin)
+
+
+class VenteJournaliereAdmin(admin.ModelAdmin):
+    list_display = ('id', 'etablissement', 'jour', 'commandes', 'chiffre_affaires', 'unites')
+    list_filter = ('jour', 'etablissement')
+    date_hierarchy = 'jour'
+
+_register(models.VenteJournaliere, VenteJournaliereAdmin)
+
+
+class CommandeRecueAdmin(admin.ModelAdmin):
+    list_display = ('id', 'etablissement', 'commande', 'date_add', 'status', 'client', 'montant')
+    list_filter = ('status', 'date_add', 'etablissement')
+    raw_id_fields = ('commande',)
+
+_register(models.CommandeRecue, CommandeRecueAdmin)
+
+
+class ReservationAdmin(admin.ModelAdmin):
+    list_display = ('id', 'produit', 'panier', 'quantite', 'expire_le', 'date_add')
+    list_filter = ('expire_le',)
+    raw_id_fields = ('produit', 'panier')
+
+_register(models.Reservation, ReservationAdmin)
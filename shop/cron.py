@@ -0,0 +1,25 @@
+from django_cron import CronJobBase, Schedule
+from shop.models import Produit
+from shop import stock
+
+
+class PromotionRolloverCronJob(CronJobBase):
+    RUN_AT_TIMES = ['00:05']  # Chaque nuit, juste après minuit
+
+    schedule = Schedule(run_at_times=RUN_AT_TIMES)
+    code = 'shop.promotion_rollover'
+
+    def do(self):
+        count = Produit.objects.rafraichir_promotions()
+        print(f"{count} produits ont changé de prix effectif.")
+
+
+class LiberationReservationsCronJob(CronJobBase):
+    RUN_EVERY_MINS = 5  # Les réservations durent STOCK_RESERVATION_MINUTES
+
+    schedule = Schedule(run_every_mins=RUN_EVERY_MINS)
+    code = 'shop.liberation_reservations'
+
+    def do(self):
+        count = stock.liberer_expirees()
+        print(f"{count} réservations expirées libérées.")
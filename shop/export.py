@@ -0,0 +1,209 @@
+import csv
+import datetime
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+from django.db.models import Value
+from django.db.models.functions import Coalesce, Concat
+from django.utils import timezone
+
+from customer.models import ProduitPanier
+from .models import prix_en_cours
+from . import reception
+
+
+# Export des lignes de commande en flux : les lignes sont lues par paquets avec
+# .iterator() et écrites au fur et à mesure (CSV, ou XLSX écrit directement en
+# zip sans tout garder en mémoire), pour servir un StreamingHttpResponse ou un
+# fichier depuis la commande `exporter_commandes`.
+PAQUET = 2000
+
+COLONNES = [
+    ('commande', 'Commande'),
+    ('date', 'Date'),
+    ('transaction', 'Transaction'),
+    ('paiement', 'Paiement'),
+    ('payee', 'Payée'),
+    ('client', 'Client'),
+    ('email', 'Email'),
+    ('etablissement', 'Établissement'),
+    ('produit', 'Produit'),
+    ('quantite', 'Quantité'),
+    ('prix_unitaire', 'Prix unitaire'),
+    ('montant', 'Montant'),
+]
+
+FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+}
+
+
+def _lignes(produits_commande):
+    valeurs = produits_commande.annotate(
+        prix=Coalesce('prix_unitaire', prix_en_cours('produit__')),
+        nom_client=Concat('commande__customer__user__first_name', Value(' '),
+                          'commande__customer__user__last_name'),
+    ).order_by('commande__date_add', 'commande_id', 'id').values_list(
+        'commande_id', 'commande__date_add', 'commande__transaction_id', 'commande__id_paiment',
+        'commande__status', 'nom_client', 'commande__customer__user__email', 'produit__etablissement__nom',
+        'produit__nom', 'quantite', 'prix',
+    )
+    for ligne in valeurs.iterator(chunk_size=PAQUET):
+        *debut, quantite, prix = ligne
+        yield debut + [quantite, prix, quantite * (prix or 0)]
+
+
+def lignes_etablissement(etablissement, **filtres):
+    """Lignes des commandes reçues par l'établissement, avec les filtres de la boîte de réception.
+
+    Seuls les produits de l'établissement apparaissent, pas ceux des autres vendeurs de la commande.
+    """
+    commandes = reception.commandes_recues(etablissement, **filtres).values('commande_id')
+    return _lignes(ProduitPanier.objects.filter(commande__in=commandes, produit__etablissement=etablissement))
+
+
+def lignes_toutes(status=None, date_min=None, date_max=None):
+    """Toutes les lignes de commande, pour la comptabilité."""
+    lignes = ProduitPanier.objects.filter(commande__isnull=False)
+    if status == "payée":
+        lignes = lignes.filter(commande__status=True)
+    elif status == "attente":
+        lignes = lignes.filter(commande__status=False)
+    debut, fin = reception._debut_du_jour(date_min), reception._debut_du_jour(date_max, 1)
+    if debut:
+        lignes = lignes.filter(commande__date_add__gte=debut)
+    if fin:
+        lignes = lignes.filter(commande__date_add__lt=fin)
+    return _lignes(lignes)
+
+
+def _texte(valeur):
+    if valeur is None:
+        return ''
+    if isinstance(valeur, bool):
+        return 'oui' if valeur else 'non'
+    if isinstance(valeur, datetime.datetime):
+        return timezone.localtime(valeur).strftime('%Y-%m-%d %H:%M:%S')
+    return valeur
+
+
+# Caractères qui font lire une cellule CSV comme une formule par Excel ou
+# LibreOffice ; ces cellules sont précédées d'une apostrophe (le XLSX, à chaînes
+# en ligne, n'est pas concerné)
+_FORMULE = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _texte_csv(valeur):
+    valeur = _texte(valeur)
+    if isinstance(valeur, str) and valeur.startswith(_FORMULE):
+        return "'" + valeur
+    return valeur
+
+
+class _Tampon:
+    """Fichier en écriture seule dont on récupère le contenu au fil de l'eau."""
+
+    def __init__(self):
+        self.morceaux = []
+
+    def write(self, donnees):
+        self.morceaux.append(donnees if isinstance(donnees, bytes) else donnees.encode('utf-8'))
+        return len(donnees)
+
+    def flush(self):
+        pass
+
+    def vider(self):
+        donnees = b''.join(self.morceaux)
+        self.morceaux = []
+        return donnees
+
+
+def en_csv(lignes, paquet=500):
+    """Flux CSV (bytes), entête compris ; le BOM permet à Excel de reconnaître l'UTF-8."""
+    tampon = _Tampon()
+    ecrivain = csv.writer(tampon, delimiter=';')
+    tampon.write('\ufeff')
+    ecrivain.writerow([titre for _, titre in COLONNES])
+    yield tampon.vider()
+    for i, ligne in enumerate(lignes, 1):
+        ecrivain.writerow([_texte_csv(v) for v in ligne])
+        if i % paquet == 0:
+            yield tampon.vider()
+    yield tampon.vider()
+
+
+_XLSX_FICHIERS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="xl/workbook.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Commandes" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+        '</Relationships>'
+    ),
+}
+
+
+_INTERDITS_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _cellule(valeur):
+    valeur = _texte(valeur)
+    if isinstance(valeur, (int, float)):
+        return '<c><v>%r</v></c>' % valeur
+    return '<c t="inlineStr"><is><t>%s</t></is></c>' % escape(_INTERDITS_XML.sub('', str(valeur)))
+
+
+def en_xlsx(lignes, paquet=500):
+    """Flux XLSX (bytes) : une feuille à chaînes en ligne, écrite dans un zip non seekable."""
+    tampon = _Tampon()
+    with zipfile.ZipFile(tampon, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for nom, contenu in _XLSX_FICHIERS.items():
+            archive.writestr(nom, contenu)
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as feuille:
+            feuille.write((
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+                '<row>%s</row>' % ''.join(_cellule(titre) for _, titre in COLONNES)
+            ).encode('utf-8'))
+            yield tampon.vider()
+            for i, ligne in enumerate(lignes, 1):
+                feuille.write(('<row>%s</row>' % ''.join(_cellule(v) for v in ligne)).encode('utf-8'))
+                if i % paquet == 0:
+                    yield tampon.vider()
+            feuille.write(b'</sheetData></worksheet>')
+    yield tampon.vider()
+
+
+def exporter(lignes, format):
+    return (en_xlsx if format == 'xlsx' else en_csv)(lignes)
+
+
+def nom_fichier(prefixe, format):
+    return '%s-%s.%s' % (prefixe, timezone.localdate().isoformat(), FORMATS[format][1])
@@ -0,0 +1,140 @@
+import random
+import threading
+import time
+import uuid
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection
+from django.db.models import Sum
+from django.utils import timezone
+
+from customer.commandes import PanierIndisponible, passer_commande
+from customer.models import Commande, Customer, Panier, ProduitPanier
+from shop import stock
+from shop.models import CategorieEtablissement, CategorieProduit, Etablissement, Produit, Reservation
+
+
+class Command(BaseCommand):
+    help = ("Test de charge du stock : des acheteurs simultanés se disputent un super deal "
+            "sur la base configurée, puis on vérifie qu'aucune unité n'a été survendue")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--acheteurs', type=int, default=200)
+        parser.add_argument('--stock', type=int, default=20)
+        parser.add_argument('--quantite-max', type=int, default=2)
+        parser.add_argument('--garder', action='store_true', help="Ne pas supprimer les données créées")
+
+    def handle(self, *args, **options):
+        prefixe = 'charge-%s' % uuid.uuid4().hex[:8]
+        vendeur = User.objects.create(username=prefixe)
+        try:
+            resultat = self.lancer(prefixe, vendeur, options)
+        finally:
+            if not options['garder']:
+                Commande.objects.filter(transaction_id__startswith=prefixe).delete()
+                User.objects.filter(username__startswith=prefixe).delete()
+                CategorieEtablissement.objects.filter(nom=prefixe).delete()
+
+        self.stdout.write(
+            "{acheteurs} acheteurs ({expirees} avec une réservation expirée), {reussies} commandes, "
+            "{refusees} refusées, {vendues} unités vendues sur {stock}, stock final {restant}, "
+            "{liberees} réservations libérées, {reessais} réessais, {duree:.2f}s".format(**resultat)
+        )
+        if (resultat['vendues'] > options['stock'] or resultat['restant'] < 0
+                or resultat['vendues'] + resultat['restant'] != options['stock'] or resultat['abandons']
+                or resultat['reserve'] != resultat['reservations']):
+            raise CommandError("Survente, réservations incohérentes ou acheteurs bloqués : %s" % resultat)
+        self.stdout.write(self.style.SUCCESS("Aucune survente."))
+
+    def lancer(self, prefixe, vendeur, options):
+        categorie = CategorieEtablissement.objects.create(nom=prefixe, description=prefixe)
+        etablissement = Etablissement.objects.create(
+            user=vendeur, nom=prefixe, description=prefixe, logo='logo.png', couverture='cov.png',
+            categorie=categorie, nom_du_responsable=prefixe, prenoms_duresponsable=prefixe, adresse=prefixe, pays=prefixe, contact_1='0', email='%s@example.com' % prefixe,
+        )
+        deal = Produit.objects.create(
+            nom=prefixe, description=prefixe, description_deal=prefixe, prix=1000, quantite=options['stock'],
+            super_deal=True, etablissement=etablissement,
+            categorie=CategorieProduit.objects.create(nom=prefixe, description=prefixe, categorie=categorie),
+        )
+
+        acheteurs, expirees = [], []
+        for i in range(options['acheteurs']):
+            user = User.objects.create(username='%s-%d' % (prefixe, i))
+            customer = Customer.objects.create(user=user, adresse=prefixe, contact_1='0')
+            panier = Panier.objects.create(customer=customer)
+            quantite = random.randint(1, options['quantite_max'])
+            ProduitPanier.objects.create(produit=deal, panier=panier, quantite=quantite)
+            # Un acheteur sur trois arrive avec une réservation déjà expirée (tant que
+            # le stock permet de la poser) : la libération des réservations expirées
+            # court en même temps que leurs commandes
+            if i % 3 == 0:
+                try:
+                    stock.reserver(panier, deal.id, quantite)
+                    expirees.append(panier.id)
+                except stock.StockInsuffisant:
+                    pass
+            acheteurs.append((customer, panier, quantite, i % 3 != 0))
+        Reservation.objects.filter(panier__in=expirees).update(expire_le=timezone.now() - stock.DUREE_RESERVATION)
+
+        depart = threading.Barrier(len(acheteurs) + 1)
+        verrou = threading.Lock()
+        compteurs = {'reussies': 0, 'refusees': 0, 'abandons': 0, 'reessais': 0, 'liberees': 0}
+
+        def compter(cle, n=1):
+            with verrou:
+                compteurs[cle] += n
+
+        def acheter(customer, panier, quantite, reserve):
+            depart.wait()
+            try:
+                for _ in range(1000):
+                    try:
+                        if reserve:
+                            stock.reserver(panier, deal.id, quantite)
+                        passer_commande(panier.id, customer, transaction_id='%s-%d' % (prefixe, panier.id))
+                        compter('reussies')
+                        return
+                    except (stock.StockInsuffisant, PanierIndisponible):
+                        compter('refusees')
+                        return
+                    except OperationalError:
+                        # Verrou ou interblocage côté base : on réessaie après une courte pause
+                        compter('reessais')
+                        time.sleep(random.uniform(0.001, 0.02))
+                compter('abandons')
+            finally:
+                connection.close()
+
+        def liberer():
+            depart.wait()
+            try:
+                for _ in range(1000):
+                    try:
+                        compter('liberees', stock.liberer_expirees())
+                        return
+                    except OperationalError:
+                        compter('reessais')
+                        time.sleep(random.uniform(0.001, 0.02))
+                compter('abandons')
+            finally:
+                connection.close()
+
+        debut = time.perf_counter()
+        threads = [threading.Thread(target=acheter, args=acheteur) for acheteur in acheteurs]
+        threads.append(threading.Thread(target=liberer))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        duree = time.perf_counter() - debut
+
+        deal.refresh_from_db()
+        vendues = sum(ProduitPanier.objects.filter(
+            produit=deal, commande__isnull=False).values_list('quantite', flat=True))
+        # Les unités retenues doivent correspondre exactement aux réservations restantes
+        reservations = Reservation.objects.filter(produit=deal).aggregate(n=Sum('quantite'))['n'] or 0
+        return dict(compteurs, acheteurs=len(acheteurs), expirees=len(expirees), stock=options['stock'],
+                    vendues=vendues, restant=deal.quantite, reserve=deal.quantite_reservee,
+                    reservations=reservations, duree=duree)
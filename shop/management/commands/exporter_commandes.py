@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from shop import export
+from shop.models import Etablissement
+
+
+class Command(BaseCommand):
+    help = ("Exporte les lignes de commande en CSV ou XLSX, en flux : toutes les commandes, "
+            "ou celles reçues par un établissement avec les filtres de sa boîte de réception")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=sorted(export.FORMATS), default='csv')
+        parser.add_argument('--sortie', help="Fichier de sortie (sortie standard par défaut)")
+        parser.add_argument('--etablissement', type=int, help="Id de l'établissement")
+        parser.add_argument('--client')
+        parser.add_argument('--produit')
+        parser.add_argument('--status', choices=['payée', 'attente'])
+        parser.add_argument('--date-min', help="AAAA-MM-JJ")
+        parser.add_argument('--date-max', help="AAAA-MM-JJ")
+
+    def handle(self, *args, **options):
+        filtres = {'status': options['status'], 'date_min': options['date_min'], 'date_max': options['date_max']}
+        if options['etablissement']:
+            try:
+                etablissement = Etablissement.objects.get(id=options['etablissement'])
+            except Etablissement.DoesNotExist:
+                raise CommandError("Établissement %s introuvable" % options['etablissement'])
+            lignes = export.lignes_etablissement(
+                etablissement, client=options['client'], produit=options['produit'], **filtres)
+        elif options['client'] or options['produit']:
+            raise CommandError("--client et --produit demandent --etablissement")
+        else:
+            lignes = export.lignes_toutes(**filtres)
+
+        flux = export.exporter(lignes, options['format'])
+        if options['sortie']:
+            with open(options['sortie'], 'wb') as sortie:
+                for morceau in flux:
+                    sortie.write(morceau)
+        elif options['format'] == 'csv':
+            for morceau in flux:
+                self.stdout.write(morceau.decode('utf-8'), ending='')
+        else:
+            raise CommandError("L'export XLSX demande --sortie")
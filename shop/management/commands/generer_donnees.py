@@ -0,0 +1,42 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from shop import synthetique
+
+
+class Command(BaseCommand):
+    help = ("Génère un jeu de données synthétique reproductible (catalogue, clients, paniers, commandes, "
+            "favoris) pour les tests de charge")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--graine', type=int, default=42)
+        parser.add_argument('--reference', help="Date de référence AAAA-MM-JJ (aujourd'hui par défaut)")
+        for nom, valeur in synthetique.ECHELLE.items():
+            parser.add_argument('--' + nom.replace('_', '-'), type=int, default=valeur)
+
+    def handle(self, *args, **options):
+        reference = None
+        if options['reference']:
+            try:
+                reference = timezone.make_aware(datetime.datetime.strptime(options['reference'], '%Y-%m-%d'))
+            except ValueError:
+                raise CommandError("Date de référence invalide : %s" % options['reference'])
+
+        debut = time.monotonic()
+        try:
+            comptes = synthetique.generer(
+                graine=options['graine'], reference=reference,
+                progression=lambda message: self.stdout.write('%6.1fs  %s' % (time.monotonic() - debut, message)),
+                **{nom: options[nom] for nom in synthetique.ECHELLE},
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        for nom, nombre in comptes.items():
+            self.stdout.write('%-18s %d' % (nom, nombre))
+        self.stdout.write(self.style.SUCCESS(
+            "%d lignes en %.0f s (mot de passe des comptes : %s)." % (
+                sum(comptes.values()), time.monotonic() - debut, synthetique.MOT_DE_PASSE)))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from shop import ventes
+
+
+class Command(BaseCommand):
+    help = "Reconstruit les cumuls de ventes journaliers des établissements depuis l'historique des commandes"
+
+    def add_arguments(self, parser):
+        parser.add_argument('etablissements', nargs='*', type=int, help="Ids des établissements (tous par défaut)")
+
+    def handle(self, *args, **options):
+        count = ventes.reconstruire(options['etablissements'] or None)
+        self.stdout.write(self.style.SUCCESS(f"{count} journées de ventes recalculées."))
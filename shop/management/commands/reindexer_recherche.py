@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from shop import search
+
+
+class Command(BaseCommand):
+    help = "Reconstruit l'index de recherche plein texte des produits"
+
+    def handle(self, *args, **options):
+        if search.moteur() is None:
+            self.stdout.write("Aucun index plein texte pour ce moteur de base de données.")
+            return
+        count = search.reindexer()
+        self.stdout.write(self.style.SUCCESS(f"{count} produits indexés."))
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.9 on 2026-10-18 18:00
+
+import datetime
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def remplir_prix_effectif(apps, schema_editor):
+    Produit = apps.get_model('shop', 'Produit')
+    today = datetime.date.today()
+    Produit.objects.update(prix_effectif=F('prix'))
+    Produit.objects.filter(date_debut_promo__lte=today, date_fin_promo__gte=today).update(
+        en_promotion=True, prix_effectif=F('prix_promotionnel'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0017_produit_quantite'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='produit',
+            name='en_promotion',
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='produit',
+            name='prix_effectif',
+            field=models.FloatField(db_index=True, default=0, editable=False),
+        ),
+        migrations.RunPython(remplir_prix_effectif, migrations.RunPython.noop),
+    ]
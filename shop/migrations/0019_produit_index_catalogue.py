@@ -0,0 +1,25 @@
+# Generated by Django 4.2.9 on 2026-10-18 18:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0018_produit_prix_effectif'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='produit',
+            index=models.Index(fields=['status', 'date_add'], name='shop_produi_status_2381d3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='produit',
+            index=models.Index(fields=['status', 'categorie', 'date_add'], name='shop_produi_status_ae7fab_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='produit',
+            index=models.Index(fields=['status', 'categorie_etab', 'date_add'], name='shop_produi_status_b25655_idx'),
+        ),
+    ]
@@ -0,0 +1,61 @@
+from django.db import migrations
+
+
+def creer_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS shop_produit_fts USING fts5("
+            "nom, description, description_deal, categorie, etablissement, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+        schema_editor.execute(
+            "INSERT INTO shop_produit_fts (rowid, nom, description, description_deal, categorie, etablissement) "
+            "SELECT p.id, p.nom, p.description, p.description_deal, "
+            "COALESCE(c.nom, '') || ' ' || COALESCE(ce.nom, ''), COALESCE(e.nom, '') "
+            "FROM shop_produit p "
+            "LEFT JOIN shop_categorieproduit c ON c.id = p.categorie_id "
+            "LEFT JOIN shop_categorieetablissement ce ON ce.id = p.categorie_etab_id "
+            "LEFT JOIN shop_etablissement e ON e.id = p.etablissement_id"
+        )
+    elif vendor == 'postgresql':
+        schema_editor.execute(
+            "CREATE TABLE IF NOT EXISTS shop_produit_recherche ("
+            "produit_id bigint PRIMARY KEY REFERENCES shop_produit (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+            "document tsvector NOT NULL)"
+        )
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS shop_produit_recherche_gin ON shop_produit_recherche USING GIN (document)"
+        )
+        schema_editor.execute(
+            "INSERT INTO shop_produit_recherche (produit_id, document) "
+            "SELECT p.id, "
+            "setweight(to_tsvector('french', p.nom), 'A') || "
+            "setweight(to_tsvector('french', COALESCE(c.nom, '') || ' ' || COALESCE(ce.nom, '') || ' ' || COALESCE(e.nom, '')), 'B') || "
+            "setweight(to_tsvector('french', p.description_deal), 'C') || "
+            "setweight(to_tsvector('french', p.description), 'D') "
+            "FROM shop_produit p "
+            "LEFT JOIN shop_categorieproduit c ON c.id = p.categorie_id "
+            "LEFT JOIN shop_categorieetablissement ce ON ce.id = p.categorie_etab_id "
+            "LEFT JOIN shop_etablissement e ON e.id = p.etablissement_id "
+            "ON CONFLICT (produit_id) DO NOTHING"
+        )
+
+
+def supprimer_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS shop_produit_fts")
+    elif vendor == 'postgresql':
+        schema_editor.execute("DROP TABLE IF EXISTS shop_produit_recherche")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0019_produit_index_catalogue'),
+    ]
+
+    operations = [
+        migrations.RunPython(creer_index, supprimer_index),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.2.9 on 2026-10-18 18:11
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce, TruncDate
+
+
+def remplir_ventes(apps, schema_editor):
+    ProduitPanier = apps.get_model('customer', 'ProduitPanier')
+    VenteJournaliere = apps.get_model('shop', 'VenteJournaliere')
+    cumuls = ProduitPanier.objects.filter(commande__isnull=False).annotate(
+        jour=TruncDate('commande__date_add'),
+    ).values('produit__etablissement', 'jour').annotate(
+        commandes=Count('commande', distinct=True),
+        chiffre_affaires=Sum(F('quantite') * Coalesce('prix_unitaire', 'produit__prix_effectif')),
+        unites=Sum('quantite'),
+    ).order_by()
+    VenteJournaliere.objects.bulk_create(
+        [VenteJournaliere(etablissement_id=c['produit__etablissement'], jour=c['jour'], commandes=c['commandes'],
+                          chiffre_affaires=c['chiffre_affaires'] or 0, unites=c['unites'] or 0)
+         for c in cumuls],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0020_produit_recherche'),
+        ('customer', '0009_produitpanier_prix_unitaire'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VenteJournaliere',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jour', models.DateField()),
+                ('commandes', models.PositiveIntegerField(default=0)),
+                ('chiffre_affaires', models.FloatField(default=0)),
+                ('unites', models.PositiveIntegerField(default=0)),
+                ('etablissement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ventes_journalieres', to='shop.etablissement')),
+            ],
+            options={
+                'verbose_name': 'Vente journalière',
+                'verbose_name_plural': 'Ventes journalières',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='ventejournaliere',
+            constraint=models.UniqueConstraint(fields=('etablissement', 'jour'), name='vente_journaliere_unique'),
+        ),
+        migrations.RunPython(remplir_ventes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 4.2.9 on 2026-10-18 18:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+import unicodedata
+
+
+def _normaliser(texte):
+    texte = unicodedata.normalize('NFKD', texte or '')
+    return ''.join(c for c in texte if not unicodedata.combining(c)).lower().strip()
+
+
+def remplir_commandes_recues(apps, schema_editor):
+    ProduitPanier = apps.get_model('customer', 'ProduitPanier')
+    CommandeRecue = apps.get_model('shop', 'CommandeRecue')
+    lignes = ProduitPanier.objects.filter(commande__isnull=False).order_by('commande_id', 'id').values_list(
+        'commande_id', 'commande__date_add', 'commande__status',
+        'commande__customer__user__first_name', 'commande__customer__user__last_name',
+        'produit__etablissement', 'produit__nom', 'quantite', 'prix_unitaire',
+    )
+    entrees = {}
+    for commande, date_add, status, prenom, nom, etablissement, produit, quantite, prix in lignes.iterator():
+        entree = entrees.setdefault((etablissement, commande), CommandeRecue(
+            etablissement_id=etablissement, commande_id=commande, date_add=date_add, status=status,
+            client=_normaliser('%s %s' % (prenom or '', nom or ''))[:254], produit=produit[:254],
+        ))
+        entree.montant += quantite * (prix or 0)
+    CommandeRecue.objects.bulk_create(entrees.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customer', '0009_produitpanier_prix_unitaire'),
+        ('shop', '0021_ventejournaliere'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CommandeRecue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date_add', models.DateTimeField()),
+                ('status', models.BooleanField(default=True)),
+                ('client', models.CharField(blank=True, default='', max_length=254)),
+                ('produit', models.CharField(blank=True, default='', max_length=254)),
+                ('montant', models.FloatField(default=0)),
+                ('commande', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='etablissements', to='customer.commande')),
+                ('etablissement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='commandes_recues', to='shop.etablissement')),
+            ],
+            options={
+                'verbose_name': 'Commande reçue',
+                'verbose_name_plural': 'Commandes reçues',
+                'indexes': [models.Index(fields=['etablissement', '-date_add', '-id'], name='shop_recue_date_idx'), models.Index(fields=['etablissement', 'status', '-date_add', '-id'], name='shop_recue_status_idx'), models.Index(fields=['etablissement', 'client'], name='shop_recue_client_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='commanderecue',
+            constraint=models.UniqueConstraint(fields=('etablissement', 'commande'), name='commande_recue_unique'),
+        ),
+        migrations.RunPython(remplir_commandes_recues, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.9 on 2026-10-18 18:17
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customer', '0010_commande_index_historique'),
+        ('shop', '0022_commanderecue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='produit',
+            name='quantite_reservee',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.CreateModel(
+            name='Reservation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantite', models.PositiveIntegerField()),
+                ('expire_le', models.DateTimeField(db_index=True)),
+                ('date_add', models.DateTimeField(auto_now_add=True)),
+                ('panier', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reservations', to='customer.panier')),
+                ('produit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reservations', to='shop.produit')),
+            ],
+            options={
+                'verbose_name': 'Réservation',
+                'verbose_name_plural': 'Réservations',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='reservation',
+            constraint=models.UniqueConstraint(fields=('panier', 'produit'), name='reservation_unique'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.9 on 2026-10-18 19:45
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0023_stock_reservations'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='commanderecue',
+            name='shop_recue_client_idx',
+        ),
+    ]
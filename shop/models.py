@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import F, Q
 from django.utils.text import slugify
 import datetime
 from django.contrib.sessions.models import Session
@@ -6,6 +7,36 @@ from django.contrib.auth.models import User
 from cities_light.models import City
 
 
+def promotion_en_cours(prefix=''):
+    """Équivalent SQL de `Produit.check_promotion` (prefix pour les jointures, ex. 'produit__')."""
+    today = datetime.date.today()
+    return Q(**{
+        prefix + 'date_debut_promo__lte': today,
+        prefix + 'date_fin_promo__gte': today,
+    })
+
+
+def prix_en_cours(prefix=''):
+    """Prix de vente du jour, lu dans la colonne dénormalisée `Produit.prix_effectif`."""
+    return F(prefix + 'prix_effectif')
+
+
+class ProduitQuerySet(models.QuerySet):
+
+    def rafraichir_promotions(self):
+        """Bascule `en_promotion`/`prix_effectif` des produits dont la promo commence ou se termine.
+
+        Deux UPDATE, sans charger les produits. Retourne le nombre de produits modifiés.
+        """
+        debut = self.filter(promotion_en_cours(), en_promotion=False).update(
+            en_promotion=True, prix_effectif=F('prix_promotionnel'),
+        )
+        fin = self.filter(en_promotion=True).exclude(promotion_en_cours()).update(
+            en_promotion=False, prix_effectif=F('prix'),
+        )
+        return debut + fin
+
+
 # Create your models here.
 class CategorieEtablissement(models.Model):
 
@@ -96,6 +127,8 @@ class Produit(models.Model):
     prix_promotionnel = models.FloatField(default=0)
     prix = models.FloatField()
     quantite = models.IntegerField(null=True, blank=True)
+    # Unités retenues par des paniers (réservations en cours), jamais réécrite par save()
+    quantite_reservee = models.PositiveIntegerField(default=0, editable=False)
     date_debut_promo = models.DateField(null=True, blank=True)
     date_fin_promo = models.DateField(null=True, blank=True)
     categorie_etab = models.ForeignKey(CategorieEtablissement, related_name="produit_etab", on_delete=models.CASCADE, null=True, blank=True)
@@ -105,16 +138,34 @@ class Produit(models.Model):
     image_2 = models.ImageField(upload_to='produis/images', default="b-1.jpg")
     image_3 = models.ImageField(upload_to='produis/images', default="b-1.jpg")
     super_deal = models.BooleanField(default=False)
+    prix_effectif = models.FloatField(default=0, db_index=True, editable=False)
+    en_promotion = models.BooleanField(default=False, db_index=True, editable=False)
 
     date_add = models.DateTimeField(auto_now_add=True)
     date_update = models.DateTimeField(auto_now=True)
     status = models.BooleanField(default=True)
     slug = models.SlugField(unique=True, editable=False, null=True,  blank=True)
 
+    objects = ProduitQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'date_add']),
+            models.Index(fields=['status', 'categorie', 'date_add']),
+            models.Index(fields=['status', 'categorie_etab', 'date_add']),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.slug or self.slug is None:
             self.slug = '-'.join((slugify(self.nom), slugify(datetime.datetime.now().microsecond)))
         self.categorie_etab = self.etablissement.categorie
+        self.en_promotion = self.check_promotion
+        self.prix_effectif = self.prix_promotionnel if self.en_promotion else self.prix
+        if not self._state.adding and not args and kwargs.get('update_fields') is None:
+            # Le compteur de réservations n'évolue que par UPDATE conditionnel (shop.stock)
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields if not f.primary_key and f.name != 'quantite_reservee'
+            ]
         super(Produit, self).save(*args, **kwargs)
 
     def __str__(self):
@@ -151,3 +202,75 @@ class Favorite(models.Model):
     def __str__(self):
         return f"{self.user.username} - {self.produit.nom}"
 
+
+
+class VenteJournaliere(models.Model):
+    """Ventes cumulées d'un établissement pour une journée, tenues à jour à chaque commande."""
+
+    etablissement = models.ForeignKey(Etablissement, related_name='ventes_journalieres', on_delete=models.CASCADE)
+    jour = models.DateField()
+    commandes = models.PositiveIntegerField(default=0)
+    chiffre_affaires = models.FloatField(default=0)
+    unites = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Vente journalière'
+        verbose_name_plural = 'Ventes journalières'
+        constraints = [
+            models.UniqueConstraint(fields=['etablissement', 'jour'], name='vente_journaliere_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.etablissement_id} - {self.jour}"
+
+
+class CommandeRecue(models.Model):
+    """Commande telle que la voit un établissement : une ligne par (commande, établissement).
+
+    Tenue à jour au passage de la commande, elle porte les colonnes de la boîte
+    de réception (date, statut, client normalisé) pour paginer et filtrer sans
+    parcourir les lignes de commande.
+    """
+
+    etablissement = models.ForeignKey(Etablissement, related_name='commandes_recues', on_delete=models.CASCADE)
+    commande = models.ForeignKey('customer.Commande', related_name='etablissements', on_delete=models.CASCADE)
+    date_add = models.DateTimeField()
+    status = models.BooleanField(default=True)
+    client = models.CharField(max_length=254, blank=True, default='')
+    produit = models.CharField(max_length=254, blank=True, default='')
+    montant = models.FloatField(default=0)
+
+    class Meta:
+        verbose_name = 'Commande reçue'
+        verbose_name_plural = 'Commandes reçues'
+        constraints = [
+            models.UniqueConstraint(fields=['etablissement', 'commande'], name='commande_recue_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['etablissement', '-date_add', '-id'], name='shop_recue_date_idx'),
+            models.Index(fields=['etablissement', 'status', '-date_add', '-id'], name='shop_recue_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.etablissement_id} - {self.commande_id}"
+
+
+class Reservation(models.Model):
+    """Unités d'un produit retenues par un panier jusqu'à `expire_le`."""
+
+    produit = models.ForeignKey(Produit, related_name='reservations', on_delete=models.CASCADE)
+    # SET_NULL : un panier supprimé avec sa session laisse la réservation au job de libération
+    panier = models.ForeignKey('customer.Panier', related_name='reservations', on_delete=models.SET_NULL, null=True)
+    quantite = models.PositiveIntegerField()
+    expire_le = models.DateTimeField(db_index=True)
+    date_add = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Réservation'
+        verbose_name_plural = 'Réservations'
+        constraints = [
+            models.UniqueConstraint(fields=['panier', 'produit'], name='reservation_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.produit_id} x {self.quantite}"
@@ -0,0 +1,88 @@
+import base64
+import datetime
+
+from django.db.models import Q
+
+
+PAR_PAGE = 12
+
+
+def encoder_curseur(sens, objet, champ='date_add'):
+    valeur = '%s|%s|%s' % (sens, getattr(objet, champ).isoformat(), objet.pk)
+    return base64.urlsafe_b64encode(valeur.encode()).decode()
+
+
+def decoder_curseur(curseur):
+    """Retourne (sens, valeur, pk) ou None si le curseur est absent ou invalide."""
+    try:
+        sens, valeur, pk = base64.urlsafe_b64decode(curseur.encode()).decode().split('|')
+        if sens not in ('n', 'p'):
+            return None
+        return sens, datetime.datetime.fromisoformat(valeur), int(pk)
+    except (AttributeError, ValueError, TypeError):
+        return None
+
+
+class PageCurseur:
+    """Page obtenue par pagination par curseur (keyset), du plus récent au plus ancien.
+
+    Contrairement à `Paginator`, aucune requête COUNT n'est faite et le coût d'une
+    page ne dépend pas de sa profondeur : le curseur est la clé (date, id) du
+    dernier élément affiché.
+    """
+
+    def __init__(self, object_list, has_next, has_previous, champ):
+        self.object_list = object_list
+        self.has_next_page = has_next
+        self.has_previous_page = has_previous
+        self.champ = champ
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.has_next_page
+
+    def has_previous(self):
+        return self.has_previous_page
+
+    def has_other_pages(self):
+        return self.has_next_page or self.has_previous_page
+
+    @property
+    def next_cursor(self):
+        if self.has_next_page and self.object_list:
+            return encoder_curseur('n', self.object_list[-1], self.champ)
+        return ''
+
+    @property
+    def previous_cursor(self):
+        if self.has_previous_page and self.object_list:
+            return encoder_curseur('p', self.object_list[0], self.champ)
+        return ''
+
+
+def paginer_par_curseur(queryset, curseur=None, par_page=PAR_PAGE, champ='date_add'):
+    position = decoder_curseur(curseur) if curseur else None
+
+    if position is None:
+        objets = list(queryset.order_by('-' + champ, '-pk')[:par_page + 1])
+        return PageCurseur(objets[:par_page], len(objets) > par_page, False, champ)
+
+    sens, valeur, pk = position
+    if sens == 'n':
+        objets = list(queryset.filter(
+            Q(**{champ + '__lt': valeur}) | Q(**{champ: valeur, 'pk__lt': pk})
+        ).order_by('-' + champ, '-pk')[:par_page + 1])
+        return PageCurseur(objets[:par_page], len(objets) > par_page, True, champ)
+
+    objets = list(queryset.filter(
+        Q(**{champ + '__gt': valeur}) | Q(**{champ: valeur, 'pk__gt': pk})
+    ).order_by(champ, 'pk')[:par_page + 1])
+    has_previous = len(objets) > par_page
+    objets = objets[:par_page]
+    objets.reverse()
+    return PageCurseur(objets, True, has_previous, champ)
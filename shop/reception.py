@@ -0,0 +1,77 @@
+import datetime
+
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from customer.models import ProduitPanier
+from website.villes import normaliser
+from .models import CommandeRecue, Produit
+
+
+# Boîte de réception des commandes d'un établissement, lue dans CommandeRecue :
+# pagination par curseur sur (date_add, id), filtre client sur le nom
+# normalisé, filtre produit par préfixe, comptage plafonné.
+PAR_PAGE = 25
+PLAFOND_COMPTE = 1000
+
+
+def indexer_commande(commande):
+    """Crée une entrée de boîte de réception par établissement concerné par la commande."""
+    user = commande.customer.user if commande.customer_id else None
+    client = normaliser('%s %s' % (user.first_name, user.last_name)) if user else ''
+
+    entrees = {}
+    lignes = ProduitPanier.objects.filter(commande=commande).order_by('id').values_list(
+        'produit__etablissement', 'produit__nom', 'quantite', 'prix_unitaire')
+    for etablissement, nom, quantite, prix in lignes:
+        entree = entrees.setdefault(etablissement, CommandeRecue(
+            etablissement_id=etablissement, commande=commande, date_add=commande.date_add,
+            status=commande.status, client=client[:254], produit=nom[:254],
+        ))
+        entree.montant += quantite * (prix or 0)
+    CommandeRecue.objects.bulk_create(entrees.values(), ignore_conflicts=True)
+
+
+def _debut_du_jour(valeur, decalage=0):
+    try:
+        jour = datetime.date.fromisoformat(valeur) + datetime.timedelta(days=decalage)
+    except (TypeError, ValueError):
+        return None
+    return timezone.make_aware(datetime.datetime.combine(jour, datetime.time.min))
+
+
+def commandes_recues(etablissement, client=None, produit=None, status=None, date_min=None, date_max=None):
+    commandes = CommandeRecue.objects.filter(etablissement=etablissement)
+
+    # Sous-chaîne du « prénom nom » normalisé : ni préfixe ni index, mais le
+    # parcours reste limité aux commandes de l'établissement, dans l'ordre de
+    # la page (index shop_recue_date_idx)
+    client = normaliser(client)
+    if client:
+        commandes = commandes.filter(client__contains=client)
+
+    produit = (produit or '').strip()
+    if produit:
+        produits = Produit.objects.filter(etablissement=etablissement, nom__istartswith=produit)
+        commandes = commandes.filter(Exists(ProduitPanier.objects.filter(
+            commande=OuterRef('commande_id'), produit__in=produits)))
+
+    if status == "payée":
+        commandes = commandes.filter(status=True)
+    elif status == "attente":
+        commandes = commandes.filter(status=False)
+
+    # Bornes en datetime plutôt que date_add__date, pour rester sur l'index
+    debut, fin = _debut_du_jour(date_min), _debut_du_jour(date_max, 1)
+    if debut:
+        commandes = commandes.filter(date_add__gte=debut)
+    if fin:
+        commandes = commandes.filter(date_add__lt=fin)
+
+    return commandes.select_related('commande__customer__user')
+
+
+def compter(commandes, plafond=PLAFOND_COMPTE):
+    """Nombre de commandes, ou `plafond` si elles sont plus nombreuses. Retourne (nombre, exact)."""
+    nombre = commandes.order_by()[:plafond + 1].count()
+    return min(nombre, plafond), nombre <= plafond
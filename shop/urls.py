@@ -7,6 +7,8 @@ urlpatterns = [
     path('produit/<str:slug>', views.product_detail, name="product_detail"),
     path('cart', views.cart, name="cart"),
     path('checkout', views.checkout, name="checkout"),
+    path('search', views.search, name="search"),
+    path('search/autocomplete', views.search_autocomplete, name="search_autocomplete"),
     path('<str:slug>', views.single, name="categorie"),
     path('paiement/success', views.paiement_success, name="paiement_success"),
     path('paiement/details', views.post_paiement_details, name="paiement_detail"),
@@ -18,5 +20,7 @@ urlpatterns = [
     path('supprimer-article/<int:article_id>/', views.supprimer_article, name='supprimer-article'),
     path('commande-reçu/', views.commande_reçu, name='commande-reçu'),
     path('commande-reçu-detail/<int:commande_id>/', views.commande_reçu_detail, name='commande-reçu-detail'),
+    path('commande-reçu/export.<str:format>', views.commande_reçu_export, name='commande-reçu-export'),
+    path('commandes/export.<str:format>', views.commandes_export, name='commandes-export'),
     path('etablissement-parametre/', views.etablissement_parametre, name='etablissement-parametre'),
 ]
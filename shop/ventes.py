@@ -0,0 +1,61 @@
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from customer.models import ProduitPanier
+from .models import VenteJournaliere
+
+
+# Cumuls de ventes par établissement et par jour (table VenteJournaliere).
+# Le chiffre d'affaires est la somme des lignes au prix figé, avant coupon :
+# une réduction porte sur toute la commande et n'appartient à aucun vendeur.
+def _par_etablissement(lignes, *champs):
+    return lignes.values('produit__etablissement', *champs).annotate(
+        chiffre_affaires=Sum(F('quantite') * Coalesce('prix_unitaire', 'produit__prix_effectif')),
+        unites=Sum('quantite'),
+    )
+
+
+def enregistrer_commande(commande):
+    """Ajoute la commande aux cumuls du jour de chaque établissement concerné.
+
+    À appeler dans la transaction qui crée la commande, une fois les lignes rattachées.
+    """
+    jour = timezone.localdate(commande.date_add)
+    cumuls = list(_par_etablissement(ProduitPanier.objects.filter(commande=commande)))
+    if not cumuls:
+        return
+
+    VenteJournaliere.objects.bulk_create(
+        [VenteJournaliere(etablissement_id=c['produit__etablissement'], jour=jour) for c in cumuls],
+        ignore_conflicts=True,
+    )
+    for c in cumuls:
+        VenteJournaliere.objects.filter(etablissement_id=c['produit__etablissement'], jour=jour).update(
+            commandes=F('commandes') + 1,
+            chiffre_affaires=F('chiffre_affaires') + (c['chiffre_affaires'] or 0),
+            unites=F('unites') + (c['unites'] or 0),
+        )
+
+
+def reconstruire(etablissements=None):
+    """Recalcule les cumuls depuis l'historique des commandes. Retourne le nombre de lignes créées."""
+    lignes = ProduitPanier.objects.filter(commande__isnull=False)
+    existants = VenteJournaliere.objects.all()
+    if etablissements is not None:
+        lignes = lignes.filter(produit__etablissement__in=etablissements)
+        existants = existants.filter(etablissement__in=etablissements)
+
+    cumuls = _par_etablissement(lignes.annotate(jour=TruncDate('commande__date_add')), 'jour').annotate(
+        commandes=Count('commande', distinct=True),
+    ).values_list('produit__etablissement', 'jour', 'commandes', 'chiffre_affaires', 'unites').order_by()
+
+    with transaction.atomic():
+        existants.delete()
+        ventes = VenteJournaliere.objects.bulk_create(
+            (VenteJournaliere(etablissement_id=e, jour=j, commandes=n, chiffre_affaires=ca or 0, unites=u or 0)
+             for e, j, n, ca, u in cumuls.iterator()),
+            batch_size=500,
+        )
+    return len(ventes)
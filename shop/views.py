@@ -2,29 +2,54 @@ from django.shortcuts import redirect, render,  get_object_or_404
 from . import models
 from customer import models as customer_models
 from django.contrib.auth.decorators import login_required
+from django.contrib.admin.views.decorators import staff_member_required
 import json
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from cinetpay_sdk.s_d_k import Cinetpay
 from cities_light.models import City
 
 from django.contrib import messages
-from .models import Produit, Favorite, Etablissement, CategorieProduit
+from .models import Produit, Favorite, CategorieProduit
 from customer.models import Commande
+from customer.commandes import passer_commande, PanierIndisponible
 
-from django.core.paginator import Paginator
+from .pagination import paginer_par_curseur
+from base.auth import etablissement_ou_404
+from . import search as search_engine
+from . import reception
+from . import export
 from django.utils import timezone
+from django.db.models import Prefetch, Q, Sum
+from datetime import timedelta
 
 
 # Create your views here.
 def shop(request):
-    produits = models.Produit.objects.filter(status=True)
+    produits = paginer_par_curseur(models.Produit.objects.filter(status=True), request.GET.get('curseur'))
     datas = {
         'produits' : produits
     }
     return render(request, 'shop.html', datas)
 
 
+def search(request):
+    query = request.GET.get('q', '').strip()
+    datas = {
+        'produits': search_engine.rechercher(query),
+        'recherche': query,
+    }
+    return render(request, 'shop.html', datas)
+
+
+def search_autocomplete(request):
+    query = request.GET.get('q', '').strip()
+    data = {
+        'resultats': search_engine.autocompleter(query),
+    }
+    return JsonResponse(data, safe=False)
+
+
 def product_detail(request, slug):
     produit = get_object_or_404(Produit, slug=slug)
     produits = Produit.objects.filter(categorie=produit.categorie).exclude(id=produit.id)[:3]
@@ -73,7 +98,8 @@ def checkout(request):
 @csrf_exempt
 def paiement_success(request):
     if request.user.is_authenticated:
-        commandes = customer_models.Commande.objects.filter(customer=request.user.customer)
+        commandes = customer_models.Commande.objects.filter(customer=request.user.customer).prefetch_related(
+            Prefetch('produit_commande', queryset=customer_models.ProduitPanier.objects.select_related('produit')))
 
         datas = {
             'commandes': commandes,
@@ -87,13 +113,15 @@ def single(request, slug):
     try:
         try:
             categorie = models.CategorieProduit.objects.get(slug=slug)
-            produits = categorie.produit.all()
+            produits = categorie.produit.filter(status=True)
         except:
             categorie = models.CategorieEtablissement.objects.get(slug=slug)
-            produits = categorie.produit_etab.all()
+            produits = categorie.produit_etab.filter(status=True)
     except:
         return redirect('shop')
 
+    produits = paginer_par_curseur(produits, request.GET.get('curseur'))
+
     datas = {
         'produits' : produits,
         'categorie' : categorie
@@ -116,48 +144,23 @@ def post_paiement_details(request):
     _ = isSuccess
     if user and panier is not None and transaction_id is not None and notify_url is not None and return_url is not None :
         try:
-            panier = customer_models.Panier.objects.get(id=panier, customer=user.customer)
-        except:
-            panier = None
-
-        if panier:
-            data = {
-                'amount': 100,
-                'currency': "XOF",
-                'transaction_id': transaction_id,
-                'description': "TRANSACTION DESCRIPTION",
-                'return_url': notify_url,
-                'notify_url': return_url,
-                'customer_name': user.first_name,
-                'customer_surname': user.last_name,
-            }
-
-            try:
-
-                commande = customer_models.Commande()
-                commande.customer = request.user.customer
-                commande.payment_url = 'payment_url'
-                commande.id_paiment = transaction_id
-                commande.transaction_id = transaction_id
-                commande.api_response_id = 'api_response_id'
-                commande.payment_token = 'payment_token'
-                commande.prix_total = panier.total_with_coupon
-                commande.save()
-
-                for i in customer_models.ProduitPanier.objects.filter(panier=panier):
-                    i.panier = None
-                    i.commande = commande
-                    i.save()
-                isSuccess = True
-                message = "Commande validée"
-                panier.delete()
-
-            except Exception as _:
-                isSuccess = False
-                message = "Une erreur s'est produite, merci de rééssayer"
-        else:
+            passer_commande(
+                panier,
+                user.customer,
+                payment_url='payment_url',
+                id_paiment=transaction_id,
+                transaction_id=transaction_id,
+                api_response_id='api_response_id',
+                payment_token='payment_token',
+            )
+            isSuccess = True
+            message = "Commande validée"
+        except PanierIndisponible:
             isSuccess = False
             message = "Une erreur s'est produite"
+        except Exception as _:
+            isSuccess = False
+            message = "Une erreur s'est produite, merci de rééssayer"
     else:
         isSuccess = False
         message = "Une erreur s'est produite"
@@ -172,20 +175,20 @@ def post_paiement_details(request):
 @login_required
 def dashboard(request):
     
-    etablissement = get_object_or_404(Etablissement, user=request.user)
+    etablissement = etablissement_ou_404(request)
 
     
     total_articles = Produit.objects.filter(etablissement=etablissement).count()
 
-    
-    today = timezone.now().date()
-    commandes_aujourdhui = Commande.objects.filter(
-        produit_commande__produit__etablissement=etablissement,
-        date_add__date=today
-    ).distinct().count()
-
-    
-    total_commandes = Commande.objects.filter(produit_commande__produit__etablissement=etablissement).distinct().count()
+    # Compteurs lus dans les cumuls journaliers (une ligne par jour de vente)
+    today = timezone.localdate()
+    cumuls = etablissement.ventes_journalieres.aggregate(
+        total_commandes=Sum('commandes'),
+        commandes_aujourdhui=Sum('commandes', filter=Q(jour=today)),
+    )
+    commandes_aujourdhui = cumuls['commandes_aujourdhui'] or 0
+    total_commandes = cumuls['total_commandes'] or 0
+    ventes_30_jours = etablissement.ventes_journalieres.filter(jour__gt=today - timedelta(days=30)).order_by('jour')
 
     
     derniers_articles = Produit.objects.filter(etablissement=etablissement).order_by("-date_add")[:5]
@@ -200,6 +203,7 @@ def dashboard(request):
         "total_commandes": total_commandes,
         "derniers_articles": derniers_articles,
         "dernieres_commandes": dernieres_commandes,
+        "ventes_30_jours": ventes_30_jours,
     }
 
     return render(request, "dashboard.html", context)
@@ -207,7 +211,7 @@ def dashboard(request):
 
 @login_required
 def ajout_article(request):
-    etablissement = get_object_or_404(Etablissement, user=request.user)
+    etablissement = etablissement_ou_404(request)
     categories = CategorieProduit.objects.all()
 
     if request.method == "POST":
@@ -246,8 +250,8 @@ def ajout_article(request):
 
 @login_required
 def article_detail(request):
-    etablissement = get_object_or_404(Etablissement, user=request.user)
-    articles = Produit.objects.filter(etablissement=etablissement)
+    etablissement = etablissement_ou_404(request)
+    articles = Produit.objects.filter(etablissement=etablissement).select_related('categorie')
 
     # Gestion des filtres
     search_query = request.GET.get("search", "")
@@ -272,7 +276,7 @@ def article_detail(request):
 
 @login_required
 def modifier_article(request, article_id):
-    etablissement = get_object_or_404(Etablissement, user=request.user)
+    etablissement = etablissement_ou_404(request)
     article = get_object_or_404(Produit, id=article_id, etablissement=etablissement)
     categories = CategorieProduit.objects.all()
 
@@ -307,7 +311,7 @@ def modifier_article(request, article_id):
 
 @login_required
 def supprimer_article(request, article_id):
-    etablissement = get_object_or_404(Etablissement, user=request.user)
+    etablissement = etablissement_ou_404(request)
     article = get_object_or_404(Produit, id=article_id, etablissement=etablissement)
 
     if request.method == "POST":
@@ -320,52 +324,79 @@ def supprimer_article(request, article_id):
 
 @login_required
 def commande_reçu(request):
-    etablissement = get_object_or_404(Etablissement, user=request.user)
-    commandes_list = Commande.objects.filter(produit_commande__produit__etablissement=etablissement).distinct().order_by('-date_add')
-
-    # 📌 Filtrage par client
-    client = request.GET.get("client")
-    if client:
-        commandes_list = commandes_list.filter(customer__user__first_name__icontains=client).order_by('-date_add')
-
-    # 📌 Filtrage par produit
-    produit = request.GET.get("produit")
-    if produit:
-        commandes_list = commandes_list.filter(produit_commande__produit__nom__icontains=produit).order_by('-date_add')
+    etablissement = etablissement_ou_404(request)
+
+    # 📌 Filtres : client, produit (par préfixe), statut et dates
+    commandes_list = reception.commandes_recues(
+        etablissement,
+        client=request.GET.get("client"),
+        produit=request.GET.get("produit"),
+        status=request.GET.get("status"),
+        date_min=request.GET.get("date_min"),
+        date_max=request.GET.get("date_max"),
+    )
+    total, total_exact = reception.compter(commandes_list)
+
+    commandes = paginer_par_curseur(commandes_list, request.GET.get("curseur"), par_page=reception.PAR_PAGE)
+    filtres = request.GET.copy()
+    filtres.pop("curseur", None)
+
+    return render(request, "commande-reçu.html", {
+        "commandes": commandes,
+        "etablissement": etablissement,
+        "total": total,
+        "total_exact": total_exact,
+        "filtres": filtres.urlencode(),
+    })
 
-    # 📌 Filtrage par statut
-    status = request.GET.get("status")
-    if status == "payée":
-        commandes_list = commandes_list.filter(status=True).order_by('-date_add')
-    elif status == "attente":
-        commandes_list = commandes_list.filter(status=False).order_by('-date_add')
 
-    # 📌 Filtrage par date
-    date_min = request.GET.get("date_min")
-    date_max = request.GET.get("date_max")
-    if date_min:
-        commandes_list = commandes_list.filter(date_add__gte=date_min).order_by('-date_add')
-    if date_max:
-        commandes_list = commandes_list.filter(date_add__lte=date_max).order_by('-date_add')
+def _export(lignes, format, prefixe):
+    if format not in export.FORMATS:
+        raise Http404
+    response = StreamingHttpResponse(export.exporter(lignes, format), content_type=export.FORMATS[format][0])
+    response["Content-Disposition"] = 'attachment; filename="%s"' % export.nom_fichier(prefixe, format)
+    return response
 
-    paginator = Paginator(commandes_list, 25)
-    page_number = request.GET.get("page")
-    commandes = paginator.get_page(page_number)
 
-    return render(request, "commande-reçu.html", {"commandes": commandes, "etablissement": etablissement})
+@login_required
+def commande_reçu_export(request, format):
+    etablissement = etablissement_ou_404(request)
+    lignes = export.lignes_etablissement(
+        etablissement,
+        client=request.GET.get("client"),
+        produit=request.GET.get("produit"),
+        status=request.GET.get("status"),
+        date_min=request.GET.get("date_min"),
+        date_max=request.GET.get("date_max"),
+    )
+    return _export(lignes, format, "commandes-%s" % (etablissement.slug or etablissement.id))
+
+
+@staff_member_required
+def commandes_export(request, format):
+    lignes = export.lignes_toutes(
+        status=request.GET.get("status"),
+        date_min=request.GET.get("date_min"),
+        date_max=request.GET.get("date_max"),
+    )
+    return _export(lignes, format, "commandes")
 
 
 @login_required
 def commande_reçu_detail(request, commande_id):
-    etablissement = get_object_or_404(Etablissement, user=request.user)
-    commande = get_object_or_404(Commande, id=commande_id, produit_commande__produit__etablissement=etablissement)
+    etablissement = etablissement_ou_404(request)
+    commande = get_object_or_404(
+        Commande.objects.select_related('customer__user'),
+        id=commande_id,
+        etablissements__etablissement=etablissement,
+    )
 
     return render(request, "commande-reçu-detail.html", {"commande": commande,"etablissement": etablissement,})
 
 
 @login_required(login_url='login')
 def etablissement_parametre(request):
-    etablissement = get_object_or_404(Etablissement, user=request.user)
+    etablissement = etablissement_ou_404(request)
 
     if request.method == "POST":
         etablissement.nom = request.POST.get('nom')
@@ -0,0 +1,59 @@
+/*
+ * Saisie semi-automatique des villes.
+ *
+ * <input type="text" data-ville-autocomplete="/villes/autocomplete" data-ville-cible="id_du_champ_cache">
+ * Les suggestions sont chargées à la demande dans une <datalist> ; l'id de la
+ * ville choisie est recopié dans le champ caché (un évènement `input` est
+ * émis pour que v-model suive).
+ */
+(function () {
+    function initialiser(champ) {
+        var cible = document.getElementById(champ.getAttribute('data-ville-cible'));
+        var liste = document.createElement('datalist');
+        var villes = {};
+        var minuterie = null;
+
+        liste.id = champ.id + '-suggestions';
+        champ.setAttribute('list', liste.id);
+        document.body.appendChild(liste);
+
+        function choisir() {
+            var id = villes[champ.value] || '';
+            if (cible.value !== String(id)) {
+                cible.value = id;
+                cible.dispatchEvent(new Event('input'));
+            }
+        }
+
+        function charger() {
+            var saisie = champ.value.trim();
+            if (saisie.length < 2 || villes[champ.value]) {
+                return;
+            }
+            var url = champ.getAttribute('data-ville-autocomplete') + '?q=' + encodeURIComponent(saisie);
+            fetch(url, {headers: {'Accept': 'application/json'}})
+                .then(function (reponse) { return reponse.json(); })
+                .then(function (data) {
+                    liste.innerHTML = '';
+                    data.resultats.forEach(function (ville) {
+                        villes[ville.nom] = ville.id;
+                        var option = document.createElement('option');
+                        option.value = ville.nom;
+                        liste.appendChild(option);
+                    });
+                    choisir();
+                });
+        }
+
+        if (champ.value && cible.value) {
+            villes[champ.value] = cible.value;
+        }
+        champ.addEventListener('input', function () {
+            choisir();
+            clearTimeout(minuterie);
+            minuterie = setTimeout(charger, 150);
+        });
+    }
+
+    document.querySelectorAll('[data-ville-autocomplete]').forEach(initialiser);
+})();
@@ -0,0 +1,7 @@
+$(document).ready(function () {
+    new TomSelect("input.django-tags-input", {
+        persist: false,
+        createOnBlur: true,
+        create: true
+    });
+})
\ No newline at end of file
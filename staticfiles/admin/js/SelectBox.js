@@ -13,7 +13,6 @@
         redisplay: function(id) {
             // Repopulate HTML select box from cache
             const box = document.getElementById(id);
-            const scroll_value_from_top = box.scrollTop;
             box.innerHTML = '';
             for (const node of SelectBox.cache[id]) {
                 if (node.displayed) {
@@ -23,7 +22,6 @@
                     box.appendChild(new_option);
                 }
             }
-            box.scrollTop = scroll_value_from_top;
         },
         filter: function(id, text) {
             // Redisplay the HTML select box, displaying only the choices containing ALL
@@ -33,7 +31,7 @@
                 node.displayed = 1;
                 const node_text = node.text.toLowerCase();
                 for (const token of tokens) {
-                    if (!node_text.includes(token)) {
+                    if (node_text.indexOf(token) === -1) {
                         node.displayed = 0;
                         break; // Once the first token isn't found we're done
                     }
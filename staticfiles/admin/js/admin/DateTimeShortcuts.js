@@ -28,7 +28,8 @@
         timezoneWarningClass: 'timezonewarning', // class of the warning for timezone mismatch
         timezoneOffset: 0,
         init: function() {
-            const serverOffset = document.body.dataset.adminUtcOffset;
+            const body = document.getElementsByTagName('body')[0];
+            const serverOffset = body.dataset.adminUtcOffset;
             if (serverOffset) {
                 const localOffset = new Date().getTimezoneOffset() * -60;
                 DateTimeShortcuts.timezoneOffset = localOffset - serverOffset;
@@ -47,7 +48,8 @@
         },
         // Return the current time while accounting for the server timezone.
         now: function() {
-            const serverOffset = document.body.dataset.adminUtcOffset;
+            const body = document.getElementsByTagName('body')[0];
+            const serverOffset = body.dataset.adminUtcOffset;
             if (serverOffset) {
                 const localNow = new Date();
                 const localOffset = localNow.getTimezoneOffset() * -60;
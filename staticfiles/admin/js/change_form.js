@@ -2,6 +2,7 @@
 {
     const inputTags = ['BUTTON', 'INPUT', 'SELECT', 'TEXTAREA'];
     const modelName = document.getElementById('django-admin-form-add-constants').dataset.modelName;
+
     if (modelName) {
         const form = document.getElementById(modelName + '_form');
         for (const element of form.elements) {
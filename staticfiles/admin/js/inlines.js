@@ -300,7 +300,7 @@
                     dependency_list = input.data('dependency_list') || [],
                     dependencies = [];
                 $.each(dependency_list, function(i, field_name) {
-                    dependencies.push('#' + row.find('.form-row .field-' + field_name).find('input, select, textarea').attr('id'));
+                    dependencies.push('#' + row.find('.django-inline-form .field-' + field_name).find('input, select, textarea').attr('id'));
                 });
                 if (dependencies.length) {
                     input.prepopulate(dependencies, input.attr('maxlength'));
@@ -339,7 +339,7 @@
                 $(selector).stackedFormset(selector, inlineOptions.options);
                 break;
             case "tabular":
-                selector = inlineOptions.name + "-group .tabular.inline-related tbody:first > tr.form-row";
+                selector = inlineOptions.name + "-group .tabular.inline-related tbody:first > tr.django-inline-form";
                 $(selector).tabularFormset(selector, inlineOptions.options);
                 break;
             }
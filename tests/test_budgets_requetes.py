@@ -0,0 +1,198 @@
+# Budgets de requêtes SQL par vue : chaque vue de shop, customer, client,
+# website et contact est appelée sur un jeu de données où chaque liste a
+# plusieurs éléments (catégories, produits, commandes, lignes), de sorte qu'un
+# N+1 fait grossir le nombre de requêtes et dépasse le budget.
+#
+# Un budget ne se relève qu'en connaissance de cause, avec la raison dans le commit.
+
+import datetime
+import json
+from io import BytesIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import models
+from django.urls import reverse
+from PIL import Image
+
+from customer.commandes import passer_commande
+from customer.models import CodePromotionnel, Customer, Panier, ProduitPanier
+from shop.models import CategorieEtablissement, CategorieProduit, Etablissement, Favorite, Produit
+from website.models import SiteInfo
+
+
+@pytest.fixture
+def jeu(db, settings, tmp_path, monkeypatch):
+    from client import recus, views as client_views
+    from website import images
+
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    # Médias, images dérivées et reçus dans un dossier jetable ; le rendu PDF
+    # (Chromium) est remplacé, seul le SQL de la vue compte ici
+    settings.MEDIA_ROOT = tmp_path / "media"
+    (tmp_path / "media" / "site" / "info").mkdir(parents=True)
+    Image.new("RGB", (1200, 800), "red").save(tmp_path / "media" / "site" / "info" / "logo.png")
+    monkeypatch.setattr(images, "DOSSIER", str(tmp_path / "images"))
+    monkeypatch.setattr(recus, "DOSSIER", tmp_path / "recus")
+    monkeypatch.setattr(client_views, "html_en_pdf", lambda html: b"%PDF-1.4 budget")
+    User = get_user_model()
+    aujourdhui = datetime.date.today()
+    SiteInfo.objects.create(**{
+        champ.name: "site@example.com" if isinstance(champ, models.EmailField)
+        else "site/info/%s.png" % champ.name if isinstance(champ, models.FileField) else "CoolDeal"
+        for champ in SiteInfo._meta.concrete_fields
+        if isinstance(champ, (models.CharField, models.TextField, models.FileField))
+    })
+
+    marchands = []
+    for i in range(2):
+        categorie = CategorieEtablissement.objects.create(nom="Catégorie %d" % i, description="d")
+        sous_categories = [
+            CategorieProduit.objects.create(nom="Rayon %d-%d" % (i, j), description="d", categorie=categorie)
+            for j in range(2)
+        ]
+        user = User.objects.create_user(username="marchand%d" % i, password="pwd", last_name="M")
+        etablissement = Etablissement.objects.create(
+            user=user, nom="Boutique %d" % i, description="d", logo="l.png", couverture="c.png",
+            categorie=categorie, nom_du_responsable="N", prenoms_duresponsable="P", adresse="a",
+            pays="p", contact_1="1", email="m%d@e.com" % i,
+        )
+        for j in range(4):
+            promo = j % 2 == 0
+            Produit.objects.create(
+                nom="Produit %d-%d" % (i, j), description="d", description_deal="dd", prix=100 + j,
+                prix_promotionnel=80, quantite=50, super_deal=j == 0,
+                categorie=sous_categories[j % 2], etablissement=etablissement,
+                date_debut_promo=aujourdhui - datetime.timedelta(days=1) if promo else None,
+                date_fin_promo=aujourdhui + datetime.timedelta(days=1) if promo else None,
+            )
+        marchands.append(user)
+
+    produits = list(Produit.objects.order_by("id"))
+    user = User.objects.create_user(username="client", password="pwd", first_name="Élodie", last_name="K",
+                                    email="client@e.com")
+    customer = Customer.objects.create(user=user, adresse="a", contact_1="1", photo="clients/photo/p.png")
+    CodePromotionnel.objects.create(libelle="x", etat=True, date_fin=aujourdhui, reduction=0.1, code_promo="PROMO")
+
+    commandes = []
+    for i in range(3):
+        panier = Panier.objects.create(customer=customer)
+        for produit in (produits[i], produits[4 + i]):
+            ProduitPanier.objects.create(produit=produit, panier=panier, quantite=2)
+        commandes.append(passer_commande(panier.id, customer, transaction_id="T%d" % i))
+    for produit in produits[:3]:
+        Favorite.objects.create(user=user, produit=produit)
+
+    # Panier en cours de l'acheteur, lié à sa session au premier appel
+    panier = Panier.objects.create(customer=customer)
+    lignes = [ProduitPanier.objects.create(produit=p, panier=panier, quantite=1) for p in produits[:3]]
+
+    return {
+        "client": user, "marchand": marchands[0], "staff": User.objects.create_user(
+            username="ops", password="pwd", is_staff=True),
+        "produits": produits, "commandes": commandes, "panier": panier, "lignes": lignes,
+        "categorie": CategorieProduit.objects.order_by("id").first(),
+    }
+
+
+def _json(**donnees):
+    return lambda jeu: json.dumps({cle: valeur(jeu) if callable(valeur) else valeur for cle, valeur in donnees.items()})
+
+
+def _formulaire(**donnees):
+    return lambda jeu: {cle: valeur(jeu) if callable(valeur) else valeur for cle, valeur in donnees.items()}
+
+
+def _photo(jeu):
+    contenu = BytesIO()
+    Image.new("RGB", (64, 64), "blue").save(contenu, "PNG")
+    return SimpleUploadedFile("photo.png", contenu.getvalue(), content_type="image/png")
+
+
+# (vue, utilisateur, méthode, URL, corps JSON ou formulaire, budget)
+CAS = [
+    # website
+    ("index", None, "get", lambda j: reverse("index"), None, 20),
+    ("about", None, "get", lambda j: reverse("about"), None, 17),
+    ("villes_autocomplete", None, "get", lambda j: reverse("villes_autocomplete") + "?q=ab", None, 1),
+    ("image_derivee", None, "get", lambda j: reverse("image_derivee", args=["card", "site/info/logo.png"]), None, 0),
+    # contact
+    ("contact", None, "get", lambda j: reverse("contact"), None, 15),
+    ("post_contact", None, "post", lambda j: reverse("post_contact"),
+     _json(email="visiteur@example.com", sujet="s", messages="m", nom="n"), 1),
+    ("post_newsletter", None, "post", lambda j: reverse("post_newsletter"), _json(email="visiteur@example.com"), 0),
+    # customer
+    ("login", None, "get", lambda j: reverse("login"), None, 15),
+    ("guests_signup", None, "get", lambda j: reverse("guests_signup"), None, 15),
+    ("forgot_password", None, "get", lambda j: reverse("forgot_password"), None, 15),
+    ("request_reset_password", None, "get", lambda j: reverse("request_reset_password"), None, 5),
+    ("reset_password", None, "get", lambda j: reverse("reset_password", args=["inconnu"]), None, 1),
+    ("post", None, "post", lambda j: reverse("post"), _json(username="client", password="pwd"), 10),
+    ("inscription", None, "post", lambda j: reverse("inscription"), _formulaire(
+        nom="N", prenoms="P", username="nouveau", email="nouveau@example.com", phone="1", adresse="a",
+        password="pwd", passwordconf="pwd", file=_photo), 17),
+    ("add_to_cart", "client", "post", lambda j: reverse("add_to_cart"),
+     _json(panier=lambda j: j["panier"].id, produit=lambda j: j["produits"][5].id, quantite=1), 9),
+    ("update_cart", "client", "post", lambda j: reverse("update_cart"),
+     _json(panier=lambda j: j["panier"].id, produit=lambda j: j["produits"][0].id, quantite=3), 9),
+    ("delete_from_cart", "client", "post", lambda j: reverse("delete_from_cart"),
+     _json(panier=lambda j: j["panier"].id, produit_panier=lambda j: j["lignes"][0].id), 5),
+    ("add_coupon", "client", "post", lambda j: reverse("add_coupon"),
+     _json(panier=lambda j: j["panier"].id, coupon="PROMO"), 3),
+    ("deconnexion", "client", "get", lambda j: reverse("deconnexion"), None, 8),
+    # shop
+    ("shop", None, "get", lambda j: reverse("shop"), None, 16),
+    ("product_detail", None, "get", lambda j: reverse("product_detail", args=[j["produits"][0].slug]), None, 19),
+    ("categorie", None, "get", lambda j: reverse("categorie", args=[j["categorie"].slug]), None, 17),
+    ("search", None, "get", lambda j: reverse("search") + "?q=produit", None, 17),
+    ("search_autocomplete", None, "get", lambda j: reverse("search_autocomplete") + "?q=prod", None, 2),
+    ("cart", "client", "get", lambda j: reverse("cart"), None, 11),
+    ("checkout", "client", "get", lambda j: reverse("checkout"), None, 11),
+    ("paiement_success", "client", "get", lambda j: reverse("paiement_success"), None, 12),
+    ("paiement_detail", "client", "post", lambda j: reverse("paiement_detail"),
+     _json(panier=lambda j: j["panier"].id, transaction_id="T-budget", notify_url="n", return_url="r"), 19),
+    ("toggle_favorite", "client", "get", lambda j: reverse("toggle_favorite", args=[j["produits"][6].id]), None, 7),
+    ("dashboard", "marchand", "get", lambda j: reverse("dashboard"), None, 12),
+    ("ajout-article", "marchand", "get", lambda j: reverse("ajout-article"), None, 9),
+    ("article-detail", "marchand", "get", lambda j: reverse("article-detail"), None, 9),
+    ("modifier", "marchand", "get", lambda j: reverse("modifier", args=[j["produits"][0].id]), None, 11),
+    ("supprimer-article", "marchand", "get",
+     lambda j: reverse("supprimer-article", args=[j["produits"][0].id]), None, 8),
+    ("commande-reçu", "marchand", "get", lambda j: reverse("commande-reçu"), None, 10),
+    ("commande-reçu-detail", "marchand", "get",
+     lambda j: reverse("commande-reçu-detail", args=[j["commandes"][0].id]), None, 12),
+    ("commande-reçu-export", "marchand", "get", lambda j: reverse("commande-reçu-export", args=["csv"]), None, 3),
+    ("commandes-export", "staff", "get", lambda j: reverse("commandes-export", args=["csv"]), None, 3),
+    ("etablissement-parametre", "marchand", "get", lambda j: reverse("etablissement-parametre"), None, 8),
+    # client
+    ("profil", "client", "get", lambda j: reverse("profil"), None, 9),
+    ("commande", "client", "get", lambda j: reverse("commande"), None, 10),
+    ("commande-detail", "client", "get",
+     lambda j: reverse("commande-detail", args=[j["commandes"][0].id]), None, 9),
+    ("invoice_pdf", "client", "get", lambda j: reverse("invoice_pdf", args=[j["commandes"][0].id]), None, 10),
+    ("liste-souhait", "client", "get", lambda j: reverse("liste-souhait"), None, 8),
+    ("parametre", "client", "get", lambda j: reverse("parametre"), None, 7),
+]
+
+
+@pytest.mark.parametrize("vue, role, methode, url, corps, budget", CAS, ids=[cas[0] for cas in CAS])
+def test_budget_de_requetes(client, jeu, django_assert_max_num_queries, vue, role, methode, url, corps, budget):
+    if role:
+        client.force_login(jeu[role])
+        # Le panier en cours est celui de la session du test
+        Panier.objects.filter(id=jeu["panier"].id).update(session_id=client.session.session_key)
+    url, corps = url(jeu), corps(jeu) if corps else None
+    cache.clear()
+
+    with django_assert_max_num_queries(budget):
+        if isinstance(corps, dict):
+            response = client.post(url, corps)
+        elif methode == "post":
+            response = client.post(url, corps, content_type="application/json")
+        else:
+            response = client.get(url)
+        if getattr(response, "streaming", False):
+            b"".join(response.streaming_content)
+    assert response.status_code < 500, vue
@@ -0,0 +1,59 @@
+import os
+import threading
+import time
+
+from django.conf import settings
+
+
+# Configuration du site (infos, catégories, galeries, horaires) mémorisée par
+# processus. La version est la date de modification d'un fichier partagé par
+# tous les processus de la machine (workers gunicorn, shell, cron) : un signal
+# le touche à chaque modification et chaque worker recharge sa copie dès qu'il
+# voit la date changer. Le cache Django par défaut (LocMemCache) est propre à
+# chaque processus et ne peut pas porter cette version.
+_verrou = threading.Lock()
+_memoire = (None, {})
+
+
+def _fichier():
+    return str(getattr(settings, 'SITE_CONFIG_VERSION', settings.BASE_DIR / 'cache' / 'site_config.version'))
+
+
+def version():
+    try:
+        return os.stat(_fichier()).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def invalider():
+    fichier = _fichier()
+    os.makedirs(os.path.dirname(fichier), exist_ok=True)
+    # Jamais deux fois la même date, même pour deux modifications dans le même tick d'horloge
+    date = max(time.time_ns(), version() + 1)
+    with open(fichier, 'a'):
+        os.utime(fichier, ns=(date, date))
+    vider()
+
+
+def vider():
+    """Oublie la copie locale du processus courant."""
+    global _memoire
+    _memoire = (None, {})
+
+
+def valeur(nom, charger):
+    """Retourne la valeur `nom`, chargée avec `charger()` au plus une fois par version."""
+    global _memoire
+    courante = version()
+    version_locale, valeurs = _memoire
+    if version_locale == courante and nom in valeurs:
+        return valeurs[nom]
+
+    resultat = charger()
+    with _verrou:
+        version_locale, valeurs = _memoire
+        valeurs = dict(valeurs) if version_locale == courante else {}
+        valeurs[nom] = resultat
+        _memoire = (courante, valeurs)
+    return resultat
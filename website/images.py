@@ -0,0 +1,152 @@
+import hashlib
+import os
+import tempfile
+import threading
+
+from django.conf import settings
+from django.utils._os import safe_join
+from PIL import Image, ImageOps
+
+from base.storage import mode_fichier
+
+
+# Déclinaisons des images téléversées (produits, établissements, galerie) :
+# générées avec Pillow à la première demande puis gardées sur disque dans un
+# cache réparti en sous-dossiers. Le cache est borné en taille ; les fichiers
+# les moins récemment servis sont supprimés en premier.
+TAILLES = {
+    'thumb': 160,
+    'card': 480,
+    'detail': 1024,
+}
+FORMATS = {
+    'webp': ('WEBP', 'image/webp'),
+    'jpeg': ('JPEG', 'image/jpeg'),
+}
+QUALITE = 80
+
+DOSSIER = getattr(settings, 'IMAGES_DERIVEES_DIR', settings.BASE_DIR / 'cache' / 'images')
+TAILLE_MAX = getattr(settings, 'IMAGES_DERIVEES_TAILLE_MAX', 512 * 1024 * 1024)
+
+_verrous = [threading.Lock() for _ in range(64)]
+_ecrits_depuis_eviction = 0
+
+
+class ImageIntrouvable(Exception):
+    """Original absent, illisible ou hors de MEDIA_ROOT."""
+
+
+def original(chemin):
+    try:
+        chemin = safe_join(settings.MEDIA_ROOT, chemin)
+    except Exception:
+        raise ImageIntrouvable(chemin)
+    if not os.path.isfile(chemin):
+        raise ImageIntrouvable(chemin)
+    return chemin
+
+
+def cle(chemin, taille, format):
+    """Empreinte de la déclinaison : change si l'original est remplacé."""
+    etat = os.stat(original(chemin))
+    valeur = '%s|%s|%s|%s|%s|%s' % (chemin, etat.st_mtime_ns, etat.st_size, taille, format, QUALITE)
+    return hashlib.sha256(valeur.encode()).hexdigest()[:32]
+
+
+def chemin_cache(empreinte, format):
+    return os.path.join(DOSSIER, empreinte[:2], empreinte[2:4], '%s.%s' % (empreinte, format))
+
+
+def generer(source, taille, format):
+    largeur = TAILLES[taille]
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((largeur, largeur * 4), Image.LANCZOS)
+        if format == 'jpeg' and image.mode not in ('RGB', 'L'):
+            fond = Image.new('RGB', image.size, (255, 255, 255))
+            fond.paste(image, mask=image.convert('RGBA').split()[-1])
+            image = fond
+        elif image.mode not in ('RGB', 'RGBA', 'L'):
+            image = image.convert('RGBA')
+        fichier = tempfile.NamedTemporaryFile(dir=DOSSIER, suffix='.tmp', delete=False)
+        try:
+            with fichier:
+                image.save(fichier, FORMATS[format][0], quality=QUALITE, optimize=True)
+        except Exception:
+            os.remove(fichier.name)
+            raise
+    os.chmod(fichier.name, mode_fichier())
+    return fichier.name
+
+
+def derivee(chemin, taille, format):
+    """Retourne (chemin du fichier en cache, empreinte), en le générant si besoin."""
+    if taille not in TAILLES or format not in FORMATS:
+        raise ImageIntrouvable(chemin)
+    try:
+        empreinte = cle(chemin, taille, format)
+    except OSError:
+        raise ImageIntrouvable(chemin)
+    destination = chemin_cache(empreinte, format)
+
+    if os.path.exists(destination):
+        try:
+            os.utime(destination)  # récence pour l'éviction LRU
+        except OSError:
+            pass
+        return destination, empreinte
+
+    with _verrous[int(empreinte[:4], 16) % len(_verrous)]:
+        if not os.path.exists(destination):
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            try:
+                temporaire = generer(original(chemin), taille, format)
+            except (OSError, ValueError, Image.DecompressionBombError):
+                raise ImageIntrouvable(chemin)
+            os.replace(temporaire, destination)
+            _apres_ecriture(os.path.getsize(destination))
+    return destination, empreinte
+
+
+def _apres_ecriture(taille):
+    # L'éviction parcourt tout le cache : on ne la lance qu'après avoir écrit
+    # l'équivalent d'un vingtième de la taille maximale.
+    global _ecrits_depuis_eviction
+    _ecrits_depuis_eviction += taille
+    if _ecrits_depuis_eviction >= TAILLE_MAX // 20:
+        _ecrits_depuis_eviction = 0
+        evincer()
+
+
+def evincer(taille_max=TAILLE_MAX):
+    """Supprime les déclinaisons les moins récemment servies au-delà de `taille_max`.
+
+    Retourne (nombre de fichiers supprimés, octets libérés).
+    """
+    fichiers = []
+    for racine, _, noms in os.walk(DOSSIER):
+        for nom in noms:
+            chemin = os.path.join(racine, nom)
+            try:
+                etat = os.stat(chemin)
+            except OSError:
+                continue
+            fichiers.append((etat.st_mtime, etat.st_size, chemin))
+
+    total = sum(taille for _, taille, _ in fichiers)
+    supprimes = liberes = 0
+    for _, taille, chemin in sorted(fichiers):
+        if total <= taille_max:
+            break
+        try:
+            os.remove(chemin)
+        except OSError:
+            continue
+        total -= taille
+        supprimes += 1
+        liberes += taille
+    return supprimes, liberes
+
+
+def format_accepte(accept):
+    return 'webp' if 'image/webp' in (accept or '') else 'jpeg'
@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.template.defaultfilters import filesizeformat
+
+from website import recompression
+
+
+class Command(BaseCommand):
+    help = ("Recompresse les images JPEG/PNG de MEDIA_ROOT (métadonnées retirées, noms inchangés sauf pour "
+            "les fichiers rangés par empreinte, renommés d'après leur nouveau contenu). "
+            "Seuls les fichiers nouveaux ou modifiés depuis le dernier passage sont traités.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('dossiers', nargs='*', help="Sous-dossiers de MEDIA_ROOT (tout MEDIA_ROOT par défaut)")
+        parser.add_argument('--workers', type=int, default=None, help="Processus en parallèle (un par cœur par défaut)")
+        parser.add_argument('--qualite', type=int, default=recompression.QUALITE)
+        parser.add_argument('--webp', action='store_true', help="Écrire aussi une copie WebP à côté de chaque image")
+        parser.add_argument('--essai', action='store_true', help="Mesurer le gain sans rien écrire")
+        parser.add_argument('--forcer', action='store_true', help="Ignorer le manifeste et tout retraiter")
+
+    def handle(self, *args, **options):
+        bilan = recompression.recompresser_tout(
+            str(settings.MEDIA_ROOT),
+            dossiers=options['dossiers'] or None,
+            workers=options['workers'],
+            qualite=options['qualite'],
+            webp=options['webp'],
+            essai=options['essai'],
+            forcer=options['forcer'],
+        )
+
+        for chemin, erreur in bilan['erreurs']:
+            self.stderr.write(f"{chemin} : {erreur}")
+        gain = bilan['avant'] - bilan['apres']
+        self.stdout.write(
+            f"{bilan['traites']} images traitées, {bilan['ignores']} déjà à jour, {len(bilan['erreurs'])} en erreur."
+        )
+        if bilan['webp']:
+            self.stdout.write(f"Copies WebP : {filesizeformat(bilan['webp'])}.")
+        message = f"{filesizeformat(gain)} économisés ({filesizeformat(bilan['avant'])} → {filesizeformat(bilan['apres'])})"
+        self.stdout.write(self.style.SUCCESS(message + (" [essai]" if options['essai'] else "") + "."))
@@ -0,0 +1,200 @@
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageOps
+
+from base import storage
+
+
+# Recompression en place des images téléversées. Les fichiers gardent leur nom
+# (les modèles ne changent pas) ; un manifeste d'empreintes permet de ne
+# retraiter que les nouveaux fichiers ou ceux qui ont été remplacés.
+#
+# Exception : les fichiers rangés par empreinte (cas/, base.storage) ne sont
+# jamais réécrits sur place, leur nom devant rester celui de leur contenu. La
+# version recompressée est écrite sous sa propre empreinte, puis les champs des
+# modèles et les compteurs FichierMedia sont reportés sur elle.
+EXTENSIONS = {'.jpg': 'JPEG', '.jpeg': 'JPEG', '.png': 'PNG'}
+MANIFESTE = '.recompression.json'
+QUALITE = 82
+
+
+def empreinte(chemin):
+    sha = hashlib.sha256()
+    with open(chemin, 'rb') as f:
+        for bloc in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(bloc)
+    return sha.hexdigest()
+
+
+def lister(racine, dossiers=None):
+    """Chemins relatifs des images JPEG/PNG sous `racine` (ou sous ses `dossiers`)."""
+    departs = [os.path.join(racine, d) for d in dossiers] if dossiers else [racine]
+    for depart in departs:
+        for dossier, _, noms in os.walk(depart):
+            for nom in sorted(noms):
+                if os.path.splitext(nom)[1].lower() in EXTENSIONS:
+                    yield os.path.relpath(os.path.join(dossier, nom), racine)
+
+
+def charger_manifeste(chemin):
+    try:
+        with open(chemin) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def enregistrer_manifeste(chemin, manifeste):
+    dossier = os.path.dirname(chemin)
+    with tempfile.NamedTemporaryFile('w', dir=dossier, suffix='.tmp', delete=False) as f:
+        json.dump(manifeste, f, indent=0, sort_keys=True)
+    os.replace(f.name, chemin)
+
+
+def a_traiter(racine, relatif, manifeste, webp=False):
+    """Vrai si le fichier n'est pas dans le manifeste tel qu'il est aujourd'hui sur le disque."""
+    entree = manifeste.get(relatif)
+    if not entree or (webp and not os.path.exists(os.path.join(racine, relatif) + '.webp')):
+        return True
+    etat = os.stat(os.path.join(racine, relatif))
+    if (etat.st_size, etat.st_mtime_ns) == (entree.get('taille'), entree.get('mtime')):
+        return False
+    return empreinte(os.path.join(racine, relatif)) != entree.get('sha256')
+
+
+def _ecrire(image, dossier, format, mode, **options):
+    fichier = tempfile.NamedTemporaryFile(dir=dossier, suffix='.tmp', delete=False)
+    try:
+        with fichier:
+            image.save(fichier, format, **options)
+    except Exception:
+        os.remove(fichier.name)
+        raise
+    # Le temporaire est en 0600 : il prend le mode du fichier qu'il remplace
+    os.chmod(fichier.name, mode)
+    return fichier.name
+
+
+def recompresser(racine, relatif, qualite=QUALITE, webp=False, essai=False):
+    """Recompresse un fichier ; exécuté dans un processus du pool.
+
+    Retourne un dict : chemin, octets avant/après, octets WebP, entrée de manifeste ou erreur.
+    """
+    chemin = os.path.join(racine, relatif)
+    avant = os.path.getsize(chemin)
+    resultat = {'chemin': relatif, 'avant': avant, 'apres': avant, 'webp': 0}
+    format = EXTENSIONS[os.path.splitext(relatif)[1].lower()]
+    try:
+        with Image.open(chemin) as source:
+            if getattr(source, 'is_animated', False):
+                image = None
+            else:
+                # L'orientation EXIF est appliquée aux pixels avant de retirer les métadonnées
+                image = ImageOps.exif_transpose(source)
+                image.load()
+            icc = source.info.get('icc_profile')
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        resultat['erreur'] = str(e)
+        return resultat
+
+    dossier = os.path.dirname(chemin)
+    mode = os.stat(chemin).st_mode & 0o777
+    if image is not None:
+        if format == 'JPEG':
+            if image.mode not in ('RGB', 'L', 'CMYK'):
+                image = image.convert('RGB')
+            temporaire = _ecrire(image, dossier, 'JPEG', mode, quality=qualite, optimize=True, progressive=True,
+                                 icc_profile=icc)
+        else:
+            temporaire = _ecrire(image, dossier, 'PNG', mode, optimize=True, icc_profile=icc)
+
+        apres = os.path.getsize(temporaire)
+        if apres < avant and not essai:
+            if storage.est_adresse(relatif.replace(os.sep, '/')):
+                # Nouveau nom d'après le nouveau contenu ; l'ancien reste en place
+                # jusqu'au report des champs (remplacer_adresses)
+                nouveau = storage.StockageDeduplique().nom_pour(empreinte(temporaire), relatif)
+                chemin = os.path.join(racine, nouveau)
+                os.makedirs(os.path.dirname(chemin), exist_ok=True)
+                resultat['nouveau'] = nouveau
+            os.replace(temporaire, chemin)
+            resultat['apres'] = apres
+        else:
+            os.remove(temporaire)
+            if essai:
+                resultat['apres'] = min(apres, avant)
+
+        if webp:
+            sibling = chemin + '.webp'
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'PA') else 'RGB')
+            temporaire = _ecrire(image, dossier, 'WEBP', mode, quality=qualite, method=6)
+            resultat['webp'] = os.path.getsize(temporaire)
+            if essai:
+                os.remove(temporaire)
+            else:
+                os.replace(temporaire, sibling)
+
+    if not essai:
+        etat = os.stat(chemin)
+        resultat['manifeste'] = {'sha256': empreinte(chemin), 'taille': etat.st_size, 'mtime': etat.st_mtime_ns}
+    return resultat
+
+
+def remplacer_adresses(racine, ancien, nouveau):
+    """Reporte sur `nouveau` les champs et références de l'image par empreinte `ancien`, qui est effacée."""
+    storage.remplacer(ancien, nouveau, os.path.getsize(os.path.join(racine, nouveau)))
+    try:
+        os.remove(os.path.join(racine, ancien) + '.webp')
+    except OSError:
+        pass
+
+
+def _recompresser(arguments):
+    return recompresser(*arguments)
+
+
+def recompresser_tout(racine, dossiers=None, workers=None, qualite=QUALITE, webp=False, essai=False, forcer=False):
+    """Recompresse les images nouvelles ou modifiées de `racine` avec un pool de processus.
+
+    Retourne le bilan : fichiers traités, ignorés, en erreur, octets avant/après et WebP.
+    """
+    chemin_manifeste = os.path.join(racine, MANIFESTE)
+    manifeste = {} if forcer else charger_manifeste(chemin_manifeste)
+    fichiers = list(lister(racine, dossiers))
+    travail = [f for f in fichiers if forcer or a_traiter(racine, f, manifeste, webp)]
+
+    bilan = {'traites': 0, 'ignores': len(fichiers) - len(travail), 'erreurs': [], 'avant': 0, 'apres': 0, 'webp': 0,
+             'remplaces': 0}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        arguments = [(racine, f, qualite, webp, essai) for f in travail]
+        for i, resultat in enumerate(pool.map(_recompresser, arguments, chunksize=8), 1):
+            if 'erreur' in resultat:
+                bilan['erreurs'].append((resultat['chemin'], resultat['erreur']))
+                continue
+            bilan['traites'] += 1
+            bilan['avant'] += resultat['avant']
+            bilan['apres'] += resultat['apres']
+            bilan['webp'] += resultat['webp']
+            if 'nouveau' in resultat:
+                remplacer_adresses(racine, resultat['chemin'], resultat['nouveau'])
+                bilan['remplaces'] += 1
+                manifeste.pop(resultat['chemin'], None)
+                manifeste[resultat['nouveau']] = resultat['manifeste']
+            elif 'manifeste' in resultat:
+                manifeste[resultat['chemin']] = resultat['manifeste']
+            if not essai and i % 200 == 0:
+                # Un arrêt en cours de route ne fait pas perdre le travail déjà fait
+                enregistrer_manifeste(chemin_manifeste, manifeste)
+
+    if not essai:
+        enregistrer_manifeste(chemin_manifeste, manifeste)
+    if bilan['remplaces']:
+        # Champs réécrits par UPDATE, sans signal : la configuration du site en mémoire est périmée
+        from . import cache
+        cache.invalider()
+    return bilan
@@ -0,0 +1,17 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from shop.models import CategorieEtablissement, CategorieProduit
+from . import cache
+from .models import Galerie, Horaire, SiteInfo
+
+
+# Toute modification de la configuration du site invalide le cache des context processors
+def invalider_configuration(sender, **kwargs):
+    cache.vider()
+    transaction.on_commit(cache.invalider)
+
+
+for modele in (SiteInfo, Galerie, Horaire, CategorieEtablissement, CategorieProduit):
+    post_save.connect(invalider_configuration, sender=modele, dispatch_uid='site_config_%s' % modele.__name__)
+    post_delete.connect(invalider_configuration, sender=modele, dispatch_uid='site_config_%s_delete' % modele.__name__)
@@ -0,0 +1,32 @@
+from django import template
+from django.urls import reverse
+from django.utils.html import format_html
+
+from website.images import TAILLES
+
+
+register = template.Library()
+
+
+def _url(fichier, taille):
+    return reverse('image_derivee', args=[taille, fichier.name])
+
+
+@register.filter
+def derivee(fichier, taille):
+    """URL de la déclinaison `taille` d'une image téléversée : {{ produit.image|derivee:'thumb' }}"""
+    if not fichier:
+        return ''
+    return _url(fichier, taille)
+
+
+@register.simple_tag
+def srcset(fichier, taille='card', sizes=None):
+    """Attributs src, srcset et sizes d'un <img> : <img {% srcset produit.image 'card' %} alt="...">"""
+    if not fichier:
+        return ''
+    candidats = ', '.join('%s %sw' % (_url(fichier, nom), largeur) for nom, largeur in TAILLES.items())
+    return format_html(
+        'src="{}" srcset="{}" sizes="{}"',
+        _url(fichier, taille), candidats, sizes or '(max-width: %dpx) 100vw, %dpx' % (TAILLES[taille], TAILLES[taille]),
+    )
@@ -36,3 +36,228 @@ def test_siteinfo_str_uses_title():
     )
 
     assert str(info) == "Vectal"
+
+
+def _session_request(rf):
+    from django.contrib.auth.models import AnonymousUser
+    from django.contrib.sessions.backends.db import SessionStore
+
+    request = rf.get('/')
+    request.session = SessionStore()
+    request.user = AnonymousUser()
+    return request
+
+
+@pytest.mark.django_db
+def test_cart_context_processor_is_lazy(rf, django_assert_num_queries):
+    from website.context_processors import cart
+
+    request = _session_request(rf)
+    with django_assert_num_queries(0):
+        context = cart(request)
+
+    assert context['cart'].id is not None
+    assert request.session.session_key is not None
+
+
+@pytest.mark.django_db
+def test_cart_resolution_reuses_cached_cart_id(rf, django_assert_num_queries):
+    from django.core.cache import cache
+    from customer.cart import invalidate_cart, resolve_cart, cart_cache_key
+
+    request = _session_request(rf)
+    panier = resolve_cart(request)
+
+    with django_assert_num_queries(1):
+        assert resolve_cart(request).id == panier.id
+
+    invalidate_cart(panier)
+    assert cache.get(cart_cache_key(request.session.session_key)) is None
+    assert resolve_cart(request).id == panier.id
+
+
+@pytest.mark.django_db
+def test_cart_resolution_without_session_does_not_probe_a_null_key(rf):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from customer.cart import resolve_cart
+
+    request = _session_request(rf)
+    with CaptureQueriesContext(connection) as queries:
+        panier = resolve_cart(request)
+
+    assert panier.session_id_id == request.session.session_key
+    assert not [q for q in queries.captured_queries if 'IS NULL' in q['sql']]
+
+
+@pytest.mark.django_db
+def test_site_configuration_is_cached_until_modified(rf, django_assert_num_queries, settings, tmp_path):
+    import os
+    from website import cache
+    from website.context_processors import categories, galeries, horaires, site_infos
+    from website.models import Horaire
+
+    settings.SITE_CONFIG_VERSION = tmp_path / 'site_config.version'
+    request = rf.get('/')
+    cache.invalider()
+    Horaire.objects.create(titre="Lundi", description="8h-18h", status=True)
+    for processor in (categories, galeries, horaires, site_infos):
+        processor(request)
+
+    with django_assert_num_queries(0):
+        assert [h.titre for h in horaires(request)['horaires']] == ["Lundi"]
+        categories(request), galeries(request), site_infos(request)
+
+    Horaire.objects.create(titre="Mardi", description="8h-18h", status=True)
+    assert [h.titre for h in horaires(request)['horaires']] == ["Lundi", "Mardi"]
+
+    # Modification faite par un autre processus : seul le fichier de version change
+    Horaire.objects.filter(titre="Mardi").update(titre="Mercredi")
+    date = cache.version() + 1
+    os.utime(settings.SITE_CONFIG_VERSION, ns=(date, date))
+    assert [h.titre for h in horaires(request)['horaires']] == ["Lundi", "Mercredi"]
+
+
+@pytest.mark.django_db
+def test_villes_autocomplete_uses_the_process_trie(client, django_assert_num_queries):
+    from cities_light.models import City, Country
+    from django.urls import reverse
+
+    from website import villes
+
+    pays = Country.objects.create(name="Côte d'Ivoire", code2="CI", code3="CIV")
+    abidjan = City.objects.create(name="Abidjan", country=pays, population=5000000)
+    City.objects.create(name="Abengourou", country=pays, population=100000)
+    bassam = City.objects.create(name="Grand-Bassam", country=pays, population=80000)
+    villes.reinitialiser()
+
+    assert [v.name for v in villes.chercher("ab")] == ["Abidjan", "Abengourou"]
+    assert villes.chercher("bass") == [(bassam.id, "Grand-Bassam")]
+    assert villes.chercher("ÂBI") == [(abidjan.id, "Abidjan")]
+    assert villes.chercher("") == [] and villes.chercher("zz") == []
+
+    with django_assert_num_queries(0):
+        response = client.get(reverse('villes_autocomplete'), {'q': 'abid'})
+    assert response.json()['resultats'] == [{'id': abidjan.id, 'nom': "Abidjan"}]
+    villes.reinitialiser()
+
+
+@pytest.mark.django_db
+def test_image_derivee_is_resized_cached_and_revalidated(client, settings, tmp_path, monkeypatch):
+    import os
+    from io import BytesIO
+
+    from django.template import Context, Template
+    from PIL import Image
+
+    from website import images
+
+    settings.MEDIA_ROOT = tmp_path / "media"
+    (tmp_path / "media" / "produis").mkdir(parents=True)
+    Image.new("RGBA", (2000, 1500), (200, 30, 30, 255)).save(tmp_path / "media" / "produis" / "deal.png")
+    monkeypatch.setattr(images, "DOSSIER", str(tmp_path / "cache"))
+
+    url = "/img/card/produis/deal.png"
+    response = client.get(url, HTTP_ACCEPT="image/webp,*/*")
+    assert response["Content-Type"] == "image/webp" and response["Vary"] == "Accept"
+    assert "max-age" in response["Cache-Control"]
+    assert Image.open(BytesIO(b"".join(response.streaming_content))).size == (480, 360)
+
+    jpeg = client.get(url, {"format": "jpeg"})
+    assert jpeg["Content-Type"] == "image/jpeg"
+    assert client.get(url, {"format": "jpeg"}, HTTP_IF_NONE_MATCH=jpeg["ETag"]).status_code == 304
+    assert len(list((tmp_path / "cache").rglob("*.*"))) == 2
+    umask = os.umask(0)
+    os.umask(umask)
+    assert {f.stat().st_mode & 0o777 for f in (tmp_path / "cache").rglob("*.*")} == {0o666 & ~umask}
+
+    assert client.get("/img/card/../settings.py").status_code == 404
+    assert client.get("/img/geant/produis/deal.png").status_code == 404
+
+    assert images.evincer(taille_max=0)[0] == 2
+
+    class Fichier:
+        name = "produis/deal.png"
+
+    html = Template("{% load derivees %}<img {% srcset f 'card' %}>").render(Context({"f": Fichier()}))
+    assert 'src="/img/card/produis/deal.png"' in html and "/img/detail/produis/deal.png 1024w" in html
+
+
+def test_recompresser_medias_shrinks_once_and_skips_on_rerun(settings, tmp_path):
+    import json
+    import random
+    from io import StringIO
+
+    from django.core.management import call_command
+    from PIL import Image
+
+    settings.MEDIA_ROOT = tmp_path
+    (tmp_path / "produis").mkdir()
+    random.seed(1)
+    photo = Image.frombytes("RGB", (400, 300), bytes(random.randrange(256) for _ in range(400 * 300 * 3)))
+    exif = Image.Exif()
+    exif[0x0112] = 6  # orientation : pivotée de 90°
+    photo.save(tmp_path / "produis" / "photo.jpg", quality=100, exif=exif)
+    Image.new("RGB", (64, 64), "red").save(tmp_path / "logo.png")
+    (tmp_path / "notes.txt").write_text("pas une image")
+    avant = (tmp_path / "produis" / "photo.jpg").stat().st_size
+    (tmp_path / "produis" / "photo.jpg").chmod(0o644)
+
+    sortie = StringIO()
+    call_command("recompresser_medias", workers=2, webp=True, stdout=sortie)
+    assert "2 images traitées, 0 déjà à jour" in sortie.getvalue()
+    with Image.open(tmp_path / "produis" / "photo.jpg") as image:
+        assert image.size == (300, 400) and not image.getexif()
+    assert (tmp_path / "produis" / "photo.jpg").stat().st_size < avant
+    assert (tmp_path / "produis" / "photo.jpg").stat().st_mode & 0o777 == 0o644
+    assert (tmp_path / "produis" / "photo.jpg.webp").exists()
+    assert set(json.loads((tmp_path / ".recompression.json").read_text())) == {"produis/photo.jpg", "logo.png"}
+
+    Image.new("RGB", (64, 64), "blue").save(tmp_path / "produis" / "nouvelle.png")
+    sortie = StringIO()
+    call_command("recompresser_medias", "produis", workers=2, stdout=sortie)
+    assert "1 images traitées, 1 déjà à jour" in sortie.getvalue()
+
+
+@pytest.mark.django_db
+def test_recompresser_medias_restores_content_addressed_files(settings, tmp_path, django_capture_on_commit_callbacks):
+    import random
+    from io import BytesIO, StringIO
+
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from django.core.management import call_command
+    from PIL import Image
+
+    from base.models import FichierMedia
+    from shop.tests import _catalogue
+
+    settings.MEDIA_ROOT = tmp_path
+    random.seed(2)
+    contenu = BytesIO()
+    Image.frombytes("RGB", (200, 150), bytes(random.randrange(256) for _ in range(200 * 150 * 3))).save(
+        contenu, "JPEG", quality=100)
+    _, (produit, autre) = _catalogue("recompression", 2)
+    with django_capture_on_commit_callbacks(execute=True):
+        for p in (produit, autre):
+            p.image = SimpleUploadedFile("photo.jpg", contenu.getvalue())
+            p.save()
+    ancien = produit.image.name
+    (tmp_path / ancien).chmod(0o644)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("recompresser_medias", workers=2, webp=True, stdout=StringIO())
+
+    produit.refresh_from_db()
+    autre.refresh_from_db()
+    nouveau = produit.image.name
+    # Le fichier par empreinte n'est pas réécrit sur place : son nom suit son nouveau contenu
+    assert nouveau != ancien and nouveau.startswith("cas/") and autre.image.name == nouveau
+    assert not (tmp_path / ancien).exists() and (tmp_path / (nouveau + ".webp")).exists()
+    fichier = FichierMedia.objects.get()
+    assert (fichier.nom, fichier.references) == (nouveau, 2)
+    assert fichier.taille == (tmp_path / nouveau).stat().st_size < len(contenu.getvalue())
+    assert (tmp_path / nouveau).stat().st_mode & 0o777 == 0o644
+
+    sortie = StringIO()
+    call_command("recompresser_medias", workers=2, webp=True, stdout=sortie)
+    assert "0 images traitées, 1 déjà à jour" in sortie.getvalue()
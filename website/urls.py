@@ -5,4 +5,6 @@ from . import views
 urlpatterns = [
     path('', views.index, name='index'),
     path('a-propos', views.about, name='about'),
+    path('villes/autocomplete', views.villes_autocomplete, name='villes_autocomplete'),
+    path('img/<str:taille>/<path:chemin>', views.image_derivee, name='image_derivee'),
 ]
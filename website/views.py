@@ -1,5 +1,9 @@
 from django.shortcuts import render
+from django.http import FileResponse, Http404, JsonResponse
+from django.views.decorators.http import condition
 from . import models
+from . import villes
+from . import images
 from shop import models as shop_models
 
 
@@ -29,4 +33,39 @@ def about(request):
         'why_choose': why_choose,
 
     }
-    return render(request, 'about-us.html', datas)
\ No newline at end of file
+    return render(request, 'about-us.html', datas)
+
+
+def villes_autocomplete(request):
+    query = request.GET.get('q', '')
+    data = {
+        'resultats': [{'id': ville.id, 'nom': ville.name} for ville in villes.chercher(query)],
+    }
+    return JsonResponse(data, safe=False)
+
+
+def _format_image(request):
+    format = request.GET.get('format')
+    return format if format in images.FORMATS else images.format_accepte(request.headers.get('Accept'))
+
+
+def _etag_image(request, taille, chemin):
+    try:
+        return images.cle(chemin, taille, _format_image(request))
+    except (images.ImageIntrouvable, OSError):
+        return None
+
+
+@condition(etag_func=_etag_image)
+def image_derivee(request, taille, chemin):
+    format = _format_image(request)
+    try:
+        fichier, _ = images.derivee(chemin, taille, format)
+    except images.ImageIntrouvable:
+        raise Http404("Image introuvable")
+
+    response = FileResponse(open(fichier, 'rb'), content_type=images.FORMATS[format][1])
+    response['Cache-Control'] = 'public, max-age=2592000'
+    if 'format' not in request.GET:
+        response['Vary'] = 'Accept'
+    return response
@@ -0,0 +1,81 @@
+import threading
+import unicodedata
+from collections import namedtuple
+
+from cities_light.models import City
+from django.db.models import F
+
+
+# Index des villes en mémoire, construit une seule fois par processus :
+# un trie des préfixes normalisés (sans accents, en minuscules) de chaque mot
+# du nom. Chaque nœud garde directement ses premières correspondances, les
+# plus peuplées d'abord, donc une recherche coûte O(longueur du préfixe).
+Ville = namedtuple('Ville', ['id', 'name'])
+
+RESULTATS_PAR_NOEUD = 10
+
+_verrou = threading.Lock()
+_index = None
+
+
+def normaliser(texte):
+    texte = unicodedata.normalize('NFKD', texte or '')
+    return ''.join(c for c in texte if not unicodedata.combining(c)).lower().strip()
+
+
+class TrieVilles:
+
+    def __init__(self):
+        self.racine = {}
+        self.villes = []
+
+    def ajouter(self, ville):
+        self.villes.append(ville)
+        nom = normaliser(ville.name)
+        debuts = {0} | {i + 1 for i, c in enumerate(nom) if c in ' -\''}
+        for debut in debuts:
+            noeud = self.racine
+            for caractere in nom[debut:]:
+                noeud = noeud.setdefault(caractere, {})
+                resultats = noeud.setdefault(None, [])
+                if len(resultats) < RESULTATS_PAR_NOEUD and ville not in resultats:
+                    resultats.append(ville)
+
+    def chercher(self, prefixe, limite=RESULTATS_PAR_NOEUD):
+        noeud = self.racine
+        for caractere in normaliser(prefixe):
+            noeud = noeud.get(caractere)
+            if noeud is None:
+                return []
+        return noeud.get(None, [])[:limite]
+
+
+def construire():
+    trie = TrieVilles()
+    for id, name in City.objects.order_by(F('population').desc(nulls_last=True), 'name').values_list('id', 'name').iterator():
+        trie.ajouter(Ville(id, name))
+    return trie
+
+
+def index():
+    global _index
+    if _index is None:
+        with _verrou:
+            if _index is None:
+                _index = construire()
+    return _index
+
+
+def reinitialiser():
+    global _index
+    _index = None
+
+
+def chercher(prefixe, limite=RESULTATS_PAR_NOEUD):
+    if not normaliser(prefixe):
+        return []
+    return index().chercher(prefixe, limite)
+
+
+def toutes():
+    return index().villes